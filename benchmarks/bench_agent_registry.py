@@ -0,0 +1,80 @@
+"""
+İstek başına LLM ve ajan oluşturma ile AgentRegistry (paylaşılan LLM ve ajan
+tanımları, istek başına Agent nesneleri) arasındaki gecikme farkını yerel bir
+sahte (stub) LLM ile ölçer. Ağ erişimi gerekmez.
+
+Kullanım: python -m benchmarks.bench_agent_registry [--requests 50] [--kickoff]
+"""
+import argparse
+import statistics
+import time
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from tools.agent_registry import AgentRegistry, build_agent, load_agent_definitions
+
+# Sahte LLM'in her çağrıda döndürdüğü, CrewAI'ın ayrıştırabildiği yanıt
+STUB_RESPONSE = "Thought: I now can give a great answer\nFinal Answer: Sahte koç analizi."
+
+# Örnek oyuncu istatistikleri
+SAMPLE_STATS = {
+    'total_matches': 10, 'win_rate': 50, 'kills': 40, 'kills_per_match': 4,
+    'deaths': 5, 'kd_ratio': 8, 'avg_damage': 500
+}
+
+def stub_llm():
+    """
+    Ağa çıkmayan sahte sohbet modeli
+    """
+    return FakeListChatModel(responses=[STUB_RESPONSE])
+
+def per_request_agents():
+    """
+    Eski yol: her istekte yeni LLM ve ajanlar
+    """
+    llm = stub_llm()
+    return {key: build_agent(definition, llm)
+            for key, definition in load_agent_definitions().items()}
+
+def run_request(get_agents, kickoff):
+    """
+    Tek bir isteği çalıştırır ve süresini saniye cinsinden döndürür
+    """
+    start = time.perf_counter()
+    agents = get_agents()
+    if kickoff:
+        from crewai import Crew, Process
+
+        from main import create_tasks
+
+        tasks = create_tasks(agents, SAMPLE_STATS, "Agresif")
+        Crew(agents=list(agents.values()), tasks=tasks, process=Process.sequential).kickoff()
+    return time.perf_counter() - start
+
+def summarize(name, samples):
+    """
+    Ölçüm özetini yazdırır
+    """
+    ms = sorted(s * 1000 for s in samples)
+    print(f"{name:<22} ortalama {statistics.mean(ms):8.2f} ms   "
+          f"p50 {ms[len(ms) // 2]:8.2f} ms   p99 {ms[min(len(ms) - 1, int(len(ms) * 0.99))]:8.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--kickoff', action='store_true', help="Crew.kickoff() süresini de ölç")
+    args = parser.parse_args()
+
+    registry = AgentRegistry(stub_llm)
+    registry.get_agents()  # ilk oluşturma ölçüme dahil edilmez
+
+    old = [run_request(per_request_agents, args.kickoff) for _ in range(args.requests)]
+    new = [run_request(registry.get_agents, args.kickoff) for _ in range(args.requests)]
+
+    summarize("İstek başına oluşturma", old)
+    summarize("Paylaşılan registry", new)
+    saving = statistics.mean(old) - statistics.mean(new)
+    print(f"İstek başına kazanç: {saving * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
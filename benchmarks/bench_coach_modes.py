@@ -0,0 +1,104 @@
+"""
+İki görevli (analist + koç, ardışık) ve tek geçişli koç modlarının uçtan uca
+gecikmesini sahte OpenAI sunucusuna karşı ölçer. Tek geçişli yanıt, arayüzün
+beklediği iki bölüme ayrılabildiği doğrulanarak ölçülür.
+
+--mode crew ile gerçek CrewAI hattı (tools.coach_crew.run_coach_crew) kullanılır; bunun
+için crewai ve langchain-openai kurulu olmalıdır.
+
+Kullanım: python -m benchmarks.bench_coach_modes [--runs 20] [--latency 0.4] [--token-latency 0.01] [--mode http|crew]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.bench_coach_scheduler import chat
+from benchmarks.mock_openai_server import start_server
+from tools.coach_result import SECTION_HEADINGS, split_sections
+from tools.token_stream import visible_text
+
+STATS_SUMMARY = "Toplam maç: 42, Kazanma oranı: 48.20%, K/D: 2.10, Öldürme: 63, Hasar: 245.00"
+
+def http_two_pass(base_url, timeout):
+    """
+    Analist ve koç görevlerini ardışık iki istekle taklit eder
+    """
+    analysis = chat(base_url, f"Oyuncunun PUBG verilerini analiz et. {STATS_SUMMARY}", timeout)
+    coaching = chat(base_url, f"Oyun stratejileri öner. {STATS_SUMMARY}\nAnaliz: {analysis}", timeout)
+    return [visible_text(analysis), visible_text(coaching)]
+
+def http_single_pass(base_url, timeout):
+    """
+    Her iki bölümü tek istekte üretir ve başlıklara göre ayırır
+    """
+    analysis_heading, coaching_heading = SECTION_HEADINGS
+    reply = chat(base_url, f"Oyuncunun PUBG verilerini analiz et ve strateji öner. {STATS_SUMMARY}. "
+                           f"'### {analysis_heading}' ve '### {coaching_heading}' başlıklarını kullan.", timeout)
+    return split_sections(visible_text(reply))
+
+def crew_runner(base_url, single_pass):
+    """
+    Gerçek CrewAI hattını sahte sunucuya yönlendirir
+    """
+    os.environ['OPENAI_BASE_URL'] = os.environ['OPENAI_API_BASE'] = base_url
+    # Sahte sunucu anahtarı kontrol etmez; ChatOpenAI yalnızca bir anahtarın tanımlı olmasını ister
+    os.environ.setdefault('OPENAI_API_KEY', 'mock')
+    os.environ.setdefault('PUBG_COACH_CACHE', os.path.join(tempfile.mkdtemp(), 'coach_cache.sqlite'))
+    from tools.coach_crew import run_coach_crew
+
+    counter = iter(range(10 ** 9))
+
+    def run():
+        # Her çalıştırmada farklı istatistik: yanıt önbelleği devreye girmez
+        i = next(counter)
+        stats = {'total_matches': 42 + i, 'win_rate': 48.2, 'kills': 63, 'kd_ratio': 2.1, 'avg_damage': 245.0}
+        return run_coach_crew(stats, "Dengeli", single_pass=single_pass).raw_output
+    return run
+
+def measure(run, runs):
+    """
+    run() çağrısının gecikmelerini (sn) ölçer ve her çağrının iki bölüm döndürdüğünü doğrular
+    """
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        sections = run()
+        latencies.append(time.perf_counter() - start)
+        if len(sections) != 2 or not all(sections):
+            raise SystemExit(f"Çıktı iki bölüme ayrılamadı: {sections!r}")
+    return np.array(latencies)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.4, help="Sahte modelin ilk yanıt gecikmesi (sn)")
+    parser.add_argument('--token-latency', type=float, default=0.01, help="Token başına gecikme (sn)")
+    parser.add_argument('--timeout', type=float, default=60)
+    parser.add_argument('--mode', choices=['http', 'crew'], default='http')
+    args = parser.parse_args()
+
+    server, state, base_url = start_server(latency=args.latency, rpm=0, token_latency=args.token_latency)
+    if args.mode == 'http':
+        runners = {
+            'iki görev': lambda: http_two_pass(base_url, args.timeout),
+            'tek geçiş': lambda: http_single_pass(base_url, args.timeout)
+        }
+    else:
+        runners = {'iki görev': crew_runner(base_url, False), 'tek geçiş': crew_runner(base_url, True)}
+
+    results = {}
+    for name, run in runners.items():
+        requests_before = state.requests
+        results[name] = measure(run, args.runs)
+        print(f"{name:<10} p50 {np.percentile(results[name], 50):.2f} sn, "
+              f"p95 {np.percentile(results[name], 95):.2f} sn, "
+              f"çalıştırma başına {(state.requests - requests_before) / args.runs:.1f} istek")
+    speedup = np.median(results['iki görev']) / np.median(results['tek geçiş'])
+    print(f"Tek geçiş medyan gecikmede {speedup:.2f}x daha hızlı")
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Çok oyunculu koç zamanlayıcısının verimini sahte OpenAI sunucusuna karşı
+ölçer. Her oyuncu için analist + koç olmak üzere iki ardışık sohbet isteği
+yapılır; farklı eşzamanlılık sınırlarında oyuncu/sn, tekrar deneme ve 429
+sayıları raporlanır.
+
+--mode crew ile gerçek CrewAI hattı (tools.coach_crew.run_coach_crew) sahte sunucuya
+yönlendirilerek çalıştırılır; bunun için crewai ve langchain-openai kurulu olmalıdır.
+
+Kullanım: python -m benchmarks.bench_coach_scheduler [--players 64] [--concurrency 1 4 16]
+          [--latency 0.3] [--server-rpm 600] [--rpm 540] [--mode http|crew]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+import urllib.request
+
+import numpy as np
+
+from benchmarks.mock_openai_server import start_server
+from tools.coach_scheduler import CoachScheduler
+
+def chat(base_url, prompt, timeout):
+    """
+    Sahte sunucuya tek bir sohbet isteği gönderir ve yanıt metnini döndürür
+    """
+    request = urllib.request.Request(
+        f"{base_url}/chat/completions",
+        data=json.dumps({'model': 'gpt-4o', 'messages': [{'role': 'user', 'content': prompt}]}).encode('utf-8'),
+        headers={'Content-Type': 'application/json', 'Authorization': 'Bearer mock'}
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())['choices'][0]['message']['content']
+
+def http_pipeline(base_url, timeout):
+    """
+    Analist ve koç görevlerini taklit eden iki ardışık istek
+    """
+    def run(player_id):
+        analysis = chat(base_url, f"{player_id} oyuncusunu analiz et", timeout)
+        return chat(base_url, f"Analize göre koçluk yap: {analysis}", timeout)
+    return run
+
+def crew_pipeline(base_url):
+    """
+    Gerçek CrewAI hattını sahte sunucuya yönlendirir
+    """
+    os.environ['OPENAI_BASE_URL'] = os.environ['OPENAI_API_BASE'] = base_url
+    # Sahte sunucu anahtarı kontrol etmez; ChatOpenAI yalnızca bir anahtarın tanımlı olmasını ister
+    os.environ.setdefault('OPENAI_API_KEY', 'mock')
+    # Önbellek isabetleri ölçümü bozmasın diye geçici bir önbellek dosyası kullanılır
+    os.environ['PUBG_COACH_CACHE'] = os.path.join(tempfile.mkdtemp(), 'coach_cache.sqlite')
+    from tools.coach_crew import run_coach_crew
+
+    def run(player_id):
+        seed = sum(map(ord, player_id))
+        stats = {'total_matches': 10 + seed % 50, 'win_rate': seed % 100, 'kills': seed % 200,
+                 'kd_ratio': (seed % 70) / 10, 'avg_damage': seed % 600}
+        return str(run_coach_crew(stats, "Dengeli"))
+    return run
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--players', type=int, default=64)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--latency', type=float, default=0.3, help="Sahte sunucu yanıt gecikmesi (sn)")
+    parser.add_argument('--server-rpm', type=int, default=600, help="Sahte sunucunun dakikalık sınırı")
+    parser.add_argument('--rpm', type=float, default=540, help="Zamanlayıcının dakikalık istek hedefi (0: sınırsız)")
+    parser.add_argument('--timeout', type=float, default=30)
+    parser.add_argument('--mode', choices=['http', 'crew'], default='http')
+    args = parser.parse_args()
+
+    server, state, base_url = start_server(latency=args.latency, rpm=args.server_rpm)
+    run = http_pipeline(base_url, args.timeout) if args.mode == 'http' else crew_pipeline(base_url)
+    players = [f'player{i:05d}' for i in range(args.players)]
+
+    print(f"{'eşzamanlılık':>12}{'süre sn':>9}{'oyuncu/sn':>11}{'p50 sn':>8}{'hata':>6}"
+          f"{'tekrar':>8}{'429':>6}")
+    for concurrency in args.concurrency:
+        scheduler = CoachScheduler(run, concurrency=concurrency, requests_per_minute=args.rpm,
+                                   timeout=args.timeout, calls_per_job=2)
+        rejected_before = state.rejected
+        submitted, latencies = {}, []
+
+        def jobs():
+            for player_id in players:
+                submitted[player_id] = time.perf_counter()
+                yield player_id, (player_id,)
+
+        start = time.perf_counter()
+        for player_id, _, _ in scheduler.run(jobs()):
+            latencies.append(time.perf_counter() - submitted[player_id])
+        elapsed = time.perf_counter() - start
+        print(f"{concurrency:>12}{elapsed:>9.2f}{len(players) / elapsed:>11.2f}"
+              f"{np.percentile(latencies, 50):>8.2f}{scheduler.stats['failed']:>6}"
+              f"{scheduler.stats['retries']:>8}{state.rejected - rejected_before:>6}")
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
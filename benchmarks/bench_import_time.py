@@ -0,0 +1,92 @@
+"""
+Modüllerin içe aktarma süresini `python -X importtime` ile ayrı, temiz
+süreçlerde ölçer. Her modül için toplam süre (en iyi ölçüm), en pahalı
+alt içe aktarmalar ve ağır kütüphanelerden (crewai, langchain, plotly,
+streamlit, sklearn) hangilerinin yüklendiği raporlanır.
+
+Kullanım: python -m benchmarks.bench_import_time [--modules tools.player_core main] [--repeat 5] [--top 5]
+"""
+import argparse
+import subprocess
+import sys
+
+# Uygulama modülleri ve karşılaştırma için tembel yüklenen kütüphanelerin kendi maliyetleri
+DEFAULT_MODULES = ['tools.player_core', 'tools.coach_crew', 'tools.batch', 'config.llm_config', 'main',
+                   'crewai', 'langchain_openai', 'plotly.express']
+
+# Uygulama başlangıcında yüklenmemesi gereken ağır kütüphaneler
+HEAVY_MODULES = ['crewai', 'langchain_openai', 'langchain_core', 'plotly', 'streamlit', 'sklearn']
+
+def parse_importtime(stderr):
+    """
+    -X importtime çıktısını (modül, kendi süresi µs, toplam süre µs, derinlik) listesine çevirir
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+def direct_imports(entries, module):
+    """
+    Modülün doğrudan içe aktardığı (bir alt seviyedeki) girdileri döndürür.
+    importtime alt modülleri üst modülden önce yazdığı için geriye doğru taranır.
+    """
+    index = next((i for i, entry in enumerate(entries) if entry[0] == module and entry[3] == 0), None)
+    if index is None:
+        return []
+    children = []
+    for entry in reversed(entries[:index]):
+        if entry[3] == 0:
+            break
+        if entry[3] == 1:
+            children.append(entry)
+    return children
+
+def measure_import(module, repeat):
+    """
+    Modülü repeat kez temiz süreçte içe aktarır. ((toplam µs, girdiler,
+    yüklenen ağır kütüphaneler), hata mesajı) döndürür; en iyi ölçüm seçilir.
+    """
+    code = (f"import sys, {module}; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'bilinmeyen hata'
+            return None, error
+        entries = parse_importtime(result.stderr)
+        total = next((cumulative for name, _, cumulative, depth in entries if name == module and depth == 0), 0)
+        if best is None or total < best[0]:
+            heavy = [name for name in result.stdout.strip().split(',') if name]
+            best = (total, entries, heavy)
+    return best, None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--modules', nargs='+', default=DEFAULT_MODULES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=5, help="Gösterilecek en pahalı alt içe aktarma sayısı")
+    args = parser.parse_args()
+
+    for module in args.modules:
+        best, error = measure_import(module, args.repeat)
+        if error is not None:
+            print(f"{module}: içe aktarılamadı ({error})\n")
+            continue
+        total, entries, heavy = best
+        print(f"{module}: {total / 1000:.1f} ms")
+        print(f"  ağır kütüphaneler: {', '.join(heavy) if heavy else 'yok'}")
+        # Modülün doğrudan içe aktardığı paketler arasında en pahalıları
+        children = sorted(direct_imports(entries, module), key=lambda entry: entry[2], reverse=True)
+        for name, _, cumulative, _ in children[:args.top]:
+            print(f"  {cumulative / 1000:>8.1f} ms  {name}")
+        print()
+
+if __name__ == "__main__":
+    main()
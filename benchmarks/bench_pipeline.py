@@ -0,0 +1,234 @@
+"""
+Analiz hattının her aşamasını (CSV yükleme, sütun önbelleği, oyuncu indeksi,
+get_player_data, calculate_player_stats, determine_playstyle, öneri
+üreticileri ve önerilerin tüm oyuncular için toplu değerlendirilmesi)
+sentetik veri üzerinde farklı satır sayılarında ölçer. Her boyut ayrı bir
+süreçte çalışır; aşama başına medyan süre, tracemalloc tepe belleği
+ve sürecin tepe RSS değeri JSON olarak yazılır. Kayıtlı bir temel ölçümle
+karşılaştırılıp eşikten fazla yavaşlayan aşamalar işaretlenir (çıkış kodu 1).
+
+Oyuncu başına aşamaların süresi, örneklenen oyuncular üzerinden çağrı başına
+ortalamadır. Sentetik CSV'ler --data-dir altında bir kez üretilip tekrar kullanılır.
+
+Kullanım: python -m benchmarks.bench_pipeline [--sizes 10000 1000000 10000000] [--repeat 3]
+          [--baseline benchmarks/data/pipeline_baseline.json] [--save-baseline]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic_data import write_synthetic_csv
+
+DEFAULT_SIZES = [10_000, 1_000_000, 10_000_000]
+DEFAULT_DATA_DIR = os.path.join('benchmarks', 'data')
+
+def dataset_path(data_dir, rows, seed=0):
+    """
+    Verilen boyuttaki sentetik CSV'nin yolunu döndürür, yoksa üretir
+    """
+    path = os.path.join(data_dir, f'pubg_{rows}.csv')
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        start = time.perf_counter()
+        write_synthetic_csv(path, rows, seed=seed)
+        print(f"{path} üretildi ({time.perf_counter() - start:.1f} sn)")
+    return path
+
+def measure(fn, repeat, setup=None, calls=1):
+    """
+    fn'i repeat kez çalıştırır; çağrı başına medyan/en iyi süre (sn) ve ayrı
+    bir çalıştırmada tracemalloc tepe belleğini (MB) döndürür
+    """
+    seconds = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        seconds.append((time.perf_counter() - start) / calls)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        'seconds': float(np.median(seconds)),
+        'best_seconds': float(min(seconds)),
+        'peak_mb': peak / 2 ** 20
+    }
+
+def max_rss_mb():
+    """
+    Sürecin şimdiye kadarki tepe RSS değeri (MB), desteklenmiyorsa None
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def run_size(path, repeat, lookups, seed=0):
+    """
+    Tek bir veri boyutu için tüm aşamaları ölçer (ayrı süreçte çalıştırılır)
+    """
+    from tools import player_core as core
+    from tools.bulk_stats import calculate_all_player_stats, classify_playstyles
+    from tools.columnar_cache import build_columnar_cache, get_cache_dir
+    from tools.player_index import PlayerIndex
+    from tools.suggestion_rules import evaluate_players
+
+    stages = {}
+    stages['load_csv'] = measure(
+        lambda: core.load_pubg_data(path, columns=core.APP_COLUMNS, use_cache=False), repeat)
+    stages['build_cache'] = measure(
+        lambda: build_columnar_cache(path),
+        repeat, setup=lambda: shutil.rmtree(get_cache_dir(path), ignore_errors=True))
+    stages['load_cached'] = measure(
+        lambda: core.load_pubg_data(path, columns=core.APP_COLUMNS), repeat)
+
+    df = core.load_pubg_data(path, columns=core.APP_COLUMNS)
+    id_column = core.find_id_column(df)
+    stages['player_index'] = measure(lambda: PlayerIndex(df, id_column), repeat)
+    player_index = PlayerIndex(df, id_column)
+
+    # Öneri kurallarının tüm oyuncu tablosu üzerinde toplu değerlendirilmesi
+    all_stats = calculate_all_player_stats(df, id_column)
+    all_playstyles = classify_playstyles(all_stats)
+    stages['evaluate_suggestions'] = measure(lambda: evaluate_players(all_stats, all_playstyles), repeat)
+
+    rng = np.random.default_rng(seed)
+    sample = list(player_index.labels[rng.integers(0, len(player_index), lookups)])
+    player_data = [core.get_player_data(df, player_id, id_column, player_index) for player_id in sample]
+    player_stats = [core.calculate_player_stats(data) for data in player_data]
+    playstyles = [core.determine_playstyle(stats) for stats in player_stats]
+
+    per_player = {
+        'get_player_data': lambda: [core.get_player_data(df, player_id, id_column, player_index)
+                                    for player_id in sample],
+        'calculate_player_stats': lambda: [core.calculate_player_stats(data) for data in player_data],
+        'determine_playstyle': lambda: [core.determine_playstyle(stats) for stats in player_stats],
+        'generate_weapon_suggestions': lambda: [core.generate_weapon_suggestions(stats, style)
+                                                for stats, style in zip(player_stats, playstyles)],
+        'generate_landing_suggestions': lambda: [core.generate_landing_suggestions(style)
+                                                 for style in playstyles]
+    }
+    for name, fn in per_player.items():
+        stages[name] = measure(fn, repeat, calls=lookups)
+
+    return {
+        'rows': len(df),
+        'players': len(player_index),
+        'stages': stages,
+        'max_rss_mb': max_rss_mb()
+    }
+
+def find_regressions(results, baseline, threshold, min_delta):
+    """
+    Temel ölçüme göre medyan süresi (1 + threshold) katından ve min_delta
+    saniyeden fazla artan (boyut, aşama, oran) üçlülerini döndürür
+    """
+    regressions = []
+    for size, result in results['sizes'].items():
+        base_stages = baseline.get('sizes', {}).get(size, {}).get('stages', {})
+        for stage, values in result['stages'].items():
+            base = base_stages.get(stage)
+            if base is None or base['seconds'] <= 0:
+                continue
+            ratio = values['seconds'] / base['seconds']
+            if ratio > 1 + threshold and values['seconds'] - base['seconds'] > min_delta:
+                regressions.append((size, stage, ratio))
+    return regressions
+
+def format_seconds(seconds):
+    """
+    Süreyi okunabilir birimle (sn/ms/µs) biçimlendirir
+    """
+    if seconds >= 1:
+        return f"{seconds:.2f} sn"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+def print_table(results, baseline):
+    print(f"{'satır':>10} {'aşama':<30}{'süre':>12}{'tepe MB':>10}{'temel oranı':>13}")
+    for size, result in results['sizes'].items():
+        base_stages = (baseline or {}).get('sizes', {}).get(size, {}).get('stages', {})
+        for stage, values in result['stages'].items():
+            seconds = values['seconds']
+            shown = format_seconds(seconds)
+            base = base_stages.get(stage)
+            ratio = f"{seconds / base['seconds']:.2f}x" if base and base['seconds'] > 0 else '-'
+            print(f"{size:>10} {stage:<30}{shown:>12}{values['peak_mb']:>10.1f}{ratio:>13}")
+        if result['max_rss_mb'] is not None:
+            print(f"{size:>10} {'(süreç tepe RSS)':<30}{'':>12}{result['max_rss_mb']:>10.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--lookups', type=int, default=200, help="Oyuncu başına aşamalarda örneklenen oyuncu sayısı")
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR)
+    parser.add_argument('--out', default=os.path.join(DEFAULT_DATA_DIR, 'pipeline_results.json'))
+    parser.add_argument('--baseline', default=os.path.join(DEFAULT_DATA_DIR, 'pipeline_baseline.json'))
+    parser.add_argument('--save-baseline', action='store_true', help="Bu ölçümü yeni temel olarak kaydet")
+    parser.add_argument('--threshold', type=float, default=0.25, help="İzin verilen göreli yavaşlama")
+    parser.add_argument('--min-delta', type=float, default=2e-5, help="Gürültü sayılan mutlak fark (sn)")
+    args = parser.parse_args()
+
+    results = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'cpus': os.cpu_count(),
+            'repeat': args.repeat,
+            'lookups': args.lookups
+        },
+        'sizes': {}
+    }
+    # Her boyut temiz bir süreçte: tepe RSS ve içe aktarma maliyeti boyutlar arasında karışmaz
+    context = multiprocessing.get_context('spawn')
+    for rows in args.sizes:
+        path = dataset_path(args.data_dir, rows)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results['sizes'][str(rows)] = pool.submit(run_size, path, args.repeat, args.lookups).result()
+
+    os.makedirs(os.path.dirname(args.out) or '.', exist_ok=True)
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+    baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_table(results, baseline)
+    print(f"Sonuçlar: {args.out}")
+
+    if args.save_baseline:
+        shutil.copyfile(args.out, args.baseline)
+        print(f"Temel ölçüm kaydedildi: {args.baseline}")
+        return 0
+    if baseline is None:
+        return 0
+    regressions = find_regressions(results, baseline, args.threshold, args.min_delta)
+    for size, stage, ratio in regressions:
+        print(f"GERİLEME: {size} satır, {stage}: {ratio:.2f}x")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
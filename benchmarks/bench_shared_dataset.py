@@ -0,0 +1,110 @@
+"""
+Eşzamanlı kullanıcı sayısı arttıkça veri setinin bellek kullanımını ölçen
+yük testi. Her kullanıcı ayrı bir süreçte veri setini yükler, oyuncu
+indeksini oluşturur ve tüm sütunlara dokunur. Süreçler aynı anda ayaktayken
+/proc/self/smaps_rollup üzerinden PSS (paylaşılan sayfalar süreçlere bölünmüş)
+ve süreçlere özel heap okunur. mmap modunda sütun verisi paylaşıldığı için
+süreç başına yalnızca ID kategori tablosu ve indeks kadar bellek eklenir;
+csv modunda tüm veri her süreçte ayrı ayrı tutulur.
+
+Kullanım: python -m benchmarks.bench_shared_dataset --data pubg_final.csv [--users 1 2 4 8] [--mode mmap csv]
+"""
+import argparse
+import multiprocessing as mp
+import os
+
+import numpy as np
+
+from tools.columnar_cache import ensure_columnar_cache
+
+def read_smaps_rollup():
+    """
+    Sürecin Rss/Pss ve kirli özel (yalnızca bu sürece ait heap) bellek
+    değerlerini (KB) döndürür. Dosya eşlemeli temiz sayfalar tek bir süreç
+    tarafından kullanılıyorsa da Private_Clean sayıldığı için dahil edilmez.
+    """
+    values = {}
+    with open('/proc/self/smaps_rollup', encoding='ascii') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 3 and parts[2] == 'kB':
+                values[parts[0].rstrip(':')] = int(parts[1])
+    return {
+        'rss': values.get('Rss', 0),
+        'pss': values.get('Pss', 0),
+        'private': values.get('Private_Dirty', 0)
+    }
+
+def _user_session(data_path, use_cache, lookups, ready, done, results):
+    """
+    Bir kullanıcı oturumunu taklit eder: veri setini yükler, indeksi kurar,
+    tüm sütunları okur ve ölçüm alınana kadar bekler
+    """
+    from tools.data_loader import load_pubg_data
+    from tools.player_index import PlayerIndex
+    from tools.schema import POSSIBLE_ID_COLUMNS, STATS_COLUMNS
+
+    baseline = read_smaps_rollup()
+    # Uygulama ile aynı sütunlar yüklenir (main.APP_COLUMNS)
+    df = load_pubg_data(data_path, columns=POSSIBLE_ID_COLUMNS + STATS_COLUMNS, use_cache=use_cache)
+    id_column = next(c for c in POSSIBLE_ID_COLUMNS if c in df.columns)
+    index = PlayerIndex(df, id_column)
+
+    # Tüm sayfaların gerçekten belleğe alınması için her sütunu baştan sona oku
+    for name in index.data.columns:
+        column = index.data[name]
+        values = column.cat.codes if hasattr(column, 'cat') else column
+        values.to_numpy().sum()
+    rng = np.random.default_rng(os.getpid())
+    for code in rng.integers(0, len(index.labels), lookups):
+        index.lookup(index.labels[code])
+
+    ready.wait()
+    after = read_smaps_rollup()
+    results.put({key: after[key] - baseline[key] for key in after})
+    done.wait()
+
+def measure(data_path, users, use_cache, lookups=1000):
+    """
+    users adet süreci aynı anda çalıştırır ve süreç başına veri seti bellek
+    artışlarını (KB) döndürür
+    """
+    ctx = mp.get_context('spawn')
+    ready, done = ctx.Barrier(users), ctx.Barrier(users + 1)
+    results = ctx.Queue()
+    processes = [
+        ctx.Process(target=_user_session, args=(data_path, use_cache, lookups, ready, done, results))
+        for _ in range(users)
+    ]
+    for process in processes:
+        process.start()
+    samples = [results.get() for _ in range(users)]
+    done.wait()
+    for process in processes:
+        process.join()
+    return samples
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--data', default='pubg_final.csv')
+    parser.add_argument('--users', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--mode', nargs='+', choices=['mmap', 'csv'], default=['mmap', 'csv'])
+    args = parser.parse_args()
+
+    if not os.path.exists('/proc/self/smaps_rollup'):
+        raise SystemExit("Bu test /proc/self/smaps_rollup gerektirir (Linux).")
+    # Önbellek ölçümden önce oluşturulur, böylece yalnızca eşleme maliyeti ölçülür
+    ensure_columnar_cache(args.data)
+
+    print(f"{'mod':<6}{'kullanıcı':>10}{'toplam PSS MB':>15}{'PSS/süreç MB':>15}"
+          f"{'heap/süreç MB':>15}{'RSS/süreç MB':>14}")
+    for mode in args.mode:
+        for users in args.users:
+            samples = measure(args.data, users, use_cache=(mode == 'mmap'))
+            total_pss = sum(s['pss'] for s in samples) / 1024
+            print(f"{mode:<6}{users:>10}{total_pss:>15.1f}{total_pss / users:>15.1f}"
+                  f"{np.mean([s['private'] for s in samples]) / 1024:>15.1f}"
+                  f"{np.mean([s['rss'] for s in samples]) / 1024:>14.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benzer oyuncu (kNN) indeksinin kurulum süresini, bellek kullanımını, tek
+sorgu gecikmesini ve kaba kuvvet aramaya göre isabet oranını (recall@k) ölçer.
+
+Kullanım: python -m benchmarks.bench_similar_players [--players 1000000] [--queries 200] [--k 10]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from tools.similar_players import SIMILARITY_FEATURES, SimilarPlayerIndex
+
+def synthetic_stats(n, seed=0):
+    """
+    calculate_all_player_stats çıktısına benzer rastgele oyuncu istatistikleri üretir
+    """
+    rng = np.random.default_rng(seed)
+    kills_per_match = rng.gamma(1.2, 1.0, n)
+    stats = pd.DataFrame({
+        'kills_per_match': kills_per_match,
+        'kd_ratio': kills_per_match * rng.uniform(0.8, 2.5, n),
+        'avg_damage': kills_per_match * 100 + rng.gamma(2.0, 40.0, n),
+        'headshot_ratio': rng.beta(2, 6, n),
+        'win_rate': rng.uniform(0, 100, n),
+        'avg_walk_distance': rng.gamma(2.0, 800.0, n),
+        'avg_ride_distance': rng.gamma(0.6, 1500.0, n),
+        'weapons_acquired': rng.gamma(3.0, 1.5, n),
+        'longest_kill': rng.gamma(1.5, 60.0, n)
+    }, index=pd.Index([f'{i:014x}' for i in range(n)], name='Id'))
+    return stats[SIMILARITY_FEATURES]
+
+def tree_nbytes(tree):
+    """
+    KD-ağacının veri ve düğüm dizilerinin toplam boyutunu döndürür
+    """
+    return sum(getattr(array, 'nbytes', 0) for array in tree.get_arrays())
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--players', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--k', type=int, default=10)
+    args = parser.parse_args()
+
+    stats = synthetic_stats(args.players)
+    start = time.perf_counter()
+    index = SimilarPlayerIndex(stats)
+    build_seconds = time.perf_counter() - start
+    print(f"Kurulum: {args.players} oyuncu {build_seconds:.2f} sn, "
+          f"ağaç {tree_nbytes(index.tree) / 1e6:.1f} MB")
+
+    rng = np.random.default_rng(1)
+    sample = stats.iloc[rng.integers(0, len(stats), args.queries)]
+    queries = [row.to_dict() for _, row in sample.iterrows()]
+
+    latencies, tree_results = [], []
+    for player_stats in queries:
+        start = time.perf_counter()
+        tree_results.append(index.query(player_stats, k=args.k))
+        latencies.append((time.perf_counter() - start) * 1000)
+    print(f"Sorgu: p50 {np.percentile(latencies, 50):.2f} ms, p99 {np.percentile(latencies, 99):.2f} ms")
+
+    # Kaba kuvvet: tüm vektörlere uzaklık hesaplanır. KD-ağacı kesin arama
+    # yaptığı için recall 1 olmalıdır; düşük çıkması normalleştirme hatasıdır
+    vectors = np.asarray(index.tree.get_arrays()[0])
+    brute_latencies, hits = [], 0
+    for player_stats, found in zip(queries, tree_results):
+        start = time.perf_counter()
+        distances = ((vectors - index.vectors(player_stats)) ** 2).sum(axis=1)
+        nearest = np.argpartition(distances, args.k)[:args.k]
+        brute_latencies.append((time.perf_counter() - start) * 1000)
+        # Eşit uzaklıklarda farklı oyuncu seçilebileceği için uzaklık üzerinden karşılaştırılır
+        threshold = np.sqrt(distances[nearest].max()) + 1e-6
+        hits += sum(dist <= threshold for _, dist in found)
+    recall = hits / (args.k * len(queries))
+    print(f"Kaba kuvvet: p50 {np.percentile(brute_latencies, 50):.2f} ms; recall@{args.k} {recall:.3f}")
+
+if __name__ == "__main__":
+    main()
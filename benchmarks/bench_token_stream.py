@@ -0,0 +1,78 @@
+"""
+Yerel sahte bir akış (streaming) modeliyle ilk token süresini (TTFT) ve
+toplam üretim süresini ölçer. Ağ erişimi gerekmez.
+
+Kullanım: python -m benchmarks.bench_token_stream [--tokens 200] [--delay 0.01]
+"""
+import argparse
+import threading
+import time
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from tools.llm_callbacks import stream_handler
+from tools.token_stream import TokenStream, bind_token_stream, visible_text
+
+class SlowFakeChatModel(GenericFakeChatModel):
+    """
+    Her parçayı gecikmeyle üreten sahte sohbet modeli
+    """
+    delay: float = 0.01
+
+    def _stream(self, *args, **kwargs):
+        for chunk in super()._stream(*args, **kwargs):
+            time.sleep(self.delay)
+            yield chunk
+
+def fake_answer(section, tokens):
+    """
+    CrewAI biçiminde (düşünce + nihai yanıt) sahte bir yanıt üretir
+    """
+    words = " ".join(f"{section}-{i}" for i in range(tokens))
+    return f"Thought: I now can give a great answer\nFinal Answer: {words}"
+
+def produce(stream, sections, tokens, delay):
+    """
+    Arka plandaki Crew çalışmasını taklit eder: bölümleri sırayla akıtır
+    """
+    model = SlowFakeChatModel(
+        messages=iter([AIMessage(content=fake_answer(s, tokens)) for s in sections]),
+        delay=delay
+    )
+    try:
+        with bind_token_stream(stream):
+            for _ in sections:
+                for _ in model.stream("prompt", config={'callbacks': [stream_handler]}):
+                    pass
+                stream.next_section()
+    finally:
+        stream.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tokens', type=int, default=200, help="Bölüm başına kelime sayısı")
+    parser.add_argument('--delay', type=float, default=0.01, help="Parça başına gecikme (sn)")
+    args = parser.parse_args()
+
+    stream = TokenStream()
+    buffers = {section: "" for section in stream.sections}
+    first_visible = {}
+
+    start = time.perf_counter()
+    worker = threading.Thread(target=produce, args=(stream, stream.sections, args.tokens, args.delay))
+    worker.start()
+    while worker.is_alive() or not stream.closed.is_set():
+        for section, token in stream.drain():
+            buffers[section] += token
+            if section not in first_visible and visible_text(buffers[section]):
+                first_visible[section] = time.perf_counter() - start
+    worker.join()
+    total = time.perf_counter() - start
+
+    for section in stream.sections:
+        print(f"{section:<10} ilk görünür token: {first_visible.get(section, float('nan')) * 1000:8.1f} ms")
+    print(f"toplam üretim süresi: {total * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Kazanma modeli tahmin hızını ölçer: batch halinde satır/sn ve tek satırlık
+tahminlerin p50/p99 gecikmesi.
+
+Kullanım: python -m benchmarks.bench_win_model [--model models/win_model.joblib] [--rows 1000000]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from tools.win_model import DEFAULT_MODEL_PATH, load_win_model, predict_win_probability
+
+def synthetic_rows(n, features, seed=0):
+    """
+    Model özellikleriyle aynı sütunlara sahip rastgele maç satırları üretir
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({name: rng.gamma(1.0, 100.0, n).astype(np.float32) for name in features})
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--model', default=DEFAULT_MODEL_PATH)
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Batch ölçümündeki satır sayısı")
+    parser.add_argument('--single', type=int, default=1000, help="Tek satırlık tahmin sayısı")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    artifact = load_win_model(args.model)
+    if artifact is None:
+        raise SystemExit(f"Model bulunamadı: {args.model} (önce: python -m tools.win_model)")
+    print(f"Model yükleme: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    features = artifact['features']
+    batch = synthetic_rows(args.rows, features)
+    start = time.perf_counter()
+    predict_win_probability(batch, artifact)
+    elapsed = time.perf_counter() - start
+    print(f"Batch: {args.rows} satır {elapsed:.2f} sn -> {args.rows / elapsed:,.0f} satır/sn")
+
+    rows = synthetic_rows(args.single, features, seed=1).to_dict('records')
+    predict_win_probability(rows[0], artifact)  # ısınma
+    latencies = []
+    for row in rows:
+        start = time.perf_counter()
+        predict_win_probability(row, artifact)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    print(f"Tek satır: p50 {np.percentile(latencies, 50):.2f} ms, p99 {np.percentile(latencies, 99):.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Yerel, OpenAI uyumlu sahte sohbet sunucusu. /v1/chat/completions isteklerine
+sabit ilk yanıt gecikmesi + token başına gecikmeyle yanıt verir (stream=true
+ise SSE parçaları halinde) ve dakikalık istek sınırı aşılınca Retry-After
+başlığıyla 429 döndürür. İstek tek geçişli bölüm başlıklarını içeriyorsa
+yanıt da bu başlıklarla iki bölüm halinde döner.
+
+Kullanım: python -m benchmarks.mock_openai_server [--port 8765] [--latency 0.5] [--token-latency 0.01] [--rpm 600]
+Ardından: OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_BASE=http://127.0.0.1:8765/v1
+"""
+import argparse
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ANALYSIS = ("Oyuncu dengeli bir oyun tarzına sahip. Kazanma oranı ortalamanın üzerinde, "
+            "K/D oranı ise orta mesafe çatışmalarda tutarlı olduğunu gösteriyor.")
+COACHING = ("Orta mesafe çatışmalarda pozisyon almaya ve güvenli bölgeye erken girmeye odaklanmalı. "
+            "İlk çemberde araç bulup kenardan ilerlemeli.")
+# İki görevli modda her istek bir bölüm kadar, tek geçişli modda iki bölüm kadar token üretir
+REPLY = f"Thought: Oyuncunun istatistiklerini inceledim.\nFinal Answer: {ANALYSIS}"
+SINGLE_PASS_REPLY = (f"Thought: Oyuncunun istatistiklerini inceledim.\nFinal Answer: "
+                     f"### ANALİZ\n{ANALYSIS}\n\n### KOÇLUK\n{COACHING}")
+
+def reply_for(request):
+    """
+    İsteğe uygun sahte yanıt metnini seçer
+    """
+    prompt = ' '.join(str(m.get('content', '')) for m in request.get('messages', []))
+    return SINGLE_PASS_REPLY if '### KOÇLUK' in prompt else REPLY
+
+class MockState:
+    """
+    Sunucu ayarları ve kayan pencere ile istek sayacı
+    """
+
+    def __init__(self, latency, rpm, token_latency=0.0, tokens_per_chunk=4):
+        self.latency = latency
+        self.token_latency = token_latency
+        self.rpm = rpm
+        self.tokens_per_chunk = tokens_per_chunk
+        self.requests = 0
+        self.rejected = 0
+        self._window = deque()
+        self._lock = threading.Lock()
+
+    def admit(self):
+        """
+        İsteği kabul eder veya sınır aşıldıysa beklenmesi gereken süreyi döndürür
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.requests += 1
+            while self._window and now - self._window[0] >= 60:
+                self._window.popleft()
+            if self.rpm and len(self._window) >= self.rpm:
+                self.rejected += 1
+                return 60 - (now - self._window[0])
+            self._window.append(now)
+            return 0
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def _json(self, status, payload, headers=None):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+            if not self.path.endswith('/chat/completions'):
+                self._json(404, {'error': {'message': 'not found'}})
+                return
+            wait = state.admit()
+            if wait:
+                self._json(429, {'error': {'message': 'rate limited', 'type': 'rate_limit_error'}},
+                           {'Retry-After': f'{max(wait, 0.1):.2f}'})
+                return
+
+            time.sleep(state.latency)
+            model = request.get('model', 'mock')
+            prompt_tokens = sum(len(str(m.get('content', '')).split()) for m in request.get('messages', []))
+            reply = reply_for(request)
+            words = reply.split(' ')
+            if not request.get('stream'):
+                time.sleep(state.token_latency * len(words))
+                self._json(200, {
+                    'id': 'chatcmpl-mock', 'object': 'chat.completion', 'created': int(time.time()),
+                    'model': model,
+                    'choices': [{'index': 0, 'finish_reason': 'stop',
+                                 'message': {'role': 'assistant', 'content': reply}}],
+                    'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': len(words),
+                              'total_tokens': prompt_tokens + len(words)}
+                })
+                return
+
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Connection', 'close')
+            self.end_headers()
+            step = state.tokens_per_chunk
+            for i in range(0, len(words), step):
+                time.sleep(state.token_latency * len(words[i:i + step]))
+                text = ' '.join(words[i:i + step]) + (' ' if i + step < len(words) else '')
+                chunk = {'id': 'chatcmpl-mock', 'object': 'chat.completion.chunk',
+                         'created': int(time.time()), 'model': model,
+                         'choices': [{'index': 0, 'delta': {'content': text}, 'finish_reason': None}]}
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode('utf-8'))
+            final = {'id': 'chatcmpl-mock', 'object': 'chat.completion.chunk', 'created': int(time.time()),
+                     'model': model, 'choices': [{'index': 0, 'delta': {}, 'finish_reason': 'stop'}]}
+            self.wfile.write(f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n".encode('utf-8'))
+            self.close_connection = True
+
+    return Handler
+
+def start_server(port=0, latency=0.5, rpm=600, token_latency=0.0):
+    """
+    Sunucuyu arka plan iş parçacığında başlatır; (sunucu, durum, temel URL) döndürür
+    """
+    state = MockState(latency, rpm, token_latency)
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.5, help="İlk yanıt gecikmesi (sn)")
+    parser.add_argument('--token-latency', type=float, default=0.0, help="Token (kelime) başına gecikme (sn)")
+    parser.add_argument('--rpm', type=int, default=600, help="Dakikalık istek sınırı (0: sınırsız)")
+    args = parser.parse_args()
+
+    server, _, base_url = start_server(args.port, args.latency, args.rpm, args.token_latency)
+    print(f"Sahte OpenAI sunucusu: {base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+pubg_final.csv biçiminde sentetik PUBG verisi üretir. Her oyuncunun gizli
+bir beceri düzeyi, isabet oranı ve oynama sıklığı vardır; maçlar ~95 satırlık
+bloklar halinde, maç tipine göre (solo/duo/squad) takımlara bölünür. Öldürme,
+hasar, mesafe ve sıralama değerleri bu gizli değerlerle ilişkili dağılımlardan
+çekilir. Büyük dosyalar parça parça yazıldığı için bellek kullanımı sabittir.
+
+Kullanım: python -m benchmarks.synthetic_data --rows 1000000 [--players 50000] [--out pubg_synthetic.csv]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+# Maç başına satır (oyuncu) sayısı ve maç tiplerinin görülme olasılıkları
+ROWS_PER_MATCH = 95
+MATCH_TYPES = ['squad-fpp', 'duo-fpp', 'squad', 'solo-fpp', 'duo', 'solo']
+MATCH_TYPE_WEIGHTS = [0.40, 0.23, 0.14, 0.12, 0.07, 0.04]
+TEAM_SIZES = {'squad-fpp': 4, 'squad': 4, 'duo-fpp': 2, 'duo': 2, 'solo-fpp': 1, 'solo': 1}
+
+# Ortalama oyuncu başına maç sayısı (--players verilmezse) ve parça boyu
+DEFAULT_MATCHES_PER_PLAYER = 20
+CHUNK_ROWS = 1_000_000
+
+def _hash_unit(codes, salt):
+    """
+    Tamsayı kodlarını [0, 1) aralığında deterministik sayılara çevirir
+    (parça sınırından bağımsız olarak aynı maç/takım aynı değeri alır)
+    """
+    x = (codes.astype(np.uint64) + np.uint64(salt)) * np.uint64(0x9E3779B97F4A7C15)
+    x ^= x >> np.uint64(31)
+    x *= np.uint64(0xBF58476D1CE4E5B9)
+    x ^= x >> np.uint64(29)
+    return (x >> np.uint64(11)).astype(np.float64) / float(1 << 53)
+
+def _hex_ids(codes, salt=0):
+    """
+    Kodları Kaggle PUBG verisindeki gibi rastgele görünen 14 haneli onaltılık ID'lere çevirir
+    """
+    return np.char.mod('%014x', (_hash_unit(codes, salt) * (1 << 52)).astype(np.int64))
+
+class PlayerPopulation:
+    """
+    Oyuncuların sabit gizli özellikleri: ID, beceri, isabet oranı ve oynama sıklığı
+    """
+
+    def __init__(self, players, seed=0):
+        rng = np.random.default_rng(seed)
+        self.ids = _hex_ids(np.arange(players), seed)
+        self.skill = rng.gamma(4.0, 0.25, players)
+        self.headshot_rate = rng.beta(2.0, 6.0, players)
+        # Az sayıda oyuncu çok, çoğu oyuncu az maç oynar
+        activity = rng.gamma(0.8, 1.0, players)
+        self.activity_cdf = np.cumsum(activity / activity.sum())
+
+    def sample(self, rng, n):
+        """
+        Oynama sıklığına göre n satırlık oyuncu kodu çeker
+        """
+        codes = np.searchsorted(self.activity_cdf, rng.random(n), side='right')
+        return np.minimum(codes, len(self.ids) - 1)
+
+def generate_chunk(population, start, n, rng):
+    """
+    Genel satır numarası start'tan başlayan n satırlık veri çerçevesi üretir
+    """
+    rows = np.arange(start, start + n, dtype=np.int64)
+    match_codes = rows // ROWS_PER_MATCH
+    type_cdf = np.cumsum(MATCH_TYPE_WEIGHTS)
+    type_codes = np.minimum(np.searchsorted(type_cdf, _hash_unit(match_codes, 1)), len(MATCH_TYPES) - 1)
+    team_sizes = np.array([TEAM_SIZES[t] for t in MATCH_TYPES])[type_codes]
+    group_codes = match_codes * ROWS_PER_MATCH + (rows % ROWS_PER_MATCH) // team_sizes
+
+    player_codes = population.sample(rng, n)
+    skill = population.skill[player_codes]
+
+    # Takım sıralaması takım için ortak, beceri yükseldikçe üst sıralara kayar
+    place = _hash_unit(group_codes, 2) ** (1.0 / skill)
+    win_place = np.round(place, 4)
+
+    walk = rng.gamma(2.0, 600.0 * (0.15 + place))
+    afk = rng.random(n) < 0.02
+    walk[afk] = 0.0
+    ride = np.where(rng.random(n) < 0.25, rng.gamma(1.5, 1500.0, n) * (0.3 + place), 0.0)
+    swim = np.where(rng.random(n) < 0.07, rng.gamma(1.0, 20.0, n), 0.0)
+
+    kills = rng.poisson(0.9 * skill * (0.4 + place))
+    kills[afk] = 0
+    headshots = rng.binomial(kills, population.headshot_rate[player_codes])
+    damage = kills * rng.uniform(70.0, 110.0, n) + rng.gamma(1.2, 60.0, n) * skill
+    damage[afk] = 0.0
+    longest = np.where(kills > 0, rng.gamma(1.5, 40.0 * skill), 0.0)
+    weapons = rng.poisson(1.0 + walk / 800.0)
+
+    return pd.DataFrame({
+        'Id': population.ids[player_codes],
+        'groupId': _hex_ids(group_codes, 3),
+        'matchId': _hex_ids(match_codes, 4),
+        'kills': kills,
+        'damageDealt': np.round(damage, 2),
+        'walkDistance': np.round(walk, 1),
+        'rideDistance': np.round(ride, 1),
+        'swimDistance': np.round(swim, 2),
+        'headshotKills': headshots,
+        'longestKill': np.round(longest, 2),
+        'weaponsAcquired': weapons,
+        'winPlacePerc': win_place,
+        'matchType': np.array(MATCH_TYPES)[type_codes]
+    })
+
+def write_synthetic_csv(path, rows, players=None, seed=0, chunk_rows=CHUNK_ROWS):
+    """
+    rows satırlık sentetik CSV'yi parça parça yazar; oyuncu sayısını döndürür.
+    players verilmezse oyuncu başına ortalama DEFAULT_MATCHES_PER_PLAYER maç düşer.
+    """
+    players = players or max(1, rows // DEFAULT_MATCHES_PER_PLAYER)
+    population = PlayerPopulation(players, seed)
+    rng = np.random.default_rng(seed + 1)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        for start in range(0, rows, chunk_rows):
+            chunk = generate_chunk(population, start, min(chunk_rows, rows - start), rng)
+            chunk.to_csv(f, header=start == 0, index=False)
+    return players
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--players', type=int, default=None,
+                        help=f"Oyuncu sayısı (varsayılan: satır / {DEFAULT_MATCHES_PER_PLAYER})")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default='pubg_synthetic.csv')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    players = write_synthetic_csv(args.out, args.rows, args.players, args.seed)
+    print(f"{args.out}: {args.rows} satır, {players} oyuncu, {time.perf_counter() - start:.1f} sn")
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,16 @@
 import os
-from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
 
-# .env dosyasından API anahtarını yükle
-load_dotenv()
+# dotenv ve langchain_openai yalnızca LLM oluşturulurken içe aktarılır;
+# bu modülü içe aktarmak ortamı değiştirmez ve ağır kütüphaneleri yüklemez
 
 # OpenAI API yapılandırması
 def get_llm():
+    from dotenv import load_dotenv
+    from langchain_openai import ChatOpenAI
+
+    # .env dosyasından API anahtarını yükle
+    load_dotenv()
+
     openai_api_key = os.getenv("OPENAI_API_KEY")
     if not openai_api_key:
         raise ValueError("OPENAI_API_KEY bulunamadı. Lütfen .env dosyasını kontrol edin.")
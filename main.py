@@ -1,345 +1,135 @@
 import os
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 from dotenv import load_dotenv
 
-from crewai import Agent, Task, Crew
-try:
-    from crewai.process import Process
-except ImportError:
-    from crewai import Process
-
-from langchain_openai import ChatOpenAI
+# crewai, langchain_openai ve plotly ağır kütüphanelerdir; yalnızca ihtiyaç
+# duyulan fonksiyonlarda içe aktarılır. İstatistik, oyun tarzı ve öneri
+# fonksiyonları tools/player_core.py'dedir ve buradan yeniden dışa aktarılır.
+# CrewAI koç hattı (ajanlar, görevler, run_coach_crew) tools/coach_crew.py'dedir.
+from tools.aggregate_store import AggregateStore
+from tools.coach_crew import run_coach_crew
+from tools.coach_result import split_sections
+from tools.coach_worker import submit_coach_job
+from tools.columnar_cache import dataset_version
+from tools.player_core import (
+    APP_COLUMNS, calculate_player_stats, determine_playstyle,
+    find_id_column, generate_landing_suggestions, generate_weapon_suggestions, get_player_data,
+    load_pubg_data, resolve_data_path
+)
+from tools.player_index import PlayerIndex
+from tools.player_search import DEFAULT_PAGE_SIZE, PlayerSearchIndex
+from tools.response_cache import get_response_cache
+from tools.similar_players import SimilarPlayerIndex
+from tools.stage_timer import DEBUG_PANEL, RequestTrace, breakdown, in_trace, traced_request
+from tools.team_features import TeamFeatures
+from tools.token_stream import TokenStream, visible_text
+from tools.win_model import predict_player_win_rate, stats_to_features
 
 # API anahtarını doğrudan ayarla
 os.environ["OPENAI_API_KEY"] = "your_key"
 
-# Veri yükleme fonksiyonu
-def load_pubg_data(file_path='pubg_final.csv'):
-    """
-    PUBG veri setini yükler
-    """
-    try:
-        df = pd.read_csv(file_path)
-        return df
-    except FileNotFoundError:
-        # Alternatif konumları dene
-        alt_paths = ['./data/pubg_final.csv', '../pubg_final.csv']
-        for path in alt_paths:
-            try:
-                df = pd.read_csv(path)
-                return df
-            except FileNotFoundError:
-                continue
-        print(f"Veri dosyası bulunamadı: {file_path}")
-        return None
-    except Exception as e:
-        print(f"Veri yükleme hatası: {e}")
-        return None
+# Tek geçişli koç modu varsayılanı: analiz ve koçluk tek LLM çağrısında üretilir
+SINGLE_PASS_DEFAULT = os.getenv('PUBG_COACH_SINGLE_PASS', '0') == '1'
 
-# Oyuncu verilerini getirme fonksiyonu
-def get_player_data(df, player_id=None, id_column=None):
+# Veri seti ve oyuncu indeksi tüm oturumlar arasında paylaşılır;
+# version değiştiğinde (CSV güncellendiğinde) yeniden yüklenir
+@st.cache_resource(show_spinner="Veri seti yükleniyor...", max_entries=1)
+def load_dataset(data_path, version):
     """
-    Belirli bir oyuncunun verilerini getirir
-    """
-    if player_id and id_column and player_id in df[id_column].values:
-        return df[df[id_column] == player_id]
-    return df.head(10)  # Eğer belirli bir oyuncu bulunamazsa ilk 10 satırı döndür
-
-# Oyuncu istatistiklerini hesaplama fonksiyonu
-def calculate_player_stats(player_data):
+    Veri setini yükler ve oyuncu indeksini bir kez oluşturur
     """
-    Oyuncunun detaylı istatistiklerini hesaplar
-    """
-    # Temel istatistikler
-    total_matches = len(player_data)
-    if total_matches == 0:
-        return {
-            'total_matches': 0,
-            'wins': 0,
-            'win_rate': 0,
-            'kills': 0,
-            'deaths': 0,
-            'kd_ratio': 0,
-            'avg_damage': 0,
-            'avg_walk_distance': 0,
-            'avg_ride_distance': 0,
-            'avg_swim_distance': 0,
-            'headshot_kills': 0,
-            'longest_kill': 0,
-            'weapons_acquired': 0
-        }
+    df = load_pubg_data(data_path, columns=APP_COLUMNS)
+    if df is None:
+        return None, None, None
 
-    # Kazanma oranı - winPlacePerc sütunu varsa kullan
-    if 'winPlacePerc' in player_data.columns:
-        avg_win_place = player_data['winPlacePerc'].mean() * 100
-    else:
-        avg_win_place = 0
+    player_id_column = find_id_column(df)
+    if player_id_column is None:
+        # Eğer uygun bir sütun bulunamazsa, indeksi kullan
+        df['player_index'] = range(len(df))
+        player_id_column = 'player_index'
 
-    # Kills
-    if 'kills' in player_data.columns:
-        kills = player_data['kills'].sum()
-    else:
-        kills = 0
-
-    # Damage
-    if 'damageDealt' in player_data.columns:
-        avg_damage = player_data['damageDealt'].mean()
-    else:
-        avg_damage = 0
-
-    # Hareket istatistikleri
-    avg_walk_distance = player_data['walkDistance'].mean() if 'walkDistance' in player_data.columns else 0
-    avg_ride_distance = player_data['rideDistance'].mean() if 'rideDistance' in player_data.columns else 0
-    avg_swim_distance = player_data['swimDistance'].mean() if 'swimDistance' in player_data.columns else 0
-
-    # Silah istatistikleri
-    headshot_kills = player_data['headshotKills'].sum() if 'headshotKills' in player_data.columns else 0
-    longest_kill = player_data['longestKill'].max() if 'longestKill' in player_data.columns else 0
-    weapons_acquired = player_data['weaponsAcquired'].mean() if 'weaponsAcquired' in player_data.columns else 0
-
-    # K/D oranı
-    deaths = total_matches - (avg_win_place / 100 * total_matches)  # Basitleştirilmiş hesaplama
-    kd_ratio = kills / deaths if deaths > 0 else kills
-
-    return {
-        'total_matches': total_matches,
-        'win_rate': avg_win_place,
-        'kills': kills,
-        'kills_per_match': kills / total_matches if total_matches > 0 else 0,
-        'deaths': deaths,
-        'kd_ratio': kd_ratio,
-        'avg_damage': avg_damage,
-        'avg_walk_distance': avg_walk_distance,
-        'avg_ride_distance': avg_ride_distance,
-        'avg_swim_distance': avg_swim_distance,
-        'headshot_kills': headshot_kills,
-        'headshot_ratio': headshot_kills / kills if kills > 0 else 0,
-        'longest_kill': longest_kill,
-        'weapons_acquired': weapons_acquired
-    }
-
-# Oyun tarzını belirleme fonksiyonu
-def determine_playstyle(player_stats):
-    """
-    Oyuncunun istatistiklerine göre oyun tarzını belirler
-    """
-    # Agresiflik puanı hesapla
-    aggression_score = 0
-
-    # Kills ve damage yüksekse agresiflik artar
-    if player_stats['kills_per_match'] > 3:
-        aggression_score += 2
-    elif player_stats['kills_per_match'] > 1:
-        aggression_score += 1
-
-    if player_stats['avg_damage'] > 300:
-        aggression_score += 2
-    elif player_stats['avg_damage'] > 150:
-        aggression_score += 1
-
-    # Headshot oranı yüksekse agresiflik ve beceri artar
-    headshot_ratio = player_stats.get('headshot_ratio', 0)
-    if isinstance(headshot_ratio, (int, float)) and headshot_ratio > 0.3:
-        aggression_score += 1
-
-    # Hareket mesafesi fazlaysa aktif oyuncu
-    if player_stats['avg_walk_distance'] > 2500:
-        aggression_score += 1
-
-    # Playstyle belirleme
-    if aggression_score >= 4:
-        return "Çok Agresif"
-    elif aggression_score >= 2:
-        return "Agresif"
-    elif aggression_score >= 1:
-        return "Dengeli"
-    else:
-        return "Pasif"
+    player_index = PlayerIndex(df, player_id_column)
+    # Sıralanmış tablo uygulamanın veri seti olarak kullanılır (ikinci kopya tutulmaz)
+    return player_index.data, player_id_column, player_index
 
-# Silah önerileri oluşturma fonksiyonu
-def generate_weapon_suggestions(player_stats, playstyle):
+# Oyuncu arama indeksi de veri seti başına bir kez oluşturulur
+@st.cache_resource(show_spinner="Oyuncu arama indeksi hazırlanıyor...", max_entries=1)
+def load_player_search(data_path, version):
     """
-    Oyuncunun istatistiklerine ve oyun tarzına göre silah önerileri oluşturur
+    Veri setindeki tüm oyuncu ID'leri için arama indeksini oluşturur
     """
-    suggestions = {}
-
-    # Headshot oranına göre keskin nişancı silahları öner
-    headshot_ratio = player_stats.get('headshot_ratio', 0)
-    if isinstance(headshot_ratio, (int, float)) and headshot_ratio > 0.3:
-        suggestions['sniper'] = [
-            "Kar98k - Yüksek headshot oranınız bu silahla çok etkili olacaktır",
-            "M24 - Keskin nişancılık yeteneklerinizi en üst düzeye çıkarabilirsiniz",
-            "AWM - Kutu silahı olarak bulursanız mutlaka alın"
-        ]
-    else:
-        suggestions['sniper'] = [
-            "SKS - Yarı otomatik keskin nişancı tüfeği, daha az hassas nişan gerektirir",
-            "Mini14 - Hızlı atış yapabilir, headshot oranınızı artırmak için iyi bir seçenek"
-        ]
-
-    # Oyun tarzına göre assault rifle önerileri
-    if playstyle in ["Çok Agresif", "Agresif"]:
-        suggestions['assault'] = [
-            "M416 - Yüksek hasar ve kontrol için ideal",
-            "Beryl M762 - Yüksek hasar potansiyeli, kontrol edebilirseniz çok güçlü",
-            "AKM - Yüksek hasar, agresif oyun tarzı için uygun"
-        ]
-    else:
-        suggestions['assault'] = [
-            "SCAR-L - Daha kolay kontrol edilebilir, hasar potansiyelinizi artırabilir",
-            "G36C - Düşük geri tepmeli, orta mesafe çatışmalar için ideal",
-            "QBZ - Dengeli performans, pasif oyun tarzı için uygun"
-        ]
-
-    # Oyun tarzına göre yakın mesafe silahları
-    if playstyle in ["Çok Agresif"]:
-        suggestions['close_range'] = [
-            "Vector - Hızlı TTK, agresif oyun tarzı için ideal",
-            "Tommy Gun - Yüksek şarjör kapasitesi, bina baskınları için iyi"
-        ]
-    elif playstyle in ["Agresif"]:
-        suggestions['close_range'] = [
-            "UMP45 - Hareket halindeyken bile etkili",
-            "Uzi - Yakın mesafede çok hızlı, agresif oyuncular için"
-        ]
-    else:
-        suggestions['close_range'] = [
-            "S12K - Bina içi çatışmalar için güçlü",
-            "S686 - Yüksek hasar, savunma pozisyonları için iyi"
-        ]
-
-    return suggestions
+    _, _, player_index = load_dataset(data_path, version)
+    if player_index is None:
+        return None
+    return PlayerSearchIndex(player_index.labels)
 
-# İniş bölgesi önerileri oluşturma fonksiyonu
-def generate_landing_suggestions(playstyle):
+# Oyuncu bazlı toplu tablo ve nüfus yüzdelikleri veri seti sürümü başına bir
+# kez yüklenir; yeni maçlar eklendiğinde yalnızca değişen oyuncular işlenir
+@st.cache_resource(show_spinner="Oyuncu özetleri hazırlanıyor...", max_entries=1)
+def load_aggregate_store(data_path, version):
     """
-    Oyuncunun oyun tarzına göre iniş bölgesi önerileri oluşturur
+    Tüm oyuncuların toplu değerlerini ve yüzdelik sketch'lerini içeren deposu döndürür
     """
-    suggestions = {}
-
-    # Oyun tarzına göre iniş bölgeleri öner
-    if playstyle in ["Çok Agresif"]:
-        suggestions['hot_drop'] = [
-            "Pochinki - Yüksek oyuncu yoğunluğu, erken çatışmalar için ideal",
-            "School/Apartments - Hızlı loot ve çatışma imkanı",
-            "Bootcamp (Sanhok) - Yüksek riskli ama yüksek ödüllü bölge",
-            "Hacienda (Miramar) - Yüksek kaliteli loot ve erken çatışma"
-        ]
-    elif playstyle in ["Agresif"]:
-        suggestions['medium_drop'] = [
-            "Rozhok - Orta seviye çatışma, iyi loot",
-            "Yasnaya Polyana - Geniş alan, çok sayıda bina ve orta seviye çatışma",
-            "Paradise Resort (Sanhok) - Orta-yüksek risk, iyi loot",
-            "Los Leones (Miramar) - Büyük şehir, çeşitli çatışma fırsatları"
-        ]
-    else:
-        suggestions['safe_drop'] = [
-            "Gatka - Orta seviye loot, daha az oyuncu",
-            "Zharki - Uzak lokasyon, güvenli başlangıç",
-            "Kampong (Sanhok) - Dengeli loot ve daha az çatışma",
-            "Monte Nuevo (Miramar) - Sakin bölge, güvenli başlangıç"
-        ]
-
-    # Taktik önerileri
-    if playstyle in ["Çok Agresif", "Agresif"]:
-        suggestions['tactics'] = [
-            "Erken çatışmalara gir ve bölgeyi temizle",
-            "Silah sesleri duyduğunda o yöne doğru ilerle",
-            "Airdrop'ları kovala",
-            "Araçları agresif kullan ve baskın yap"
-        ]
-    else:
-        suggestions['tactics'] = [
-            "Güvenli bölgelerde loot topla",
-            "Çemberin kenarında hareket et",
-            "İyi pozisyon al ve savunmada kal",
-            "Çatışmalardan kaçın ve son çemberlere kadar hayatta kal"
-        ]
-
-    return suggestions
+    try:
+        store = AggregateStore(data_path)
+        store.refresh()
+    except (OSError, ValueError) as e:
+        print(f"Oyuncu özetleri hesaplanamadı: {e}")
+        return None
+    return store
 
-# LLM oluşturma fonksiyonu
-def get_llm():
+# Maç/takım özellikleri (takım payları, maç içi yüzdelikler) veri seti sürümü
+# başına bir kez hesaplanır; oyuncu sorguları tablodan tek satır okur
+@st.cache_resource(show_spinner="Maç ve takım özellikleri hesaplanıyor...", max_entries=1)
+def load_team_features(data_path, version):
     """
-    OpenAI LLM'i oluşturur
+    Tüm oyuncuların maç/takım özellik tablosunu döndürür, veri seti uygun değilse None
     """
-    return ChatOpenAI(
-        model="gpt-4o",
-        temperature=0.7
-    )
+    try:
+        return TeamFeatures.load(data_path)
+    except (OSError, ValueError) as e:
+        print(f"Maç/takım özellikleri hesaplanamadı: {e}")
+        return None
 
-# Ajanları oluşturma fonksiyonu
-def create_agents():
+# Benzer oyuncu indeksi de veri seti sürümü başına bir kez kurulur
+@st.cache_resource(show_spinner="Benzer oyuncu indeksi hazırlanıyor...", max_entries=1)
+def load_similar_players(data_path, version):
     """
-    Ajanları oluşturur
+    Tüm oyuncuların istatistik vektörleri üzerinde kNN indeksini kurar
     """
-    llm = get_llm()
-
-    # Analist ajanı
-    analyst_agent = Agent(
-        name="PUBG Veri Analisti",
-        role="Veri Analisti",
-        goal="PUBG oyun verilerini analiz etmek ve oyuncunun kazanma oranını hesaplamak",
-        backstory="PUBG oyun verilerinde uzmanlaşmış, oyun mekaniklerini ve istatistiklerini derinlemesine anlayan bir veri bilimci.",
-        verbose=True,
-        allow_delegation=False,
-        llm=llm
-    )
-
-    # Koç ajanı
-    coach_agent = Agent(
-        name="PUBG Oyun Koçu",
-        role="Strateji Koçu",
-        goal="Oyuncunun verilerine dayanarak kişiselleştirilmiş stratejiler ve taktikler önermek",
-        backstory="Profesyonel PUBG oyuncusu ve koçu, binlerce saatlik oyun deneyimine sahip ve oyuncuların performansını artırmada uzman.",
-        verbose=True,
-        allow_delegation=False,
-        llm=llm
-    )
-
-    return {
-        'analyst': analyst_agent,
-        'coach': coach_agent
-    }
+    store = load_aggregate_store(data_path, version)
+    if store is None:
+        return None
+    return SimilarPlayerIndex(store.all_player_stats())
 
-# Görevleri oluşturma fonksiyonu
-def create_tasks(agents, player_stats, playstyle):
+# Yüzdelik dilim metni fonksiyonu
+def percentile_delta(player_stats, key):
     """
-    Görevleri oluşturur
+    Metriğin nüfus içindeki yüzdelik dilimini st.metric delta metni olarak döndürür
     """
-    # Oyuncu istatistiklerini basit bir string olarak formatla
-    stats_summary = f"Toplam maç: {player_stats['total_matches']}, Kazanma oranı: {player_stats['win_rate']:.2f}%, K/D: {player_stats['kd_ratio']:.2f}, Öldürme: {player_stats['kills']}, Hasar: {player_stats['avg_damage']:.2f}"
-
-    # Analiz görevi
-    analyze_task = Task(
-        description=f"Oyuncunun PUBG verilerini analiz et. {stats_summary}. Oyun tarzı: {playstyle}",
-        expected_output="Oyuncunun kazanma oranı, K/D oranı ve diğer önemli istatistikler hakkında detaylı analiz",
-        agent=agents['analyst']
-    )
-
-    # Koçluk önerileri görevi
-    coaching_task = Task(
-        description=f"Oyuncunun istatistiklerine göre oyun stratejileri öner. {stats_summary}. Oyun tarzı: {playstyle}",
-        expected_output="Kişiselleştirilmiş oyun stratejileri, silah önerileri ve iniş bölgesi tavsiyeleri",
-        agent=agents['coach'],
-        dependencies=[analyze_task]
-    )
-
-    return [analyze_task, coaching_task]
+    rank = player_stats.get('percentiles', {}).get(key)
+    if rank is None:
+        return None
+    return f"{rank:.0f}. yüzdelik dilim"
 
 # Sonuçları gösterme fonksiyonu - CrewOutput için düzeltildi
-def display_results(player_stats, playstyle, weapon_suggestions, landing_suggestions, results):
+def display_results(player_stats, playstyle, weapon_suggestions, landing_suggestions, results=None,
+                    similar_players=None):
     """
-    Analiz sonuçlarını gösterir
+    Analiz sonuçlarını gösterir. results verilmezse AI Koç bölümleri için
+    yer tutucular döndürülür, sonuç hazır olunca fill_ai_sections ile doldurulur.
+    similar_players verilirse en yakın oyuncular tablosu da gösterilir.
     """
     # Sonuçları göster
     col1, col2 = st.columns(2)
 
     with col1:
         st.header("🎯 Kazanma Olasılığı")
-        st.metric("Kazanma Oranı", f"{player_stats['win_rate']:.2f}%")
+        st.metric("Kazanma Oranı", f"{player_stats['win_rate']:.2f}%",
+                  delta=percentile_delta(player_stats, 'win_rate'), delta_color="off")
+        if player_stats.get('predicted_win_rate') is not None:
+            st.metric("Model Tahmini (Random Forest)", f"{player_stats['predicted_win_rate']:.2f}%")
 
         st.header("📊 Oyuncu İstatistikleri")
 
@@ -347,20 +137,41 @@ def display_results(player_stats, playstyle, weapon_suggestions, landing_suggest
         metrics_col1, metrics_col2 = st.columns(2)
 
         with metrics_col1:
-            st.metric("K/D Oranı", f"{player_stats['kd_ratio']:.2f}")
+            st.metric("K/D Oranı", f"{player_stats['kd_ratio']:.2f}",
+                      delta=percentile_delta(player_stats, 'kd_ratio'), delta_color="off")
             st.metric("Toplam Öldürme", f"{player_stats['kills']}")
-            st.metric("Maç Başı Öldürme", f"{player_stats['kills_per_match']:.2f}")
+            st.metric("Maç Başı Öldürme", f"{player_stats['kills_per_match']:.2f}",
+                      delta=percentile_delta(player_stats, 'kills_per_match'), delta_color="off")
 
         with metrics_col2:
-            st.metric("Ortalama Hasar", f"{player_stats['avg_damage']:.2f}")
+            st.metric("Ortalama Hasar", f"{player_stats['avg_damage']:.2f}",
+                      delta=percentile_delta(player_stats, 'avg_damage'), delta_color="off")
             headshot_ratio = player_stats.get('headshot_ratio', 0)
             if isinstance(headshot_ratio, (int, float)):
-                st.metric("Headshot Oranı", f"{headshot_ratio*100:.2f}%")
+                st.metric("Headshot Oranı", f"{headshot_ratio*100:.2f}%",
+                          delta=percentile_delta(player_stats, 'headshot_ratio'), delta_color="off")
             else:
                 st.metric("Headshot Oranı", "0.00%")
-            st.metric("En Uzun Kill", f"{player_stats['longest_kill']:.2f}m")
+            st.metric("En Uzun Kill", f"{player_stats['longest_kill']:.2f}m",
+                      delta=percentile_delta(player_stats, 'longest_kill'), delta_color="off")
+
+        # Veri setindeki oyuncular için takım ve maç içi katkı
+        team = player_stats.get('team')
+        if team:
+            st.subheader("🤝 Takım ve Maç İçi Katkı")
+            team_col1, team_col2 = st.columns(2)
+            with team_col1:
+                st.metric("Takım Öldürme Payı", f"{team['team_kill_share'] * 100:.1f}%")
+                st.metric("Takım Hasar Payı", f"{team['team_damage_share'] * 100:.1f}%")
+                st.metric("Normalize Öldürme", f"{team['kills_norm']:.2f}")
+            with team_col2:
+                st.metric("Maç İçi Öldürme Yüzdeliği", f"{team['match_kill_pct'] * 100:.0f}")
+                st.metric("Maç İçi Hasar Yüzdeliği", f"{team['match_damage_pct'] * 100:.0f}")
+                st.metric("Ort. Takım Boyutu", f"{team['group_size']:.1f}")
 
         # Grafik ekle
+        import plotly.express as px
+
         st.subheader("Hareket Analizi")
         fig = px.bar(
             x=["Yürüme", "Araç", "Yüzme"],
@@ -370,6 +181,13 @@ def display_results(player_stats, playstyle, weapon_suggestions, landing_suggest
         )
         st.plotly_chart(fig)
 
+        if similar_players is not None and len(similar_players):
+            st.subheader("👥 Sana Benzeyen Oyuncular")
+            st.dataframe(similar_players.rename(columns={
+                'distance': 'Uzaklık', 'kd_ratio': 'K/D', 'kills_per_match': 'Maç Başı Kill',
+                'avg_damage': 'Ort. Hasar', 'headshot_ratio': 'Headshot Oranı', 'win_rate': 'Kazanma %'
+            }))
+
     with col2:
         st.header("🤖 Gelişmiş Koç Önerileri")
 
@@ -393,24 +211,7 @@ def display_results(player_stats, playstyle, weapon_suggestions, landing_suggest
             # AI koç önerilerini ekle
             st.write("### AI Koç Analizi")
 
-            # CrewOutput nesnesini kontrol et
-            if results:
-                # CrewOutput'un farklı yapılarını kontrol et
-                if hasattr(results, 'raw_output'):
-                    # raw_output varsa
-                    if isinstance(results.raw_output, list) and results.raw_output:
-                        st.write(results.raw_output[0])
-                    else:
-                        st.write(str(results.raw_output))
-                elif hasattr(results, 'tasks') and results.tasks:
-                    # tasks varsa
-                    st.write(results.tasks[0].output if results.tasks[0].output else "Analiz sonucu bulunamadı.")
-                elif hasattr(results, 'result'):
-                    # result varsa
-                    st.write(results.result)
-                else:
-                    # Diğer durumlar için
-                    st.write(str(results))
+            analysis_slot = st.empty()
 
         with tabs[1]:
             st.subheader("Loot, Silah ve Eklenti Önerileri")
@@ -438,24 +239,7 @@ def display_results(player_stats, playstyle, weapon_suggestions, landing_suggest
             # AI koç önerilerini ekle
             st.write("### AI Koç Silah Önerileri")
 
-            # CrewOutput nesnesini kontrol et
-            if results:
-                # CrewOutput'un farklı yapılarını kontrol et
-                if hasattr(results, 'raw_output'):
-                    # raw_output varsa ve liste ise
-                    if isinstance(results.raw_output, list) and len(results.raw_output) > 1:
-                        st.write(results.raw_output[1])
-                    elif isinstance(results.raw_output, str):
-                        st.write(results.raw_output)
-                elif hasattr(results, 'tasks') and len(results.tasks) > 1:
-                    # tasks varsa
-                    st.write(results.tasks[1].output if results.tasks[1].output else "Koçluk önerileri bulunamadı.")
-                elif hasattr(results, 'result'):
-                    # result varsa
-                    st.write(results.result)
-                else:
-                    # Diğer durumlar için
-                    st.write("Koçluk önerileri oluşturulamadı.")
+            coaching_slot = st.empty()
 
         with tabs[2]:
             st.subheader("İniş Bölgesi Önerileri")
@@ -479,6 +263,105 @@ def display_results(player_stats, playstyle, weapon_suggestions, landing_suggest
             for tactic in landing_suggestions['tactics']:
                 st.write(f"- {tactic}")
 
+    slots = {'analysis': analysis_slot, 'coaching': coaching_slot}
+    if results is None:
+        analysis_slot.info("AI Koçunuz analiz yapıyor...")
+        coaching_slot.info("AI Koçunuz analiz yapıyor...")
+    else:
+        fill_ai_sections(slots, results)
+    return slots
+
+# AI Koç bölümlerini doldurma fonksiyonu
+def fill_ai_sections(slots, results):
+    """
+    display_results'ın döndürdüğü yer tutuculara Crew çıktısını yazar
+    """
+    # Bekleme mesajlarını temizle
+    for slot in slots.values():
+        slot.empty()
+
+    # Analiz bölümü - CrewOutput nesnesini kontrol et
+    if results:
+        # CrewOutput'un farklı yapılarını kontrol et
+        if hasattr(results, 'raw_output'):
+            # raw_output varsa
+            if isinstance(results.raw_output, list) and results.raw_output:
+                slots['analysis'].write(results.raw_output[0])
+            else:
+                slots['analysis'].write(str(results.raw_output))
+        elif hasattr(results, 'tasks') and results.tasks:
+            # tasks varsa
+            slots['analysis'].write(results.tasks[0].output if results.tasks[0].output else "Analiz sonucu bulunamadı.")
+        elif hasattr(results, 'result'):
+            # result varsa
+            slots['analysis'].write(results.result)
+        else:
+            # Diğer durumlar için
+            slots['analysis'].write(str(results))
+
+    # Koçluk bölümü - CrewOutput nesnesini kontrol et
+    if results:
+        # CrewOutput'un farklı yapılarını kontrol et
+        if hasattr(results, 'raw_output'):
+            # raw_output varsa ve liste ise
+            if isinstance(results.raw_output, list) and len(results.raw_output) > 1:
+                slots['coaching'].write(results.raw_output[1])
+            elif isinstance(results.raw_output, str):
+                slots['coaching'].write(results.raw_output)
+        elif hasattr(results, 'tasks') and len(results.tasks) > 1:
+            # tasks varsa
+            slots['coaching'].write(results.tasks[1].output if results.tasks[1].output else "Koçluk önerileri bulunamadı.")
+        elif hasattr(results, 'result'):
+            # result varsa
+            slots['coaching'].write(results.result)
+        else:
+            # Diğer durumlar için
+            slots['coaching'].write("Koçluk önerileri oluşturulamadı.")
+
+# Arka plandaki koç analizini bekleyip gösterme fonksiyonu
+def render_coach_results(coach_job, slots, player_stats, playstyle, stream=None, single_pass=False):
+    """
+    Arka plan işinin sonucunu bekler ve AI Koç bölümlerini doldurur.
+    İstatistikler ve kural tabanlı öneriler bu sırada zaten ekrandadır.
+    stream verilirse token'lar geldikçe ilgili bölüme yazılır; tek geçişli
+    modda tek yanıt başlıklarına göre iki bölüme bölünerek gösterilir.
+    """
+    if stream is not None:
+        buffers = {section: "" for section in slots}
+        while not (coach_job.done() and stream.closed.is_set()):
+            changed = set()
+            for section, token in stream.drain():
+                buffers[section] += token
+                changed.add(section)
+            if single_pass and changed:
+                sections = split_sections(visible_text(buffers['analysis']))
+                for section, text in zip(['analysis', 'coaching'], sections):
+                    if text:
+                        slots[section].markdown(text + "▌")
+                continue
+            for section in changed:
+                text = visible_text(buffers[section])
+                if text:
+                    slots[section].markdown(text + "▌")
+
+    try:
+        results = coach_job.result()
+    except Exception as e:
+        st.error(f"CrewAI çalıştırılırken bir hata oluştu: {e}")
+        # Hata durumunda varsayılan sonuçlar
+        results = f"Oyuncu Analizi: {playstyle} oyun tarzına sahip bir oyuncu. K/D oranı {player_stats['kd_ratio']:.2f} ve kazanma oranı {player_stats['win_rate']:.2f}%. Koçluk Önerileri: {playstyle} oyun tarzınıza göre silah seçimlerinizi ve iniş bölgelerinizi optimize edin."
+
+    fill_ai_sections(slots, results)
+
+# Süre dağılımı paneli fonksiyonu
+def show_trace_panel(record):
+    """
+    Son analiz isteğinin aşama sürelerini kenar çubuğunda tablo olarak gösterir
+    """
+    with st.sidebar.expander("⏱️ Süre dağılımı"):
+        st.caption(f"İstek {record['id']}: toplam {record['total_seconds'] * 1000:.0f} ms")
+        st.dataframe(pd.DataFrame(breakdown(record)), hide_index=True)
+
 # Ana fonksiyon
 def main():
     """
@@ -494,12 +377,28 @@ def main():
     st.title("🏆 PUBG AI Koçu - Gelişmiş ve Gerçekçi Öneriler")
     st.subheader("Bu uygulama, PUBG performansına dayalı kazanma olasılığı ve OpenAI GPT tabanlı gelişmiş koç önerileri sunar.")
 
+    # Analiz isteğinin aşama süreleri (veri yükleme dahil)
+    trace = RequestTrace('analyze')
+
     # Veri setini yükle
-    df = load_pubg_data()
+    data_path = resolve_data_path()
+    df, player_id_column, player_index = (None, None, None)
+    if data_path is not None:
+        with trace.span('load_dataset'):
+            df, player_id_column, player_index = load_dataset(data_path, dataset_version(data_path))
     if df is None:
         st.error("Veri seti yüklenemedi. Lütfen 'pubg_final.csv' dosyasının doğru konumda olduğunu kontrol edin.")
         return
 
+    # Oyuncuların nüfus içindeki yüzdelik dilimleri ve benzer oyuncu indeksi
+    version = dataset_version(data_path)
+    with trace.span('load_population'):
+        aggregate_store = load_aggregate_store(data_path, version)
+        population = aggregate_store.percentiles if aggregate_store is not None else None
+        similar_index = load_similar_players(data_path, version)
+    with trace.span('load_team_features'):
+        team_features = load_team_features(data_path, version)
+
     # Sidebar - Oyuncu seçimi veya manuel giriş
     st.sidebar.header("Oyuncu Verileri")
 
@@ -511,6 +410,9 @@ def main():
     player_stats = {}
     playstyle = ""
 
+    # Tek geçişli mod: analiz ve koçluk tek LLM çağrısıyla, daha kısa sürede üretilir
+    single_pass = st.sidebar.checkbox("Tek geçişli AI koç (daha hızlı)", value=SINGLE_PASS_DEFAULT)
+
     if input_method == "Veri Setinden Seç":
         # Veri setindeki sütunları göster
         if st.sidebar.checkbox("Veri Seti Detaylarını Göster"):
@@ -519,75 +421,77 @@ def main():
             st.sidebar.write("Veri seti sütunları:")
             st.sidebar.write(df.columns.tolist())
 
-        # Oyuncu ID sütunu olarak kullanılabilecek bir sütun seç
-        player_id_column = None
-        possible_id_columns = ['Id', 'player_id', 'id', 'player_name', 'name', 'player']
-
-        for col in possible_id_columns:
-            if col in df.columns:
-                player_id_column = col
-                break
-
-        if player_id_column is None:
-            # Eğer uygun bir sütun bulunamazsa, indeksi kullan
-            df['player_index'] = range(len(df))
-            player_id_column = 'player_index'
+        if player_id_column == 'player_index':
             st.sidebar.warning("Veri setinde oyuncu ID sütunu bulunamadı. İndeks numaralarını kullanıyoruz.")
 
-        # Benzersiz oyuncu ID'lerini al
-        player_ids = df[player_id_column].unique().tolist()
+        # Tüm oyuncu ID'lerinde önek/alt dizgi araması, sonuçlar sayfa sayfa gösterilir
+        player_search = load_player_search(data_path, dataset_version(data_path))
+        query = st.sidebar.text_input(
+            f"Oyuncu ara ({len(player_search)} oyuncu)",
+            placeholder="ID'nin başı veya bir parçası"
+        )
+        page = st.sidebar.number_input("Sonuç sayfası", min_value=1, value=1, step=1)
+        player_ids, has_more = player_search.search(query, offset=(page - 1) * DEFAULT_PAGE_SIZE)
 
-        # Eğer çok fazla benzersiz ID varsa, sadece ilk 100'ünü göster
-        if len(player_ids) > 100:
-            player_ids = player_ids[:100]
-            st.sidebar.warning(f"Çok fazla benzersiz ID var. Sadece ilk 100 ID gösteriliyor.")
+        if not player_ids:
+            st.sidebar.warning("Aramaya uyan oyuncu bulunamadı.")
+        elif has_more:
+            st.sidebar.caption(f"Daha fazla sonuç var; aramayı daraltın veya {page + 1}. sayfaya geçin.")
 
         selected_player = st.sidebar.selectbox(
             f"Oyuncu seçin ({player_id_column})",
             options=player_ids,
-            index=0
+            index=0 if player_ids else None
         )
 
         # Analiz butonunu ekle
         if st.sidebar.button("Analiz Et ve Koç Önerilerini Al"):
-            with st.spinner("AI Koçunuz analiz yapıyor..."):
+            with traced_request(trace):
                 # Seçilen oyuncunun verilerini al
-                player_data = get_player_data(df, selected_player, player_id_column)
+                with trace.span('get_player_data'):
+                    player_data = get_player_data(df, selected_player, player_id_column, player_index)
+
+                # Oyuncu istatistikleri toplu tablodan tek satır okunur; tablo yoksa satırlardan hesaplanır
+                with trace.span('calculate_player_stats'):
+                    player_stats = (aggregate_store.get_player_stats(selected_player)
+                                    if aggregate_store is not None else None)
+                    if player_stats is None:
+                        player_stats = calculate_player_stats(player_data)
+
+                # Maç/takım bağlamı önceden hesaplanmış tablodan okunur
+                with trace.span('team_features'):
+                    player_stats['team'] = team_features.get(selected_player) if team_features is not None else None
 
-                # Oyuncu istatistiklerini hesapla
-                player_stats = calculate_player_stats(player_data)
+                # Model varsa maç bazlı kazanma olasılığını tahmin et
+                with trace.span('predict_win_rate'):
+                    player_stats['predicted_win_rate'] = predict_player_win_rate(player_data)
+
+                # Metriklerin tüm oyuncular içindeki yüzdelik dilimleri
+                with trace.span('percentiles'):
+                    player_stats['percentiles'] = population.ranks(player_stats) if population else {}
 
                 # Oyun tarzını belirle
-                playstyle = determine_playstyle(player_stats)
+                with trace.span('determine_playstyle'):
+                    playstyle = determine_playstyle(player_stats)
 
                 # Silah ve iniş önerilerini oluştur
-                weapon_suggestions = generate_weapon_suggestions(player_stats, playstyle)
-                landing_suggestions = generate_landing_suggestions(playstyle)
-
-                try:
-                    # Ajanları oluştur
-                    agents = create_agents()
-
-                    # Görevleri oluştur
-                    tasks = create_tasks(agents, player_stats, playstyle)
-
-                    # Crew'u oluştur ve çalıştır
-                    crew = Crew(
-                        agents=list(agents.values()),
-                        tasks=tasks,
-                        verbose=True,
-                        process=Process.sequential
-                    )
-
-                    # Sonuçları al
-                    results = crew.kickoff()
-                except Exception as e:
-                    st.error(f"CrewAI çalıştırılırken bir hata oluştu: {e}")
-                    # Hata durumunda varsayılan sonuçlar
-                    results = f"Oyuncu Analizi: {playstyle} oyun tarzına sahip bir oyuncu. K/D oranı {player_stats['kd_ratio']:.2f} ve kazanma oranı {player_stats['win_rate']:.2f}%. Koçluk Önerileri: {playstyle} oyun tarzınıza göre silah seçimlerinizi ve iniş bölgelerinizi optimize edin."
-
-                # Sonuçları göster
-                display_results(player_stats, playstyle, weapon_suggestions, landing_suggestions, results)
+                with trace.span('suggestions'):
+                    weapon_suggestions = generate_weapon_suggestions(player_stats, playstyle)
+                    landing_suggestions = generate_landing_suggestions(playstyle)
+
+                # LLM analizini arka planda başlat, hazır olan bölümleri hemen göster
+                stream = TokenStream()
+                coach_job = submit_coach_job(in_trace(trace, run_coach_crew), player_stats, playstyle,
+                                             stream, single_pass)
+                with trace.span('similar_players'):
+                    similar = (similar_index.neighbours_table(player_stats, exclude=selected_player)
+                               if similar_index is not None else None)
+                with trace.span('display_results'):
+                    slots = display_results(player_stats, playstyle, weapon_suggestions, landing_suggestions,
+                                            similar_players=similar)
+                with trace.span('coach_wait'):
+                    render_coach_results(coach_job, slots, player_stats, playstyle, stream, single_pass)
+            st.session_state['last_trace'] = trace.to_record()
 
     else:  # Manuel Giriş
         st.sidebar.subheader("Oyun İstatistiklerinizi Girin")
@@ -619,35 +523,41 @@ def main():
         playstyle = determine_playstyle(player_stats)
 
         if st.sidebar.button("Analiz Et ve Koç Önerilerini Al"):
-            with st.spinner("AI Koçunuz analiz yapıyor..."):
+            with traced_request(trace):
+                # Model varsa maç başı değerlerden kazanma olasılığını tahmin et
+                with trace.span('predict_win_rate'):
+                    player_stats['predicted_win_rate'] = predict_player_win_rate(stats_to_features(player_stats))
+                with trace.span('percentiles'):
+                    player_stats['percentiles'] = population.ranks(player_stats) if population else {}
+
                 # Silah ve iniş önerilerini oluştur
-                weapon_suggestions = generate_weapon_suggestions(player_stats, playstyle)
-                landing_suggestions = generate_landing_suggestions(playstyle)
-
-                try:
-                    # Ajanları oluştur
-                    agents = create_agents()
-
-                    # Görevleri oluştur
-                    tasks = create_tasks(agents, player_stats, playstyle)
-
-                    # Crew'u oluştur ve çalıştır
-                    crew = Crew(
-                        agents=list(agents.values()),
-                        tasks=tasks,
-                        verbose=True,
-                        process=Process.sequential
-                    )
-
-                    # Sonuçları al
-                    results = crew.kickoff()
-                except Exception as e:
-                    st.error(f"CrewAI çalıştırılırken bir hata oluştu: {e}")
-                    # Hata durumunda varsayılan sonuçlar
-                    results = f"Oyuncu Analizi: {playstyle} oyun tarzına sahip bir oyuncu. K/D oranı {player_stats['kd_ratio']:.2f} ve kazanma oranı {player_stats['win_rate']:.2f}%. Koçluk Önerileri: {playstyle} oyun tarzınıza göre silah seçimlerinizi ve iniş bölgelerinizi optimize edin."
-
-                # Sonuçları göster
-                display_results(player_stats, playstyle, weapon_suggestions, landing_suggestions, results)
+                with trace.span('suggestions'):
+                    weapon_suggestions = generate_weapon_suggestions(player_stats, playstyle)
+                    landing_suggestions = generate_landing_suggestions(playstyle)
+
+                # LLM analizini arka planda başlat, hazır olan bölümleri hemen göster
+                stream = TokenStream()
+                coach_job = submit_coach_job(in_trace(trace, run_coach_crew), player_stats, playstyle,
+                                             stream, single_pass)
+                with trace.span('similar_players'):
+                    similar = similar_index.neighbours_table(player_stats) if similar_index is not None else None
+                with trace.span('display_results'):
+                    slots = display_results(player_stats, playstyle, weapon_suggestions, landing_suggestions,
+                                            similar_players=similar)
+                with trace.span('coach_wait'):
+                    render_coach_results(coach_job, slots, player_stats, playstyle, stream, single_pass)
+            st.session_state['last_trace'] = trace.to_record()
+
+    # Koç yanıt önbelleği sayaçları (süreç genelinde)
+    cache_stats = get_response_cache().stats()
+    st.sidebar.caption(
+        f"Koç önbelleği: {cache_stats['hits']} isabet, {cache_stats['misses']} ıska, "
+        f"{cache_stats['entries']} kayıt"
+    )
+
+    # Gizli hata ayıklama paneli (PUBG_COACH_DEBUG=1): son analizin süre dağılımı
+    if DEBUG_PANEL and 'last_trace' in st.session_state:
+        show_trace_panel(st.session_state['last_trace'])
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,61 @@
+import threading
+
+from tools.agent_registry import AGENT_FILES, AgentRegistry, load_agent_definitions
+
+def _registry(calls):
+    def llm_factory():
+        calls.append('llm')
+        return object()
+
+    # CrewAI kurulu olmadan ajan yerine (tanım, llm) çifti döndürülür
+    return AgentRegistry(llm_factory, agent_factory=lambda definition, llm: (definition, llm))
+
+def test_llm_and_definitions_are_created_once():
+    calls = []
+    registry = _registry(calls)
+    first, second = registry.get_agents(), registry.get_agents()
+    assert calls == ['llm']
+    assert set(first) == set(AGENT_FILES)
+    assert first['coach'][1] is second['coach'][1]
+    assert first['coach'][0] is second['coach'][0]
+    # Ajan nesneleri istekler arasında paylaşılmaz
+    assert first['coach'] is not second['coach']
+
+def test_definitions_match_yaml_files():
+    definitions = _registry([]).get_definitions()
+    assert definitions == load_agent_definitions()
+    for definition in definitions.values():
+        assert {'name', 'role', 'goal', 'backstory'} <= set(definition)
+
+def test_compact_definitions_are_separate_and_shorter():
+    registry = _registry([])
+    full, compact = registry.get_definitions(), registry.get_definitions(compact=True)
+    assert compact is registry.get_definitions(compact=True)
+    for key in AGENT_FILES:
+        assert len(compact[key]['backstory']) < len(full[key]['backstory'])
+    # Kısaltma tam tanımları değiştirmez
+    assert full == load_agent_definitions()
+
+def test_concurrent_first_use_builds_llm_once():
+    calls = []
+    registry = _registry(calls)
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        registry.get_agents()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert calls == ['llm']
+
+def test_reset_rebuilds():
+    calls = []
+    registry = _registry(calls)
+    registry.get_llm()
+    registry.reset()
+    registry.get_llm()
+    assert calls == ['llm', 'llm']
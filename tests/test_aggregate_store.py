@@ -0,0 +1,90 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_data import write_synthetic_csv
+from tools.aggregate_store import HEAD_HASH_BYTES, META_FILE, AggregateStore
+from tools.bulk_stats import calculate_all_player_stats
+from tools.player_core import APP_COLUMNS, calculate_player_stats, find_id_column, load_pubg_data
+
+def _expected_stats(csv_path):
+    """
+    Tüm CSV'den toplu yoldan hesaplanan istatistikler
+    """
+    df = load_pubg_data(str(csv_path), columns=APP_COLUMNS, use_cache=False)
+    return calculate_all_player_stats(df, find_id_column(df))
+
+def _assert_same_stats(store, csv_path):
+    actual = store.all_player_stats()
+    expected = _expected_stats(csv_path)
+    actual.index = actual.index.astype(str)
+    expected.index = expected.index.astype(str)
+    actual = actual.loc[expected.index]
+    assert len(actual) == len(expected)
+    np.testing.assert_allclose(actual['kills'].to_numpy(np.float64), expected['kills'].to_numpy(np.float64))
+    np.testing.assert_allclose(actual['avg_damage'].to_numpy(np.float64),
+                               expected['avg_damage'].to_numpy(np.float64), rtol=1e-5)
+
+@pytest.fixture()
+def csv_path(tmp_path):
+    path = tmp_path / 'pubg.csv'
+    write_synthetic_csv(str(path), 6000, players=300, seed=3)
+    assert path.stat().st_size > 3 * HEAD_HASH_BYTES
+    return path
+
+def test_refresh_reads_only_appended_rows(csv_path):
+    store = AggregateStore(str(csv_path))
+    assert store.refresh() == 6000
+
+    lines = csv_path.read_text(encoding='utf-8').splitlines(keepends=True)
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.writelines(lines[1:101])
+    assert AggregateStore(str(csv_path)).refresh() == 100
+    _assert_same_stats(AggregateStore(str(csv_path)), csv_path)
+
+def test_rewrite_with_same_head_triggers_rebuild(csv_path):
+    store = AggregateStore(str(csv_path))
+    store.refresh()
+
+    # Baş ve boyut aynı kalır, son satırlar değişir: ekleme sanılmamalı
+    df = pd.read_csv(csv_path)
+    df.loc[df.index[-50:], 'kills'] = (df['kills'].iloc[-50:] + 1) % 10
+    df.to_csv(csv_path, index=False)
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.write(df.iloc[[0]].to_csv(index=False, header=False))
+
+    store = AggregateStore(str(csv_path))
+    assert store.refresh() == len(df) + 1
+    _assert_same_stats(store, csv_path)
+
+def test_player_lookup_matches_scalar_stats(csv_path):
+    store = AggregateStore(str(csv_path))
+    store.refresh()
+    df = load_pubg_data(str(csv_path), columns=APP_COLUMNS, use_cache=False)
+    id_column = find_id_column(df)
+    for player_id in df[id_column].unique()[:20]:
+        stats = store.get_player_stats(player_id)
+        assert stats == calculate_player_stats(df[df[id_column] == player_id])
+        assert all(type(value) in (int, float) for value in stats.values())
+    assert store.get_player_stats('bilinmeyen-oyuncu') is None
+
+def test_interrupted_save_triggers_rebuild(csv_path):
+    AggregateStore(str(csv_path)).refresh()
+    meta_path = os.path.join(str(csv_path) + '.aggregates', META_FILE)
+    with open(meta_path, encoding='utf-8') as f:
+        old_meta = f.read()
+
+    # Tablo yeni satırlarla yazıldı ama meta.json yazılamadan süreç durdu
+    lines = csv_path.read_text(encoding='utf-8').splitlines(keepends=True)
+    with open(csv_path, 'a', encoding='utf-8') as f:
+        f.writelines(lines[1:101])
+    AggregateStore(str(csv_path)).refresh()
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        f.write(old_meta)
+
+    # Eklenen satırlar ikinci kez sayılmamalı
+    store = AggregateStore(str(csv_path))
+    assert store.refresh() == 6100
+    _assert_same_stats(store, csv_path)
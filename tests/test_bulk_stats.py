@@ -0,0 +1,35 @@
+import pytest
+
+from benchmarks.synthetic_data import write_synthetic_csv
+from tools.bulk_stats import (
+    PLAYSTYLES, calculate_all_player_stats, classify_playstyles, compare_playstyles, compare_with_scalar
+)
+from tools.player_core import (
+    APP_COLUMNS, calculate_player_stats, determine_playstyle, find_id_column, load_pubg_data
+)
+
+@pytest.fixture(scope='module')
+def dataset(tmp_path_factory):
+    """
+    Sentetik veri setini uygulamanın şemasıyla (önbelleksiz) yükler
+    """
+    path = tmp_path_factory.mktemp('data') / 'pubg_synthetic.csv'
+    write_synthetic_csv(str(path), 4000, players=200, seed=7)
+    df = load_pubg_data(str(path), columns=APP_COLUMNS, use_cache=False)
+    return df, find_id_column(df)
+
+def test_bulk_stats_match_scalar(dataset):
+    df, id_column = dataset
+    stats = calculate_all_player_stats(df, id_column)
+    assert len(stats) == df[id_column].nunique()
+    assert compare_with_scalar(df, id_column, stats, calculate_player_stats) == []
+
+def test_bulk_playstyles_match_scalar(dataset):
+    df, id_column = dataset
+    stats = calculate_all_player_stats(df, id_column)
+    playstyles = classify_playstyles(stats)
+    assert len(playstyles) == len(stats)
+    # Sentetik veri birden fazla oyun tarzı üretmeli, aksi halde karşılaştırma anlamsız olur
+    assert playstyles.nunique() > 1
+    assert set(playstyles.unique()) <= set(PLAYSTYLES)
+    assert compare_playstyles(stats, playstyles, determine_playstyle) == []
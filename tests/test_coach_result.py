@@ -0,0 +1,49 @@
+import pytest
+
+from tools.coach_result import CoachResult, extract_task_outputs, split_sections
+
+def test_no_headings_go_to_analysis():
+    assert split_sections("  K/D oranın yüksek.\n\nDaha çok çemberde kal.  ") == [
+        "K/D oranın yüksek.\n\nDaha çok çemberde kal.", ""]
+    assert split_sections("") == ["", ""]
+
+@pytest.mark.parametrize('analysis_heading, coaching_heading', [
+    ("### ANALİZ", "### KOÇLUK"),
+    ("**Analiz**", "**Koçluk:**"),
+    ("ANALIZ:", "KOCLUK"),
+    ("## analiz", "## koçluk")
+])
+def test_heading_variants(analysis_heading, coaching_heading):
+    text = f"{analysis_heading}\nK/D: 2.1\n{coaching_heading}\nM416 kullan."
+    assert split_sections(text) == ["K/D: 2.1", "M416 kullan."]
+
+def test_text_before_analysis_heading_is_dropped():
+    text = "Final Answer:\n### ANALİZ\nK/D: 2.1\n### KOÇLUK\nM416 kullan."
+    assert split_sections(text) == ["K/D: 2.1", "M416 kullan."]
+
+def test_text_before_lone_coaching_heading_is_analysis():
+    text = "K/D oranın 2.1, ortalamanın üstünde.\n### KOÇLUK\nM416 kullan."
+    assert split_sections(text) == ["K/D oranın 2.1, ortalamanın üstünde.", "M416 kullan."]
+
+def test_repeated_headings_are_joined_as_paragraphs():
+    text = "### ANALİZ\nbir\n### KOÇLUK\niki\n### ANALİZ\nüç"
+    assert split_sections(text) == ["bir\n\nüç", "iki"]
+
+def test_heading_words_inside_sentences_are_not_headings():
+    text = "Bu analiz kısa.\nKoçluk önerim: daha az sıcak iniş."
+    assert split_sections(text) == [text, ""]
+
+class _Output:
+    def __init__(self, raw):
+        self.raw = raw
+
+class _Task:
+    def __init__(self, output):
+        self.output = output
+
+def test_extract_task_outputs():
+    tasks = [_Task(_Output("analiz")), _Task(_Output("koçluk"))]
+    assert extract_task_outputs("genel", tasks) == ["analiz", "koçluk"]
+    # Görev çıktısı yoksa Crew'un genel çıktısı kullanılır
+    assert extract_task_outputs("genel", [_Task(None), _Task(None)]) == ["genel"]
+    assert str(CoachResult(["analiz", "koçluk"])) == "analiz\n\nkoçluk"
@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+from tools.coach_scheduler import CallTimeout, CoachScheduler, is_retryable
+
+class StatusError(Exception):
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.headers = {'retry-after': retry_after} if retry_after is not None else {}
+
+def _scheduler(run_fn, **kwargs):
+    # Hız sınırı kapalı, geri çekilme beklemesiz
+    kwargs.setdefault('requests_per_minute', None)
+    kwargs.setdefault('backoff_base', 0.0)
+    return CoachScheduler(run_fn, **kwargs)
+
+def test_retryable_errors_are_retried():
+    failures = [StatusError(429, retry_after='0'), StatusError(503), ConnectionError()]
+
+    def run(x):
+        if failures:
+            raise failures.pop(0)
+        return x * 2
+
+    scheduler = _scheduler(run, max_retries=3)
+    assert scheduler.run_one(21) == 42
+    assert scheduler.stats['retries'] == 3
+
+@pytest.mark.parametrize('status, expected_calls', [(500, 3), (400, 1)])
+def test_retries_are_limited_and_permanent_errors_fail_fast(status, expected_calls):
+    calls = []
+
+    def run():
+        calls.append(1)
+        raise StatusError(status)
+
+    with pytest.raises(StatusError):
+        _scheduler(run, max_retries=2).run_one()
+    assert len(calls) == expected_calls
+
+def test_timeout_is_not_retried_and_keeps_its_slot():
+    release = threading.Event()
+    calls = []
+
+    def run():
+        calls.append(1)
+        release.wait(5)
+        return 'geç'
+
+    scheduler = _scheduler(run, concurrency=1, timeout=0.05, max_retries=3)
+    with pytest.raises(CallTimeout):
+        scheduler.run_one()
+    assert len(calls) == 1
+    assert scheduler.stats['timeouts'] == 1
+    # Bırakılan çağrı bitene kadar eşzamanlılık yeri dolu kalır
+    assert not scheduler.slots.acquire(blocking=False)
+    release.set()
+    assert scheduler.slots.acquire(timeout=5)
+    scheduler.slots.release()
+
+def test_run_respects_concurrency_and_reports_every_job():
+    running, peak = [0], [0]
+    lock = threading.Lock()
+
+    def run(i):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        if i == 3:
+            raise ValueError("bozuk oyuncu")
+        return i
+
+    scheduler = _scheduler(run, concurrency=3)
+    results = {key: (output, error) for key, output, error in scheduler.run((i, (i,)) for i in range(12))}
+    assert sorted(results) == list(range(12))
+    assert isinstance(results[3][1], ValueError)
+    assert all(results[i] == (i, None) for i in range(12) if i != 3)
+    assert peak[0] <= 3
+    assert scheduler.stats['completed'] == 11 and scheduler.stats['failed'] == 1
+
+def test_is_retryable():
+    assert is_retryable(StatusError(429))
+    assert is_retryable(TimeoutError())
+    assert not is_retryable(StatusError(401))
+    assert not is_retryable(ValueError())
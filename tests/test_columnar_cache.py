@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic_data import write_synthetic_csv
+from tools.columnar_cache import build_columnar_cache, load_columnar
+from tools.player_core import APP_COLUMNS, load_pubg_data
+from tools.schema import PUBG_SCHEMA
+
+def test_cached_and_csv_dtypes_match(tmp_path):
+    path = str(tmp_path / 'pubg.csv')
+    write_synthetic_csv(path, 2000, players=100, seed=1)
+    cached = load_pubg_data(path, columns=APP_COLUMNS)
+    from_csv = load_pubg_data(path, columns=APP_COLUMNS, use_cache=False)
+
+    assert list(cached.columns) == list(from_csv.columns)
+    for column, dtype in PUBG_SCHEMA.items():
+        assert str(cached[column].dtype) == dtype
+        assert str(from_csv[column].dtype) == dtype
+
+def test_chunked_build_matches_csv(tmp_path):
+    path = str(tmp_path / 'pubg.csv')
+    write_synthetic_csv(path, 2000, players=100, seed=2)
+    cache_dir = str(tmp_path / 'cache')
+    build_columnar_cache(path, cache_dir, chunksize=300)
+    cached = load_columnar(path, cache_dir=cache_dir)
+
+    # Önbellek oyuncu ID'sine göre sıralıdır; CSV'den okunan tablo da aynı sıraya getirilir
+    from_csv = load_pubg_data(path, use_cache=False)
+    order = np.argsort(from_csv['Id'].cat.codes.to_numpy(), kind='stable')
+    expected = from_csv.take(order).reset_index(drop=True)
+    assert list(cached.columns) == list(expected.columns)
+    for column in expected.columns:
+        if isinstance(expected[column].dtype, pd.CategoricalDtype):
+            assert list(cached[column].cat.categories) == list(expected[column].cat.categories)
+            cached_values, expected_values = cached[column].cat.codes, expected[column].cat.codes
+        else:
+            assert cached[column].dtype == expected[column].dtype
+            cached_values, expected_values = cached[column], expected[column]
+        # Önbellek sütunları mmap olduğu için değerler dizi olarak karşılaştırılır
+        np.testing.assert_array_equal(np.asarray(cached_values), np.asarray(expected_values))
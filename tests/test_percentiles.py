@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from benchmarks.synthetic_data import write_synthetic_csv
+from tools.bulk_stats import calculate_all_player_stats
+from tools.percentiles import PERCENTILE_METRICS, PopulationPercentiles
+from tools.player_core import APP_COLUMNS, find_id_column, load_pubg_data
+
+@pytest.fixture(scope='module')
+def stats(tmp_path_factory):
+    """
+    Sentetik veri setindeki tüm oyuncuların istatistik tablosu
+    """
+    path = tmp_path_factory.mktemp('data') / 'pubg_synthetic.csv'
+    write_synthetic_csv(str(path), 20_000, players=2000, seed=11)
+    df = load_pubg_data(str(path), columns=APP_COLUMNS, use_cache=False)
+    return calculate_all_player_stats(df, find_id_column(df))
+
+def _bin(sketch, value):
+    return int(np.clip(np.searchsorted(sketch.edges, value, side='right') - 1, 0, len(sketch.counts) - 1))
+
+def test_percentile_rank_within_one_bin_of_exact(stats):
+    population = PopulationPercentiles.from_stats(stats)
+    for metric in PERCENTILE_METRICS:
+        sketch = population.sketches[metric]
+        values = stats[metric].dropna()
+        exact = values.rank(pct=True)
+        for value, expected in zip(values.to_numpy()[:500], exact.to_numpy()[:500]):
+            # Hata, değerin düştüğü kutudaki oyuncu payını aşmamalı
+            tolerance = sketch.counts[_bin(sketch, value)] / sketch.total
+            assert abs(sketch.percentile_rank(value) / 100 - expected) <= tolerance + 1e-9, metric
+
+def test_quantile_within_one_bin_of_exact(stats):
+    population = PopulationPercentiles.from_stats(stats)
+    for metric in PERCENTILE_METRICS:
+        sketch = population.sketches[metric]
+        values = stats[metric].dropna().to_numpy(np.float64)
+        for q in (0.1, 0.25, 0.5, 0.75, 0.9, 0.99):
+            # Dönen değerin altında kalan gerçek oyuncu payı q'dan en fazla bir kutu kadar sapar
+            value = sketch.quantile(q)
+            tolerance = sketch.counts[_bin(sketch, value)] / sketch.total + 1 / len(values)
+            assert abs((values <= value).mean() - q) <= tolerance, (metric, q)
+
+def test_merge_matches_single_build(stats):
+    half = len(stats) // 2
+    merged = PopulationPercentiles.from_stats(stats.iloc[:half]).merge(
+        PopulationPercentiles.from_stats(stats.iloc[half:]))
+    full = PopulationPercentiles.from_stats(stats)
+    for metric in PERCENTILE_METRICS:
+        np.testing.assert_array_equal(merged.sketches[metric].counts, full.sketches[metric].counts)
+    player = stats.iloc[0].to_dict()
+    assert merged.ranks(player) == full.ranks(player)
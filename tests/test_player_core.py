@@ -0,0 +1,16 @@
+import json
+
+from benchmarks.synthetic_data import write_synthetic_csv
+from tools.player_core import APP_COLUMNS, calculate_player_stats, find_id_column, load_pubg_data
+
+def test_player_stats_are_plain_python_numbers(tmp_path):
+    path = str(tmp_path / 'pubg.csv')
+    write_synthetic_csv(path, 500, players=20, seed=5)
+    df = load_pubg_data(path, columns=APP_COLUMNS)
+    id_column = find_id_column(df)
+    player_id = df[id_column].iloc[0]
+
+    stats = calculate_player_stats(df[df[id_column] == player_id])
+    assert all(type(value) in (int, float) for value in stats.values())
+    # float32 şemasından gelen değerler JSON'a yazılabilmeli
+    json.dumps(stats)
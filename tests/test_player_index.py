@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tools.player_core import get_player_data
+from tools.player_index import PlayerIndex
+
+@pytest.fixture()
+def df():
+    # Sırasız ID'ler, eksik ID'li bir satır ve hiç satırı olmayan bir kategori
+    ids = pd.Categorical(['b', 'a', 'c', 'a', None, 'b', 'a'], categories=['a', 'b', 'c', 'd'])
+    return pd.DataFrame({'Id': ids, 'kills': np.arange(7, dtype=np.int16)})
+
+def test_lookup_matches_boolean_mask(df):
+    index = PlayerIndex(df, 'Id')
+    for player_id in ['a', 'b', 'c']:
+        expected = df[df['Id'] == player_id]
+        # Satırlar kararlı sıralandığı için oyuncunun kendi satır sırası korunur
+        assert index.lookup(player_id)['kills'].tolist() == expected['kills'].tolist()
+        assert get_player_data(df, player_id, 'Id', index)['kills'].tolist() == expected['kills'].tolist()
+
+def test_missing_players(df):
+    index = PlayerIndex(df, 'Id')
+    assert 'd' not in index
+    assert 'x' not in index
+    assert index.lookup(None) is None
+    assert len(index) == 4
+
+def test_text_ids_are_factorized(df):
+    df = df.assign(Id=df['Id'].astype(object))
+    index = PlayerIndex(df, 'Id')
+    assert index.lookup('a')['kills'].tolist() == [1, 3, 6]
+
+def test_sorted_data_is_not_copied(df):
+    df = df.iloc[np.argsort(df['Id'].cat.codes.to_numpy(), kind='stable')]
+    index = PlayerIndex(df, 'Id')
+    assert index.data is df
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from tools.player_search import PlayerSearchIndex
+
+@pytest.fixture(scope='module')
+def ids():
+    rng = np.random.default_rng(0)
+    return [''.join(rng.choice(list('0123456789abcdef'), 8)) for _ in range(2000)]
+
+def _expected(ids, query):
+    """
+    Tüm ID'leri tarayan referans arama: önce önek, sonra alt dizgi eşleşmeleri (sıralı)
+    """
+    query = query.lower()
+    ordered = sorted(ids, key=str.lower)
+    prefix = [i for i in ordered if i.lower().startswith(query)]
+    inner = [i for i in ordered if query in i.lower() and not i.lower().startswith(query)]
+    return prefix + inner
+
+@pytest.mark.parametrize('query', ['', 'a', 'ab', 'f0', '7', 'abc', 'zz'])
+def test_pages_match_full_scan(ids, query):
+    index = PlayerSearchIndex(ids)
+    expected = _expected(ids, query)
+    results, offset = [], 0
+    while True:
+        page, has_more = index.search(query, limit=50, offset=offset)
+        results += page
+        offset += 50
+        if not has_more:
+            break
+    assert results == expected
+
+def test_case_insensitive_and_non_ascii(ids):
+    index = PlayerSearchIndex(ids)
+    assert index.search(' AB ', limit=10) == index.search('ab', limit=10)
+    assert index.search('ğ') == ([], False)
+
+def test_unicode_ids():
+    index = PlayerSearchIndex(['Çağrı', 'ali', 'Veli', 'çiğdem'])
+    assert index.search('ç')[0] == ['Çağrı', 'çiğdem']
+    assert index.search('li')[0] == ['ali', 'Veli']
@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+from tools.agent_registry import load_agent_definitions
+from tools.player_core import build_stats_summary
+from tools.prompt_budget import (
+    COMPACT_BACKSTORY_WORDS, COMPACT_MAX_ITER, COMPACTION_LEVELS, PROMPT_OVERHEAD_TOKENS,
+    compact_definition, estimate_task_prompt, fit_to_budget
+)
+
+PLAYER_STATS = {
+    'total_matches': 42, 'win_rate': 12.345, 'kd_ratio': 2.345, 'kills': 98, 'avg_damage': 245.67,
+    'team': {'team_kill_share': 0.41, 'team_damage_share': 0.38, 'match_damage_pct': 0.87, 'group_size': 3.2}
+}
+
+def _build(calls):
+    """
+    create_tasks'ın CrewAI'siz karşılığı: seviye 1'de kısa özet, seviye 2'de sade ajanlar
+    """
+    definitions = load_agent_definitions()
+
+    def build(level):
+        calls.append(level)
+        agents = {key: SimpleNamespace(**(compact_definition(d) if level >= 2 else d))
+                  for key, d in definitions.items()}
+        summary = build_stats_summary(PLAYER_STATS, compact=level >= 1)
+        tasks = [SimpleNamespace(description=f"Analiz et. {summary}", expected_output="Detaylı analiz",
+                                 agent=agents['analyst']),
+                 SimpleNamespace(description=f"Strateji öner. {summary}", expected_output="Öneriler",
+                                 agent=agents['coach'])]
+        return agents, tasks
+    return build
+
+def _estimates():
+    build = _build([])
+    return [max(estimate_task_prompt(task) for task in build(level)[1]) for level in range(len(COMPACTION_LEVELS))]
+
+def test_each_level_is_smaller():
+    estimates = _estimates()
+    assert estimates[0] > estimates[1] > estimates[2] > PROMPT_OVERHEAD_TOKENS
+
+def test_no_budget_keeps_full_prompt():
+    calls = []
+    level, _, estimate = fit_to_budget(_build(calls), 0)
+    assert (level, calls, estimate) == (0, [0], _estimates()[0])
+
+def test_first_level_that_fits_is_chosen():
+    estimates = _estimates()
+    for expected_level, budget in enumerate(estimates):
+        calls = []
+        level, _, estimate = fit_to_budget(_build(calls), budget)
+        assert (level, estimate) == (expected_level, estimates[expected_level])
+        # Sığan seviyeden sonrası oluşturulmaz
+        assert calls == list(range(expected_level + 1))
+
+def test_most_compact_level_when_nothing_fits():
+    level, _, estimate = fit_to_budget(_build([]), 1)
+    assert COMPACTION_LEVELS[level] == 'compact_agents'
+    assert estimate == _estimates()[-1]
+
+def test_compact_definition():
+    for definition in load_agent_definitions().values():
+        original = dict(definition)
+        compact = compact_definition(definition)
+        assert definition == original
+        assert len(compact['backstory'].split()) <= COMPACT_BACKSTORY_WORDS
+        assert compact['backstory'].endswith('.')
+        assert (compact['verbose'], compact['max_iter']) == (False, COMPACT_MAX_ITER)
+        assert (compact['role'], compact['goal']) == (definition['role'], definition['goal'])
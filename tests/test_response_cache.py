@@ -0,0 +1,53 @@
+import pytest
+
+from tools import response_cache
+from tools.response_cache import ResponseCache, make_cache_key
+
+@pytest.fixture()
+def cache(tmp_path):
+    return ResponseCache(str(tmp_path / 'coach_cache.sqlite'), ttl_seconds=60, max_entries=3)
+
+def test_hit_and_miss(cache):
+    key = make_cache_key(["Analiz görevi", "Koçluk görevi"], 'gpt-4o', 0.7)
+    assert cache.get(key) is None
+    cache.put(key, ["analiz", "koçluk"])
+    assert cache.get(key) == ["analiz", "koçluk"]
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+
+def test_key_covers_prompt_model_and_temperature():
+    key = make_cache_key(["Analiz görevi", "Koçluk görevi"], 'gpt-4o', 0.7)
+    assert key == make_cache_key(("Analiz görevi", "Koçluk görevi"), 'gpt-4o', 0.7)
+    assert key != make_cache_key(["Analiz görevi", "Koçluk görevi!"], 'gpt-4o', 0.7)
+    assert key != make_cache_key(["Koçluk görevi", "Analiz görevi"], 'gpt-4o', 0.7)
+    assert key != make_cache_key(["Analiz görevi", "Koçluk görevi"], 'gpt-4o-mini', 0.7)
+    assert key != make_cache_key(["Analiz görevi", "Koçluk görevi"], 'gpt-4o', 0.2)
+
+def test_expired_entries_are_misses(cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, 'time', lambda: now[0])
+    cache.put('k', ["eski"])
+    now[0] += 61
+    assert cache.get('k') is None
+    assert cache.stats()['entries'] == 0
+
+def test_least_recently_used_entries_are_evicted(cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, 'time', lambda: now[0])
+    for key in ['a', 'b', 'c']:
+        now[0] += 1
+        cache.put(key, [key])
+    now[0] += 1
+    cache.get('a')
+    now[0] += 1
+    cache.put('d', ['d'])
+    # 'b' en uzun süredir kullanılmayan kayıttır
+    assert cache.get('b') is None
+    assert [cache.get(key) for key in ['a', 'c', 'd']] == [['a'], ['c'], ['d']]
+
+def test_size_limit_evicts(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'coach_cache.sqlite'), max_bytes=100)
+    cache.put('a', ["x" * 60])
+    cache.put('b', ["y" * 60])
+    assert cache.get('a') is None
+    assert cache.get('b') == ["y" * 60]
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tools.similar_players import SIMILARITY_FEATURES, SimilarPlayerIndex
+
+@pytest.fixture(scope='module')
+def stats():
+    rng = np.random.default_rng(4)
+    n = 500
+    table = pd.DataFrame({name: rng.gamma(2.0, 1.0, n) for name in SIMILARITY_FEATURES},
+                         index=pd.Index([f'p{i:03d}' for i in range(n)], name='Id'))
+    table['headshot_ratio'] = rng.beta(2, 6, n)
+    return table
+
+def test_query_matches_brute_force(stats):
+    index = SimilarPlayerIndex(stats)
+    vectors = index.vectors(stats).astype(np.float64)
+    for row in [0, 17, 250]:
+        player = stats.iloc[row].to_dict()
+        distances = np.sqrt(((vectors - vectors[row]) ** 2).sum(axis=1))
+        expected = [stats.index[i] for i in np.argsort(distances, kind='stable') if i != row][:5]
+        neighbours = index.query(player, k=5, exclude=stats.index[row])
+        assert [player_id for player_id, _ in neighbours] == expected
+        np.testing.assert_allclose([dist for _, dist in neighbours],
+                                   np.sort(distances[distances > 0])[:5], rtol=1e-5)
+
+def test_neighbours_table_and_missing_values(stats):
+    index = SimilarPlayerIndex(stats)
+    # Eksik veya NaN istatistikler 0 kabul edilir
+    table = index.neighbours_table({'kd_ratio': float('nan'), 'avg_damage': 120.0}, k=3)
+    assert len(table) == 3
+    assert list(table.columns)[0] == 'distance'
+    assert table['distance'].is_monotonic_increasing
+
+def test_small_population():
+    stats = pd.DataFrame({name: [1.0] for name in SIMILARITY_FEATURES}, index=['tek'])
+    index = SimilarPlayerIndex(stats)
+    assert index.query(stats.iloc[0].to_dict(), k=5, exclude='tek') == []
@@ -0,0 +1,21 @@
+import numpy as np
+
+from benchmarks.synthetic_data import write_synthetic_csv
+from tools.bulk_stats import STATS_KEYS, calculate_all_player_stats
+from tools.player_core import APP_COLUMNS, find_id_column, load_pubg_data
+from tools.streaming_agg import stream_player_stats
+
+def test_streaming_matches_in_memory(tmp_path):
+    path = str(tmp_path / 'pubg.csv')
+    write_synthetic_csv(path, 20_000, players=500, seed=3)
+    df = load_pubg_data(path, columns=APP_COLUMNS, use_cache=False)
+    expected = calculate_all_player_stats(df, find_id_column(df))
+
+    # Küçük bütçe: CSV ~1000 satırlık parçalarla okunur, ara tablolar defalarca birleştirilir
+    stats, summary = stream_player_stats(path, memory_budget_mb=0.5)
+    assert summary['n_rows'] == len(df)
+    assert summary['n_players'] == len(expected)
+    stats = stats.loc[expected.index]
+    for key in STATS_KEYS:
+        np.testing.assert_allclose(stats[key].to_numpy(np.float64), expected[key].to_numpy(np.float64),
+                                   rtol=1e-9)
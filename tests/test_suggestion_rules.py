@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tools.player_core import generate_landing_suggestions, generate_weapon_suggestions
+from tools.suggestion_rules import get_suggestion_rules
+
+# Kurallar YAML'a taşınmadan önceki if zincirlerinin çıktıları (değiştirilmemeli)
+SNIPER_HEADSHOT = [
+    "Kar98k - Yüksek headshot oranınız bu silahla çok etkili olacaktır",
+    "M24 - Keskin nişancılık yeteneklerinizi en üst düzeye çıkarabilirsiniz",
+    "AWM - Kutu silahı olarak bulursanız mutlaka alın"
+]
+SNIPER_DEFAULT = [
+    "SKS - Yarı otomatik keskin nişancı tüfeği, daha az hassas nişan gerektirir",
+    "Mini14 - Hızlı atış yapabilir, headshot oranınızı artırmak için iyi bir seçenek"
+]
+ASSAULT_AGGRESSIVE = [
+    "M416 - Yüksek hasar ve kontrol için ideal",
+    "Beryl M762 - Yüksek hasar potansiyeli, kontrol edebilirseniz çok güçlü",
+    "AKM - Yüksek hasar, agresif oyun tarzı için uygun"
+]
+ASSAULT_DEFAULT = [
+    "SCAR-L - Daha kolay kontrol edilebilir, hasar potansiyelinizi artırabilir",
+    "G36C - Düşük geri tepmeli, orta mesafe çatışmalar için ideal",
+    "QBZ - Dengeli performans, pasif oyun tarzı için uygun"
+]
+CLOSE_VERY_AGGRESSIVE = [
+    "Vector - Hızlı TTK, agresif oyun tarzı için ideal",
+    "Tommy Gun - Yüksek şarjör kapasitesi, bina baskınları için iyi"
+]
+CLOSE_AGGRESSIVE = [
+    "UMP45 - Hareket halindeyken bile etkili",
+    "Uzi - Yakın mesafede çok hızlı, agresif oyuncular için"
+]
+CLOSE_DEFAULT = [
+    "S12K - Bina içi çatışmalar için güçlü",
+    "S686 - Yüksek hasar, savunma pozisyonları için iyi"
+]
+HOT_DROP = [
+    "Pochinki - Yüksek oyuncu yoğunluğu, erken çatışmalar için ideal",
+    "School/Apartments - Hızlı loot ve çatışma imkanı",
+    "Bootcamp (Sanhok) - Yüksek riskli ama yüksek ödüllü bölge",
+    "Hacienda (Miramar) - Yüksek kaliteli loot ve erken çatışma"
+]
+MEDIUM_DROP = [
+    "Rozhok - Orta seviye çatışma, iyi loot",
+    "Yasnaya Polyana - Geniş alan, çok sayıda bina ve orta seviye çatışma",
+    "Paradise Resort (Sanhok) - Orta-yüksek risk, iyi loot",
+    "Los Leones (Miramar) - Büyük şehir, çeşitli çatışma fırsatları"
+]
+SAFE_DROP = [
+    "Gatka - Orta seviye loot, daha az oyuncu",
+    "Zharki - Uzak lokasyon, güvenli başlangıç",
+    "Kampong (Sanhok) - Dengeli loot ve daha az çatışma",
+    "Monte Nuevo (Miramar) - Sakin bölge, güvenli başlangıç"
+]
+TACTICS_AGGRESSIVE = [
+    "Erken çatışmalara gir ve bölgeyi temizle",
+    "Silah sesleri duyduğunda o yöne doğru ilerle",
+    "Airdrop'ları kovala",
+    "Araçları agresif kullan ve baskın yap"
+]
+TACTICS_DEFAULT = [
+    "Güvenli bölgelerde loot topla",
+    "Çemberin kenarında hareket et",
+    "İyi pozisyon al ve savunmada kal",
+    "Çatışmalardan kaçın ve son çemberlere kadar hayatta kal"
+]
+
+# (istatistikler, headshot önerisi bekleniyor mu)
+STATS_CASES = [
+    ({'headshot_ratio': 0.45, 'kd_ratio': 3.2, 'win_rate': 12.5}, True),
+    ({'headshot_ratio': 0.31}, True),
+    ({'headshot_ratio': 0.3}, False),
+    ({'headshot_ratio': 0.0, 'kills': 0}, False),
+    ({}, False),
+    ({'headshot_ratio': float('nan')}, False),
+    ({'headshot_ratio': np.float64(0.5)}, True),
+    # Eski zincir yalnızca int/float değerleri karşılaştırıyordu
+    ({'headshot_ratio': np.float32(0.9)}, False),
+    ({'headshot_ratio': '0.5'}, False),
+    ({'headshot_ratio': None}, False),
+    ({'headshot_ratio': True}, True)
+]
+
+# oyun tarzı -> (assault, close_range, iniş anahtarı, iniş önerileri, taktikler)
+PLAYSTYLE_CASES = {
+    "Çok Agresif": (ASSAULT_AGGRESSIVE, CLOSE_VERY_AGGRESSIVE, 'hot_drop', HOT_DROP, TACTICS_AGGRESSIVE),
+    "Agresif": (ASSAULT_AGGRESSIVE, CLOSE_AGGRESSIVE, 'medium_drop', MEDIUM_DROP, TACTICS_AGGRESSIVE),
+    "Dengeli": (ASSAULT_DEFAULT, CLOSE_DEFAULT, 'safe_drop', SAFE_DROP, TACTICS_DEFAULT),
+    "Pasif": (ASSAULT_DEFAULT, CLOSE_DEFAULT, 'safe_drop', SAFE_DROP, TACTICS_DEFAULT),
+    "": (ASSAULT_DEFAULT, CLOSE_DEFAULT, 'safe_drop', SAFE_DROP, TACTICS_DEFAULT)
+}
+
+@pytest.mark.parametrize('playstyle', list(PLAYSTYLE_CASES))
+@pytest.mark.parametrize('player_stats, headshot', STATS_CASES)
+def test_weapon_suggestions_match_baseline(player_stats, headshot, playstyle):
+    assault, close_range = PLAYSTYLE_CASES[playstyle][:2]
+    suggestions = generate_weapon_suggestions(player_stats, playstyle)
+    assert list(suggestions) == ['sniper', 'assault', 'close_range']
+    assert suggestions == {
+        'sniper': SNIPER_HEADSHOT if headshot else SNIPER_DEFAULT,
+        'assault': assault,
+        'close_range': close_range
+    }
+
+@pytest.mark.parametrize('playstyle', list(PLAYSTYLE_CASES))
+def test_landing_suggestions_match_baseline(playstyle):
+    drop_key, drops, tactics = PLAYSTYLE_CASES[playstyle][2:]
+    suggestions = generate_landing_suggestions(playstyle)
+    assert list(suggestions) == [drop_key, 'tactics']
+    assert suggestions == {drop_key: drops, 'tactics': tactics}
+
+def test_bulk_evaluation_matches_baseline():
+    # Toplu yol float64 tablolarla çalışır; eksik değer NaN olur
+    numeric = [(stats, headshot) for stats, headshot in STATS_CASES
+               if type(stats.get('headshot_ratio', 0.0)) in (float, np.float64)]
+    rows = [(stats.get('headshot_ratio', np.nan), headshot, playstyle)
+            for stats, headshot in numeric for playstyle in PLAYSTYLE_CASES]
+    table = pd.DataFrame({'headshot_ratio': [row[0] for row in rows], 'playstyle': [row[2] for row in rows]})
+
+    rules = get_suggestion_rules()
+    weapon = rules['weapon'].evaluate(table)
+    landing = rules['landing'].evaluate(table)
+    for i, (_, headshot, playstyle) in enumerate(rows):
+        assault, close_range, drop_key, drops, tactics = PLAYSTYLE_CASES[playstyle]
+        assert rules['weapon'].materialize(weapon.iloc[i]) == {
+            'sniper': SNIPER_HEADSHOT if headshot else SNIPER_DEFAULT,
+            'assault': assault,
+            'close_range': close_range
+        }
+        assert rules['landing'].materialize(landing.iloc[i]) == {drop_key: drops, 'tactics': tactics}
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_data import write_synthetic_csv
+from tools.team_features import TEAM_FEATURES, TeamFeatures, aggregate_player_features, compute_row_features, rank_within
+
+def _frame():
+    # İki maç: m1'de iki takım (g1: 2 kişi, g2: 1 kişi), m2'de tek kişilik takım
+    return pd.DataFrame({
+        'Id': pd.Categorical(['a', 'b', 'c', 'a']),
+        'matchId': pd.Categorical(['m1', 'm1', 'm1', 'm2']),
+        'groupId': pd.Categorical(['g1', 'g1', 'g2', 'g3']),
+        'kills': [3, 1, 1, 0],
+        'damageDealt': [300.0, 100.0, 50.0, 0.0]
+    })
+
+def test_rank_within_groups_and_ties():
+    keys = np.array([0, 0, 0, 1, 1])
+    values = np.array([5.0, 7.0, 5.0, 1.0, 2.0])
+    assert rank_within(keys, values).tolist() == [2, 1, 2, 2, 1]
+
+def test_row_features_match_hand_computed_values():
+    features = compute_row_features(_frame())
+    np.testing.assert_allclose(features['team_kill_share'], [0.75, 0.25, 1.0, 0.0])
+    np.testing.assert_allclose(features['team_damage_share'], [0.75, 0.25, 1.0, 0.0])
+    # Maç içi yüzdelik: en iyi 1, en kötü 0; eşitler aynı sırayı alır, tek kişilik maç 1
+    np.testing.assert_allclose(features['match_kill_pct'], [1.0, 0.5, 0.5, 1.0])
+    np.testing.assert_allclose(features['match_damage_pct'], [1.0, 0.5, 0.0, 1.0])
+    np.testing.assert_allclose(features['kills_norm'], [3 * 1.97, 1.97, 1.97, 0.0])
+    np.testing.assert_allclose(features['match_size'], [3, 3, 3, 1])
+    np.testing.assert_allclose(features['group_size'], [2, 2, 1, 1])
+
+def test_missing_ids_are_skipped():
+    df = _frame()
+    df['matchId'] = pd.Categorical(['m1', 'm1', None, 'm2'])
+    features = compute_row_features(df)
+    assert np.isnan(features['match_size'][2])
+    assert features['match_size'][[0, 1, 3]].tolist() == [2, 2, 1]
+
+def test_player_means():
+    table = aggregate_player_features(_frame(), 'Id')
+    assert list(table.columns) == TEAM_FEATURES
+    assert table.loc['a', 'team_kill_share'] == pytest.approx(0.375)
+    assert table.loc['a', 'match_size'] == pytest.approx(2.0)
+
+def test_load_caches_per_dataset_version(tmp_path):
+    path = str(tmp_path / 'pubg.csv')
+    write_synthetic_csv(path, 3000, players=100, seed=9)
+    features = TeamFeatures.load(path)
+    player_id = features.table.index[0]
+    row = features.get(player_id)
+    assert set(row) == set(TEAM_FEATURES)
+    assert 0.0 <= row['team_kill_share'] <= 1.0
+    assert features.get('bilinmeyen-oyuncu') is None
+
+    # İkinci yükleme kayıtlı tabloyu okur
+    assert TeamFeatures.load(path).table.equals(features.table)
@@ -0,0 +1,116 @@
+import os
+import threading
+
+import yaml
+
+from tools.prompt_budget import compact_definition
+
+# Ajan tanımlarının bulunduğu klasör ve anahtar -> dosya eşlemesi
+AGENTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'agents')
+AGENT_FILES = {
+    'analyst': 'analyst_agent.yaml',
+    'coach': 'coach_agent.yaml'
+}
+
+def load_agent_definitions(agents_dir=AGENTS_DIR):
+    """
+    agents/*.yaml dosyalarındaki ajan tanımlarını okur
+    """
+    definitions = {}
+    for key, file_name in AGENT_FILES.items():
+        with open(os.path.join(agents_dir, file_name), encoding='utf-8') as f:
+            definitions[key] = yaml.safe_load(f)
+    return definitions
+
+def build_agent(definition, llm):
+    """
+    YAML tanımından CrewAI ajanı oluşturur
+    """
+    from crewai import Agent
+
+    options = {'max_iter': definition['max_iter']} if 'max_iter' in definition else {}
+    return Agent(
+        name=definition['name'],
+        role=definition['role'],
+        goal=definition['goal'],
+        backstory=definition['backstory'],
+        verbose=definition.get('verbose', True),
+        allow_delegation=definition.get('allow_delegation', False),
+        llm=llm,
+        **options
+    )
+
+class AgentRegistry:
+    """
+    LLM istemcisini ve ayrıştırılmış ajan tanımlarını ilk ihtiyaçta bir kez
+    oluşturup süreç boyunca tüm isteklerle paylaşır. CrewAI ajanları çalışma
+    sırasında durum tuttuğu için (crew, executor, görev) Agent nesneleri ucuz
+    tanımlardan istek başına oluşturulur; eşzamanlı ekipler ajan paylaşmaz.
+    """
+
+    def __init__(self, llm_factory, agents_dir=AGENTS_DIR, agent_factory=build_agent):
+        self.llm_factory = llm_factory
+        self.agents_dir = agents_dir
+        self.agent_factory = agent_factory
+        self._lock = threading.Lock()
+        self._llm = None
+        self._definitions = None
+        self._compact_definitions = None
+
+    def get_llm(self):
+        """
+        Paylaşılan LLM istemcisini döndürür
+        """
+        if self._llm is None:
+            with self._lock:
+                if self._llm is None:
+                    self._llm = self.llm_factory()
+        return self._llm
+
+    def get_definitions(self, compact=False):
+        """
+        agents/*.yaml tanımlarını bir kez okuyup döndürür. compact=True ise
+        token bütçesi için istemi kısaltılmış tanımlar döner.
+        """
+        attribute = '_compact_definitions' if compact else '_definitions'
+        if getattr(self, attribute) is None:
+            with self._lock:
+                if getattr(self, attribute) is None:
+                    definitions = load_agent_definitions(self.agents_dir)
+                    if compact:
+                        definitions = {key: compact_definition(definition)
+                                       for key, definition in definitions.items()}
+                    setattr(self, attribute, definitions)
+        return getattr(self, attribute)
+
+    def get_agents(self, compact=False):
+        """
+        Bu istek için yeni ajanları {'analyst': ..., 'coach': ...} olarak
+        döndürür. LLM ve tanımlar paylaşılır, Agent nesneleri paylaşılmaz.
+        """
+        llm = self.get_llm()
+        return {key: self.agent_factory(definition, llm)
+                for key, definition in self.get_definitions(compact).items()}
+
+    def reset(self):
+        """
+        LLM ve ajan tanımlarını bırakır, bir sonraki istekte yeniden oluşturulurlar
+        """
+        with self._lock:
+            self._llm = None
+            self._definitions = None
+            self._compact_definitions = None
+
+_registry = None
+_registry_lock = threading.Lock()
+
+def get_agent_registry(llm_factory):
+    """
+    Süreç genelindeki tek AgentRegistry örneğini döndürür
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = AgentRegistry(llm_factory)
+    return _registry
@@ -0,0 +1,222 @@
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+from tools.bulk_stats import aggregate_player_rows, derive_player_stats, merge_aggregates
+from tools.percentiles import PopulationPercentiles
+from tools.schema import apply_schema, csv_dtypes
+from tools.streaming_agg import aggregate_chunks, stream_columns
+
+# Dosya başı ve işlenen son bayttan önceki bölümün özetlerinin hesaplandığı
+# bayt sayısı (CSV yeniden yazıldı mı kontrolü)
+HEAD_HASH_BYTES = 64 * 1024
+STORE_VERSION = 3
+
+# Kayıt dosyaları; meta.json en son yazılır, diğerleri onunla tutarlı olmalıdır
+AGGREGATES_FILE = 'aggregates.pkl'
+PERCENTILES_FILE = 'percentiles.npz'
+META_FILE = 'meta.json'
+
+def _head_hash(csv_path, limit):
+    """
+    Dosyanın ilk `limit` baytının SHA-1 özetini döndürür
+    """
+    with open(csv_path, 'rb') as f:
+        return hashlib.sha1(f.read(min(limit, HEAD_HASH_BYTES))).hexdigest()
+
+def _tail_hash(csv_path, offset):
+    """
+    Dosyada `offset` baytından önceki son HEAD_HASH_BYTES baytın SHA-1 özetini
+    döndürür. Baş aynı kalsa da dosyanın ortası/sonu yeniden yazıldıysa değişir.
+    """
+    start = max(0, offset - HEAD_HASH_BYTES)
+    with open(csv_path, 'rb') as f:
+        f.seek(start)
+        return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+def _schema_chunks(reader):
+    """
+    CSV parçalarını uygulamanın geri kalanıyla aynı şemaya çevirir
+    """
+    for chunk in reader:
+        yield apply_schema(chunk)
+
+def _write_atomically(path, write):
+    """
+    write(f) ile dosyayı aynı klasörde benzersiz adlı geçici bir dosyaya yazar
+    ve tek adımda path'in yerine taşır. Aynı anda yazan süreçler birbirinin
+    geçici dosyasını ezmez, okuyucular yarım yazılmış dosya görmez.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+def _ends_with_newline(csv_path, size):
+    """
+    Dosyanın tam bir satırla bitip bitmediğini kontrol eder
+    """
+    if size == 0:
+        return True
+    with open(csv_path, 'rb') as f:
+        f.seek(size - 1)
+        return f.read(1) == b'\n'
+
+class AggregateStore:
+    """
+    Oyuncu başına toplam, sayım ve en büyük değerleri diskte saklayan tablo.
+    CSV'ye yeni maçlar eklendiğinde yalnızca eklenen satırlar okunur.
+    Nüfus yüzdelik sketch'leri de tabloyla birlikte güncel tutulur.
+    """
+
+    def __init__(self, csv_path, store_dir=None, id_column=None, chunksize=500_000):
+        self.csv_path = csv_path
+        self.store_dir = store_dir or os.path.abspath(csv_path) + '.aggregates'
+        self.id_column = id_column
+        self.chunksize = chunksize
+        self.meta = None
+        self.aggregates = None
+        self.percentiles = None
+        self._load()
+
+    def _load(self):
+        """
+        Kayıtlı tabloyu ve meta veriyi okur
+        """
+        try:
+            with open(os.path.join(self.store_dir, META_FILE), encoding='utf-8') as f:
+                self.meta = json.load(f)
+            self.aggregates = pd.read_pickle(os.path.join(self.store_dir, AGGREGATES_FILE))
+        except (OSError, ValueError):
+            self.meta, self.aggregates = None, None
+            return
+        # Kayıt yarıda kaldıysa tablo meta.json'dan yeni olabilir; satır sayıları
+        # tutmuyorsa kayıt yok sayılır ve refresh tabloyu baştan oluşturur
+        if int(self.aggregates['rows'].sum()) != self.meta.get('player_rows'):
+            self.meta, self.aggregates = None, None
+            return
+        self.percentiles = PopulationPercentiles.load(os.path.join(self.store_dir, PERCENTILES_FILE))
+        if self.percentiles is None:
+            # Sketch dosyası yoksa CSV'yi taramadan kayıtlı tablodan oluştur
+            self.percentiles = PopulationPercentiles.from_stats(derive_player_stats(self.aggregates))
+
+    def _save(self):
+        """
+        Tabloyu, sketch'leri ve meta veriyi diske yazar. Her dosya ayrı ayrı
+        atomik olarak değiştirilir; meta.json en son yazılır.
+        """
+        os.makedirs(self.store_dir, exist_ok=True)
+        # Tablo ile meta verinin aynı kayda ait olduğunu _load bu sayıyla kontrol eder
+        self.meta['player_rows'] = int(self.aggregates['rows'].sum())
+        _write_atomically(os.path.join(self.store_dir, AGGREGATES_FILE), self.aggregates.to_pickle)
+        _write_atomically(os.path.join(self.store_dir, PERCENTILES_FILE), self.percentiles.save)
+        _write_atomically(os.path.join(self.store_dir, META_FILE),
+                          lambda f: f.write(json.dumps(self.meta).encode('utf-8')))
+
+    def _can_update_incrementally(self, size):
+        """
+        Kayıtlı tablonun yalnızca eklenen satırlarla güncellenip güncellenemeyeceğini kontrol eder
+        """
+        meta = self.meta
+        return (meta is not None and self.aggregates is not None
+                and meta.get('version') == STORE_VERSION
+                and meta.get('ends_with_newline')
+                and size >= meta['offset']
+                and _head_hash(self.csv_path, meta['offset']) == meta['head_hash']
+                and _tail_hash(self.csv_path, meta['offset']) == meta['tail_hash'])
+
+    def rebuild(self):
+        """
+        Tabloyu tüm CSV'den baştan oluşturur
+        """
+        size = os.path.getsize(self.csv_path)
+        header = pd.read_csv(self.csv_path, nrows=0).columns.tolist()
+        id_column, usecols = stream_columns(header, self.id_column)
+        reader = pd.read_csv(self.csv_path, usecols=usecols, chunksize=self.chunksize,
+                             dtype=csv_dtypes(usecols))
+        self.aggregates, n_rows = aggregate_chunks(_schema_chunks(reader), id_column)
+        if self.aggregates is None:
+            self.aggregates = aggregate_player_rows(pd.DataFrame(columns=usecols), id_column)
+        self.percentiles = PopulationPercentiles.from_stats(derive_player_stats(self.aggregates))
+        self.meta = {
+            'version': STORE_VERSION,
+            'id_column': id_column,
+            'header': header,
+            'offset': size,
+            'n_rows': n_rows,
+            'ends_with_newline': _ends_with_newline(self.csv_path, size),
+            'head_hash': _head_hash(self.csv_path, size),
+            'tail_hash': _tail_hash(self.csv_path, size)
+        }
+        self._save()
+        return n_rows
+
+    def refresh(self):
+        """
+        CSV'ye eklenen satırları tabloya işler ve işlenen yeni satır sayısını
+        döndürür. CSV baştan değiştiyse tablo yeniden oluşturulur.
+        """
+        size = os.path.getsize(self.csv_path)
+        if not self._can_update_incrementally(size):
+            return self.rebuild()
+        if size == self.meta['offset']:
+            return 0
+
+        # Sadece son işlenen bayttan sonrasını oku
+        id_column, usecols = stream_columns(self.meta['header'], self.id_column)
+        with open(self.csv_path, 'rb') as f:
+            f.seek(self.meta['offset'])
+            reader = pd.read_csv(f, header=None, names=self.meta['header'],
+                                 usecols=usecols, chunksize=self.chunksize, dtype=csv_dtypes(usecols))
+            new_aggregates, n_rows = aggregate_chunks(_schema_chunks(reader), id_column)
+
+        if new_aggregates is not None:
+            # Yalnızca yeni maçı olan oyuncuların sketch değerleri değişir
+            changed = new_aggregates.index
+            old_stats = derive_player_stats(self.aggregates.loc[self.aggregates.index.intersection(changed)])
+            self.aggregates = merge_aggregates([self.aggregates, new_aggregates])
+            self.percentiles.update(old_stats, derive_player_stats(self.aggregates.loc[changed]))
+        self.meta.update({
+            'offset': size,
+            'n_rows': self.meta['n_rows'] + n_rows,
+            'ends_with_newline': _ends_with_newline(self.csv_path, size),
+            'head_hash': _head_hash(self.csv_path, size),
+            'tail_hash': _tail_hash(self.csv_path, size)
+        })
+        self._save()
+        return n_rows
+
+    def get_player_stats(self, player_id):
+        """
+        Oyuncunun istatistiklerini tek satır okuyarak calculate_player_stats
+        biçiminde döndürür, oyuncu yoksa None
+        """
+        if self.aggregates is None or player_id not in self.aggregates.index:
+            return None
+        stats = derive_player_stats(self.aggregates.loc[[player_id]])
+        # Sütun bazında okuyarak tamsayı sütunların tipini koru; değerler
+        # calculate_player_stats gibi Python sayıları olarak döner
+        return {key: stats[key].iloc[0].item() for key in stats.columns}
+
+    def all_player_stats(self):
+        """
+        Tüm oyuncuların istatistik tablosunu döndürür
+        """
+        return derive_player_stats(self.aggregates)
+
+if __name__ == "__main__":
+    # Günlük güncelleme: python -m tools.aggregate_store pubg_final.csv
+    store = AggregateStore(sys.argv[1] if len(sys.argv) > 1 else 'pubg_final.csv')
+    new_rows = store.refresh()
+    print(f"{new_rows} yeni satır işlendi, toplam {store.meta['n_rows']} satır, "
+          f"{len(store.aggregates)} oyuncu.")
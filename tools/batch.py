@@ -0,0 +1,229 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from tools.bulk_stats import STATS_KEYS
+from tools.coach_crew import run_coach_crew
+from tools.coach_scheduler import (
+    DEFAULT_CONCURRENCY, DEFAULT_REQUESTS_PER_MINUTE, DEFAULT_TIMEOUT_SECONDS, CoachScheduler
+)
+from tools.columnar_cache import ensure_columnar_cache
+from tools.player_core import (
+    APP_COLUMNS, calculate_player_stats, determine_playstyle, find_id_column,
+    generate_landing_suggestions, generate_weapon_suggestions, load_pubg_data
+)
+from tools.player_index import PlayerIndex
+from tools.team_features import TeamFeatures
+
+# CSV raporunun sütunları
+REPORT_FIELDS = (['player_id', 'found', 'playstyle'] + STATS_KEYS
+                 + ['team', 'weapon_suggestions', 'landing_suggestions', 'coach_output', 'coach_error'])
+
+# Her işçi sürecinde bir kez yüklenen durum
+_worker = {}
+
+def _init_worker(data_path):
+    """
+    İşçi sürecinde veri setini ve oyuncu indeksini bir kez yükler
+    """
+    df = load_pubg_data(data_path, columns=APP_COLUMNS)
+    if df is None:
+        raise RuntimeError(f"Veri seti yüklenemedi: {data_path}")
+    id_column = find_id_column(df)
+    if id_column is None:
+        raise RuntimeError("Veri setinde oyuncu ID sütunu bulunamadı.")
+
+    _worker.update(player_index=PlayerIndex(df, id_column), team_features=load_team_features(data_path))
+
+def load_team_features(data_path):
+    """
+    Maç/takım özelliklerini yükler; hesaplanamazsa toplu iş durmaz, özellikler atlanır
+    """
+    try:
+        return TeamFeatures.load(data_path)
+    except (OSError, ValueError) as e:
+        print(f"Maç/takım özellikleri hesaplanamadı: {e}", file=sys.stderr)
+        return None
+
+def _to_builtin(value):
+    """
+    numpy skalerlerini JSON/CSV'ye yazılabilir Python tiplerine çevirir
+    """
+    return value.item() if hasattr(value, 'item') else value
+
+def analyze_player(player_id):
+    """
+    Tek bir oyuncuyu Streamlit olmadan analiz eder ve rapor satırını döndürür
+    """
+    player_data = _worker['player_index'].lookup(player_id)
+    if player_data is None:
+        return {'player_id': player_id, 'found': False}
+
+    player_stats = calculate_player_stats(player_data)
+    team_features = _worker.get('team_features')
+    if team_features is not None:
+        player_stats['team'] = team_features.get(player_id)
+    playstyle = determine_playstyle(player_stats)
+
+    record = {'player_id': player_id, 'found': True, 'playstyle': playstyle}
+    record.update({key: _to_builtin(value) for key, value in player_stats.items()})
+    record['weapon_suggestions'] = generate_weapon_suggestions(player_stats, playstyle)
+    record['landing_suggestions'] = generate_landing_suggestions(playstyle)
+    return record
+
+def analyze_players(player_ids):
+    """
+    Bir grup oyuncuyu aynı işçide analiz eder
+    """
+    return [analyze_player(player_id) for player_id in player_ids]
+
+def read_player_ids(path):
+    """
+    Her satırda bir oyuncu ID'si bulunan dosyayı okur
+    """
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+def _chunks(items, size):
+    """
+    Listeyi sabit boyutlu parçalara böler
+    """
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+class ReportWriter:
+    """
+    Rapor satırlarını geldikçe diske yazar (.jsonl veya .csv)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.format = 'csv' if path.endswith('.csv') else 'jsonl'
+        self.file = open(path, 'w', encoding='utf-8', newline='')
+        self.csv_writer = None
+        if self.format == 'csv':
+            self.csv_writer = csv.DictWriter(self.file, fieldnames=REPORT_FIELDS, restval='')
+            self.csv_writer.writeheader()
+
+    def write(self, record):
+        if self.format == 'jsonl':
+            self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            return
+
+        # CSV'de iç içe öneri sözlükleri JSON metni olarak yazılır
+        row = {key: json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else value
+               for key, value in record.items()}
+        self.csv_writer.writerow(row)
+
+    def close(self):
+        self.file.close()
+
+def _coach_jobs(records, writer):
+    """
+    Bulunan oyuncuları koç zamanlayıcısına iş olarak verir, bulunamayanları doğrudan yazar
+    """
+    for record in records:
+        if not record.get('found'):
+            writer.write(record)
+            continue
+        player_stats = {key: record[key] for key in STATS_KEYS + ['team'] if key in record}
+        yield record, (player_stats, record['playstyle'])
+
+def run_coaching(records, writer, concurrency=DEFAULT_CONCURRENCY,
+                 requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE, timeout=DEFAULT_TIMEOUT_SECONDS,
+                 single_pass=False):
+    """
+    Rapor satırları için CrewAI koç analizlerini eşzamanlı çalıştırır ve
+    biten her satırı hemen yazar (bitiş sırasıyla). Koç analizi hata verirse
+    satır coach_error ile yine yazılır. Zamanlayıcı sayaçlarını döndürür.
+    """
+    # Her Crew çalışması analist + koç için iki, tek geçişli modda bir LLM isteği yapar
+    scheduler = CoachScheduler(
+        lambda stats, playstyle: str(run_coach_crew(stats, playstyle, single_pass=single_pass)),
+        concurrency=concurrency, requests_per_minute=requests_per_minute,
+        timeout=timeout, calls_per_job=1 if single_pass else 2
+    )
+    for record, output, error in scheduler.run(_coach_jobs(records, writer)):
+        if error is not None:
+            record['coach_error'] = str(error)
+        else:
+            record['coach_output'] = output
+        writer.write(record)
+    return scheduler.stats
+
+def run_batch(player_ids, out_path, data_path='pubg_final.csv', workers=None,
+              chunk_size=256, with_llm=False, llm_concurrency=DEFAULT_CONCURRENCY,
+              llm_rpm=DEFAULT_REQUESTS_PER_MINUTE, llm_timeout=DEFAULT_TIMEOUT_SECONDS,
+              llm_single_pass=False):
+    """
+    Oyuncuları süreç havuzunda analiz eder, sonuçları sırayla diske yazar ve
+    (işlenen oyuncu sayısı, geçen süre) döndürür. with_llm açıkken koç
+    analizleri ana süreçte CoachScheduler ile eşzamanlı çalıştırılır.
+    """
+    workers = workers or os.cpu_count() or 1
+    # Önbelleği ve maç/takım özelliklerini işçiler başlamadan bir kez oluştur; işçiler yalnızca okur
+    if os.path.exists(data_path):
+        ensure_columnar_cache(data_path)
+        load_team_features(data_path)
+    writer = ReportWriter(out_path)
+    start = time.perf_counter()
+    done = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(data_path,)) as pool:
+            batches = pool.map(analyze_players, _chunks(player_ids, chunk_size))
+            records = (record for batch in batches for record in batch)
+            if with_llm:
+                stats = run_coaching(records, writer, llm_concurrency, llm_rpm, llm_timeout,
+                                     single_pass=llm_single_pass)
+                done = len(player_ids)
+                print(f"Koç analizleri: {stats['completed']} başarılı, {stats['failed']} hatalı, "
+                      f"{stats['retries']} tekrar deneme", file=sys.stderr)
+            else:
+                for record in records:
+                    writer.write(record)
+                    done += 1
+    finally:
+        writer.close()
+    return done, time.perf_counter() - start
+
+def main(argv=None):
+    """
+    Komut satırı giriş noktası
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.batch',
+        description="Streamlit olmadan çok sayıda oyuncuyu analiz eder."
+    )
+    parser.add_argument('--players', required=True, help="Her satırda bir oyuncu ID'si olan dosya")
+    parser.add_argument('--out', required=True, help="Çıktı dosyası (.jsonl veya .csv)")
+    parser.add_argument('--data', default='pubg_final.csv', help="Veri seti yolu")
+    parser.add_argument('--workers', type=int, default=None, help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('--chunk-size', type=int, default=256, help="İşçiye tek seferde gönderilen oyuncu sayısı")
+    parser.add_argument('--llm', action='store_true', help="Her oyuncu için CrewAI koç analizini de çalıştır")
+    parser.add_argument('--llm-concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help="Aynı anda çalışan koç analizi sayısı")
+    parser.add_argument('--llm-rpm', type=float, default=DEFAULT_REQUESTS_PER_MINUTE,
+                        help="Dakikalık LLM isteği sınırı (0: sınırsız)")
+    parser.add_argument('--llm-timeout', type=float, default=DEFAULT_TIMEOUT_SECONDS,
+                        help="Tek bir koç analizi için en uzun süre (sn)")
+    parser.add_argument('--llm-single-pass', action='store_true',
+                        help="Analiz ve koçluk bölümlerini tek LLM çağrısında üret")
+    args = parser.parse_args(argv)
+
+    player_ids = read_player_ids(args.players)
+    done, elapsed = run_batch(player_ids, args.out, data_path=args.data, workers=args.workers,
+                              chunk_size=args.chunk_size, with_llm=args.llm,
+                              llm_concurrency=args.llm_concurrency, llm_rpm=args.llm_rpm,
+                              llm_timeout=args.llm_timeout, llm_single_pass=args.llm_single_pass)
+    rate = done / elapsed if elapsed > 0 else 0
+    print(f"{done} oyuncu {elapsed:.2f} sn'de işlendi ({rate:.1f} oyuncu/sn) -> {args.out}",
+          file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
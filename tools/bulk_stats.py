@@ -0,0 +1,175 @@
+import numpy as np
+import pandas as pd
+
+# Ortalaması alınan sütunlar ve calculate_player_stats içindeki karşılıkları
+MEAN_COLUMNS = {
+    'winPlacePerc': 'win_rate',
+    'damageDealt': 'avg_damage',
+    'walkDistance': 'avg_walk_distance',
+    'rideDistance': 'avg_ride_distance',
+    'swimDistance': 'avg_swim_distance',
+    'weaponsAcquired': 'weapons_acquired'
+}
+
+# Toplamı alınan sütunlar
+SUM_COLUMNS = {
+    'kills': 'kills',
+    'headshotKills': 'headshot_kills'
+}
+
+# En büyük değeri alınan sütunlar
+MAX_COLUMNS = {
+    'longestKill': 'longest_kill'
+}
+
+# determine_playstyle çıktıları, agresiflik puanına göre artan sırada
+PLAYSTYLES = ["Pasif", "Dengeli", "Agresif", "Çok Agresif"]
+
+# calculate_player_stats ile aynı anahtar sırası
+STATS_KEYS = [
+    'total_matches', 'win_rate', 'kills', 'kills_per_match', 'deaths', 'kd_ratio',
+    'avg_damage', 'avg_walk_distance', 'avg_ride_distance', 'avg_swim_distance',
+    'headshot_kills', 'headshot_ratio', 'longest_kill', 'weapons_acquired'
+]
+
+def aggregate_player_rows(df, id_column):
+    """
+    Tüm oyuncular için toplam, sayım ve en büyük değerleri tek bir gruplama
+    geçişiyle hesaplar. Sonuç oyuncu ID'sine göre indekslenir.
+    """
+    grouped = df.groupby(id_column, observed=True)
+    agg = pd.DataFrame({'rows': grouped.size()})
+
+    for col in list(MEAN_COLUMNS) + list(SUM_COLUMNS):
+        if col in df.columns:
+            if df[col].dtype == np.float32:
+                # float32 sütunlar toplanırken hassasiyet kaybı olmaması için float64 kullanılır
+                agg[f'{col}_sum'] = df[col].astype(np.float64).groupby(df[id_column], observed=True).sum()
+            else:
+                agg[f'{col}_sum'] = grouped[col].sum()
+            agg[f'{col}_count'] = grouped[col].count()
+
+    for col in MAX_COLUMNS:
+        if col in df.columns:
+            agg[f'{col}_max'] = grouped[col].max()
+
+    return agg
+
+def merge_aggregates(aggs):
+    """
+    Ayrı veri parçalarından hesaplanmış toplu tabloları birleştirir.
+    Toplam/sayım sütunları toplanır, _max sütunlarının en büyüğü alınır.
+    """
+    combined = pd.concat(aggs)
+    grouped = combined.groupby(level=0, observed=True)
+    max_cols = [c for c in combined.columns if c.endswith('_max')]
+    sum_cols = [c for c in combined.columns if c not in max_cols]
+
+    merged = grouped[sum_cols].sum()
+    for col in max_cols:
+        merged[col] = grouped[col].max()
+    merged.index.name = combined.index.name
+    return merged
+
+def _column_mean(agg, col):
+    """
+    Toplam/sayım sütunlarından ortalamayı hesaplar, sütun yoksa 0 döndürür
+    """
+    if f'{col}_sum' not in agg.columns:
+        return 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return agg[f'{col}_sum'] / agg[f'{col}_count']
+
+def derive_player_stats(agg):
+    """
+    Toplu değerlerden calculate_player_stats ile aynı istatistik tablosunu üretir
+    """
+    total_matches = agg['rows']
+
+    # Kazanma oranı - winPlacePerc sütunu varsa kullan
+    avg_win_place = _column_mean(agg, 'winPlacePerc') * 100
+    kills = agg['kills_sum'] if 'kills_sum' in agg.columns else 0
+    headshot_kills = agg['headshotKills_sum'] if 'headshotKills_sum' in agg.columns else 0
+
+    # K/D oranı - calculate_player_stats ile aynı basitleştirilmiş hesaplama
+    deaths = total_matches - (avg_win_place / 100 * total_matches)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        kd_ratio = np.where(deaths > 0, kills / deaths, kills)
+        headshot_ratio = np.where(kills > 0, headshot_kills / kills, 0)
+
+    stats = pd.DataFrame(index=agg.index)
+    stats['total_matches'] = total_matches
+    stats['win_rate'] = avg_win_place
+    stats['kills'] = kills
+    stats['kills_per_match'] = kills / total_matches
+    stats['deaths'] = deaths
+    stats['kd_ratio'] = kd_ratio
+    stats['avg_damage'] = _column_mean(agg, 'damageDealt')
+    stats['avg_walk_distance'] = _column_mean(agg, 'walkDistance')
+    stats['avg_ride_distance'] = _column_mean(agg, 'rideDistance')
+    stats['avg_swim_distance'] = _column_mean(agg, 'swimDistance')
+    stats['headshot_kills'] = headshot_kills
+    stats['headshot_ratio'] = headshot_ratio
+    stats['longest_kill'] = agg['longestKill_max'] if 'longestKill_max' in agg.columns else 0
+    stats['weapons_acquired'] = _column_mean(agg, 'weaponsAcquired')
+    return stats[STATS_KEYS]
+
+def calculate_all_player_stats(df, id_column):
+    """
+    Tüm oyuncuların istatistiklerini tek bir vektörel geçişte hesaplar
+    """
+    return derive_player_stats(aggregate_player_rows(df, id_column))
+
+def classify_playstyles(stats):
+    """
+    determine_playstyle ile aynı eşikleri kullanarak tüm istatistik tablosu
+    için kategorik oyun tarzı sütunu üretir
+    """
+    kills_per_match = stats['kills_per_match'].to_numpy()
+    avg_damage = stats['avg_damage'].to_numpy()
+    headshot_ratio = stats['headshot_ratio'].to_numpy()
+    avg_walk_distance = stats['avg_walk_distance'].to_numpy()
+
+    # Agresiflik puanı: iki kademeli eşiklerde her geçilen eşik 1 puan ekler
+    score = (
+        (kills_per_match > 3).astype(np.int8) + (kills_per_match > 1)
+        + (avg_damage > 300) + (avg_damage > 150)
+        + (headshot_ratio > 0.3)
+        + (avg_walk_distance > 2500)
+    )
+
+    # Puan eşikleri: >=1 Dengeli, >=2 Agresif, >=4 Çok Agresif
+    codes = (score >= 1).astype(np.int8) + (score >= 2) + (score >= 4)
+    playstyles = pd.Categorical.from_codes(codes, categories=PLAYSTYLES)
+    return pd.Series(playstyles, index=stats.index, name='playstyle')
+
+def compare_playstyles(stats, playstyles, scalar_fn):
+    """
+    Toplu oyun tarzı sütununu her satır için oyuncu bazlı fonksiyonla
+    (ör. determine_playstyle) karşılaştırır ve uyuşmayan oyuncuları döndürür
+    """
+    mismatches = []
+    for player_id, row, playstyle in zip(stats.index, stats.to_dict('records'), playstyles):
+        expected = scalar_fn(row)
+        if expected != playstyle:
+            mismatches.append((player_id, playstyle, expected))
+    return mismatches
+
+def compare_with_scalar(df, id_column, stats_table, scalar_fn, player_ids=None, rtol=1e-9):
+    """
+    Toplu tablo ile oyuncu bazlı fonksiyonun (ör. calculate_player_stats)
+    sonuçlarını karşılaştırır ve uyuşmayan (oyuncu, anahtar) çiftlerini döndürür.
+    İki yol da float64'te topladığı için yalnızca toplama sırası farkına tolerans tanınır.
+    """
+    if player_ids is None:
+        player_ids = stats_table.index
+
+    mismatches = []
+    for player_id in player_ids:
+        expected = scalar_fn(df[df[id_column] == player_id])
+        row = stats_table.loc[player_id]
+        for key in STATS_KEYS:
+            a, b = float(row[key]), float(expected[key])
+            if not (np.isclose(a, b, rtol=rtol, atol=0) or (np.isnan(a) and np.isnan(b))):
+                mismatches.append((player_id, key, a, b))
+    return mismatches
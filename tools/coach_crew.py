@@ -0,0 +1,175 @@
+from tools.agent_registry import get_agent_registry
+from tools.coach_metrics import record_coach_run
+from tools.coach_result import SECTION_HEADINGS, CoachResult, extract_task_outputs, split_sections
+from tools.coach_scheduler import LLM_MAX_RETRIES, LLM_REQUEST_TIMEOUT
+from tools.player_core import build_stats_summary
+from tools.prompt_budget import COMPACTION_LEVELS, DEFAULT_TOKEN_BUDGET, fit_to_budget
+from tools.response_cache import get_response_cache, make_cache_key
+from tools.stage_timer import span
+from tools.token_stream import bind_token_stream
+
+# CrewAI koç hattı: LLM, ajanlar, görevler ve Crew çalıştırma. Streamlit'e
+# bağımlı değildir; hem main.py hem de toplu analiz (tools/batch.py) kullanır.
+# crewai ve langchain_openai yalnızca ihtiyaç duyulan fonksiyonlarda içe aktarılır.
+
+def get_llm():
+    """
+    OpenAI LLM'i oluşturur. Token'lar stream_handler üzerinden, isteği
+    çalıştıran iş parçacığına bağlı TokenStream'e akıtılır; token sayıları
+    usage_handler ile o iş parçacığının koç ölçüm kaydına eklenir.
+    """
+    from langchain_openai import ChatOpenAI
+    from tools.llm_callbacks import stream_handler, usage_handler
+
+    # Zaman aşımı istemcide: süresi dolan istek gerçekten iptal edilir
+    return ChatOpenAI(
+        model="gpt-4o",
+        temperature=0.7,
+        streaming=True,
+        request_timeout=LLM_REQUEST_TIMEOUT,
+        max_retries=LLM_MAX_RETRIES,
+        callbacks=[stream_handler, usage_handler]
+    )
+
+def create_agents(compact=False):
+    """
+    Bu istek için ajanları döndürür. LLM ve agents/*.yaml tanımları süreç
+    başına bir kez oluşturulur; ajanlar çalışma sırasında durum tuttuğu için
+    her istekte yeniden kurulur. compact=True ise geçmiş hikâyesi kısaltılmış ajanlar döner.
+    """
+    return get_agent_registry(get_llm).get_agents(compact=compact)
+
+def create_tasks(agents, player_stats, playstyle, on_task_done=None, compact=False):
+    """
+    Görevleri oluşturur. on_task_done verilirse her görev bittiğinde çağrılır.
+    compact=True ise kısa istatistik özeti kullanılır.
+    """
+    from crewai import Task
+
+    stats_summary = build_stats_summary(player_stats, compact)
+
+    # Analiz görevi
+    analyze_task = Task(
+        description=f"Oyuncunun PUBG verilerini analiz et. {stats_summary}. Oyun tarzı: {playstyle}",
+        expected_output="Oyuncunun kazanma oranı, K/D oranı ve diğer önemli istatistikler hakkında detaylı analiz",
+        agent=agents['analyst'],
+        callback=on_task_done
+    )
+
+    # Koçluk önerileri görevi
+    coaching_task = Task(
+        description=f"Oyuncunun istatistiklerine göre oyun stratejileri öner. {stats_summary}. Oyun tarzı: {playstyle}",
+        expected_output="Kişiselleştirilmiş oyun stratejileri, silah önerileri ve iniş bölgesi tavsiyeleri",
+        agent=agents['coach'],
+        dependencies=[analyze_task],
+        callback=on_task_done
+    )
+
+    return [analyze_task, coaching_task]
+
+def create_single_pass_task(agents, player_stats, playstyle, on_task_done=None, compact=False):
+    """
+    Analiz ve koçluk bölümlerini tek bir LLM çağrısında üreten görevi oluşturur.
+    Çıktı SECTION_HEADINGS başlıklarıyla iki bölüme ayrılır.
+    """
+    from crewai import Task
+
+    stats_summary = build_stats_summary(player_stats, compact)
+    analysis_heading, coaching_heading = SECTION_HEADINGS
+
+    single_task = Task(
+        description=(
+            f"Oyuncunun PUBG verilerini analiz et ve bu analize göre oyun stratejileri öner. "
+            f"{stats_summary}. Oyun tarzı: {playstyle}. Yanıtı iki bölüm halinde yaz: "
+            f"önce '### {analysis_heading}' başlığı altında istatistik analizi, ardından "
+            f"'### {coaching_heading}' başlığı altında koçluk önerileri."
+        ),
+        expected_output=(
+            f"'### {analysis_heading}' başlığı altında kazanma oranı, K/D oranı ve diğer önemli "
+            f"istatistikler hakkında detaylı analiz; '### {coaching_heading}' başlığı altında "
+            f"kişiselleştirilmiş oyun stratejileri, silah önerileri ve iniş bölgesi tavsiyeleri"
+        ),
+        agent=agents['coach'],
+        callback=on_task_done
+    )
+
+    return [single_task]
+
+def run_coach_crew(player_stats, playstyle, stream=None, single_pass=False):
+    """
+    Ajanları ve görevleri oluşturup Crew'u çalıştırır. Aynı görev metinleri,
+    model ve sıcaklık için yanıt önbellekten döner, LLM çağrılmaz.
+    stream verilirse LLM token'ları üretildikçe bu akışa yazılır.
+    single_pass açıkken iki bölüm tek bir LLM çağrısında üretilir.
+    Her çalıştırmanın token sayıları, görev süreleri ve önbellek isabeti
+    coach_metrics.jsonl dosyasına yazılır.
+    """
+    try:
+        with record_coach_run('single_pass' if single_pass else 'two_pass',
+                              token_budget=DEFAULT_TOKEN_BUDGET) as metrics:
+            return _run_coach_crew(player_stats, playstyle, stream, single_pass, metrics)
+    finally:
+        if stream is not None:
+            stream.close()
+
+def _run_coach_crew(player_stats, playstyle, stream, single_pass, metrics):
+    """
+    run_coach_crew'un gövdesi; akışın kapatılması çağırana bırakılır
+    """
+    from crewai import Crew
+    try:
+        from crewai.process import Process
+    except ImportError:
+        from crewai import Process
+
+    def on_task_done(output):
+        metrics.task_done()
+        if stream is not None:
+            stream.next_section(output)
+
+    # Ajanları ve görevleri oluştur; token bütçesi aşılıyorsa istemler sıkıştırılır
+    build_tasks = create_single_pass_task if single_pass else create_tasks
+
+    def build(level):
+        agents = create_agents(compact=level >= 2)
+        return agents, build_tasks(agents, player_stats, playstyle,
+                                   on_task_done=on_task_done, compact=level >= 1)
+
+    with span('build_tasks'):
+        level, (agents, tasks), prompt_estimate = fit_to_budget(build, DEFAULT_TOKEN_BUDGET)
+    metrics.record.update(compaction=COMPACTION_LEVELS[level], prompt_estimate=prompt_estimate)
+
+    # Önbellek anahtarı: görev metinleri + model + sıcaklık (+ sıkıştırma seviyesi)
+    llm = get_agent_registry(get_llm).get_llm()
+    cache = get_response_cache()
+    task_texts = [f"{task.description}\n{task.expected_output}" for task in tasks]
+    if level:
+        task_texts.append(COMPACTION_LEVELS[level])
+    cache_key = make_cache_key(
+        task_texts,
+        getattr(llm, 'model_name', None),
+        getattr(llm, 'temperature', None)
+    )
+    with span('cache_lookup'):
+        cached_outputs = cache.get(cache_key)
+    if cached_outputs is not None:
+        metrics.record['cached'] = True
+        return CoachResult(cached_outputs, cached=True)
+
+    # Crew'u oluştur ve çalıştır
+    crew = Crew(
+        agents=list(agents.values()),
+        tasks=tasks,
+        verbose=True,
+        process=Process.sequential
+    )
+
+    # Sonuçları al ve önbelleğe yaz
+    with span('crew_kickoff'), bind_token_stream(stream):
+        results = crew.kickoff()
+    outputs = extract_task_outputs(results, tasks)
+    if single_pass:
+        # Tek yanıt, display_results'ın beklediği iki bölüme ayrılır
+        outputs = split_sections("\n\n".join(outputs))
+    cache.put(cache_key, outputs)
+    return CoachResult(outputs)
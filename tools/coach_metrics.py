@@ -0,0 +1,186 @@
+import argparse
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+import numpy as np
+
+# Ölçümlerin yazıldığı JSONL dosyası (ortam değişkeniyle değiştirilebilir, boş: kapalı)
+DEFAULT_METRICS_PATH = os.getenv('PUBG_COACH_METRICS', 'coach_metrics.jsonl')
+
+_encoding = None
+
+def estimate_tokens(text):
+    """
+    Metnin token sayısını tahmin eder. tiktoken kuruluysa gerçek kodlayıcı,
+    değilse ~4 karakter = 1 token yaklaşımı kullanılır.
+    """
+    global _encoding
+    if not text:
+        return 0
+    if _encoding is None:
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding('o200k_base')
+        except Exception:
+            _encoding = False
+    if _encoding:
+        return len(_encoding.encode(text))
+    return (len(text) + 3) // 4
+
+class CoachRunMetrics:
+    """
+    Tek bir koç çalıştırmasının ölçümleri: LLM çağrıları, token sayıları,
+    görev başına süre ve önbellek isabeti
+    """
+
+    def __init__(self, mode, **extra):
+        self.record = {
+            'id': uuid.uuid4().hex[:12],
+            'ts': time.time(),
+            'mode': mode,
+            'cached': False,
+            'llm_calls': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0,
+            'tokens_estimated': False,
+            'task_seconds': [],
+            'wall_seconds': None
+        }
+        self.record.update(extra)
+        self._start = time.perf_counter()
+        self._last_mark = self._start
+        self._lock = threading.Lock()
+
+    def add_usage(self, prompt_tokens, completion_tokens, estimated):
+        with self._lock:
+            self.record['llm_calls'] += 1
+            self.record['prompt_tokens'] += prompt_tokens
+            self.record['completion_tokens'] += completion_tokens
+            self.record['tokens_estimated'] |= estimated
+
+    def task_done(self, *_):
+        """
+        Bir görevin bittiğini işaretler (CrewAI görev callback'i olarak da kullanılır)
+        """
+        now = time.perf_counter()
+        self.record['task_seconds'].append(round(now - self._last_mark, 4))
+        self._last_mark = now
+
+    def finish(self):
+        self.record['wall_seconds'] = round(time.perf_counter() - self._start, 4)
+        return self.record
+
+class MetricsSink:
+    """
+    Ölçüm kayıtlarını yerel bir JSONL dosyasına satır satır ekler
+    """
+
+    def __init__(self, path=DEFAULT_METRICS_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def write(self, record):
+        if not self.path:
+            return
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+_sink = None
+_sink_lock = threading.Lock()
+
+def get_metrics_sink():
+    """
+    Süreç genelindeki tek MetricsSink örneğini döndürür
+    """
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                _sink = MetricsSink()
+    return _sink
+
+_local = threading.local()
+
+@contextmanager
+def record_coach_run(mode, sink=None, **extra):
+    """
+    Bu iş parçacığındaki LLM çağrılarını verilen koç çalıştırmasına bağlar,
+    bitişte (hata olsa da) kaydı ölçüm dosyasına yazar
+    """
+    run = CoachRunMetrics(mode, **extra)
+    previous = getattr(_local, 'run', None)
+    _local.run = run
+    try:
+        yield run
+    except Exception as e:
+        run.record['error'] = type(e).__name__
+        raise
+    finally:
+        _local.run = previous
+        (sink or get_metrics_sink()).write(run.finish())
+
+def current_run():
+    """
+    Bu iş parçacığına bağlı koç çalıştırmasını döndürür, yoksa None
+    """
+    return getattr(_local, 'run', None)
+
+def response_usage(response):
+    """
+    LLMResult içinden sağlayıcının bildirdiği token sayılarını okur, yoksa None
+    """
+    usage = (getattr(response, 'llm_output', None) or {}).get('token_usage')
+    if usage:
+        return usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0)
+    for generations in getattr(response, 'generations', None) or []:
+        for generation in generations:
+            metadata = getattr(getattr(generation, 'message', None), 'usage_metadata', None)
+            if metadata:
+                return metadata.get('input_tokens', 0), metadata.get('output_tokens', 0)
+    return None
+
+def summarize(records):
+    """
+    Ölçüm kayıtlarından mod bazında özet (p50/p95 token ve süre, isabet oranı) üretir
+    """
+    summary = {}
+    for mode in sorted({record.get('mode') for record in records}):
+        rows = [record for record in records if record.get('mode') == mode]
+        live = [record for record in rows if not record.get('cached')]
+        summary[mode] = {
+            'runs': len(rows),
+            'cache_hit_rate': 1 - len(live) / len(rows),
+            'errors': sum('error' in record for record in rows)
+        }
+        for key in ('prompt_tokens', 'completion_tokens', 'wall_seconds'):
+            values = [record[key] for record in live if record.get(key) is not None]
+            if values:
+                summary[mode][f'{key}_p50'] = float(np.percentile(values, 50))
+                summary[mode][f'{key}_p95'] = float(np.percentile(values, 95))
+    return summary
+
+def main(argv=None):
+    """
+    Komut satırı: python -m tools.coach_metrics [coach_metrics.jsonl]
+    """
+    parser = argparse.ArgumentParser(prog='python -m tools.coach_metrics',
+                                     description="Koç çağrısı ölçümlerinin özeti.")
+    parser.add_argument('path', nargs='?', default=DEFAULT_METRICS_PATH)
+    args = parser.parse_args(argv)
+
+    with open(args.path, encoding='utf-8') as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    for mode, values in summarize(records).items():
+        print(f"[{mode}]")
+        for key, value in values.items():
+            print(f"  {key}: {value:.3f}" if isinstance(value, float) else f"  {key}: {value}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,60 @@
+import re
+
+class CoachResult:
+    """
+    Koç analizinin görev bazlı metin çıktıları. raw_output[0] analist,
+    raw_output[1] koç görevinin çıktısıdır (display_results bu yapıyı okur).
+    """
+
+    def __init__(self, outputs, cached=False):
+        self.raw_output = list(outputs)
+        self.cached = cached
+
+    def __str__(self):
+        return "\n\n".join(self.raw_output)
+
+def _task_output_text(task):
+    """
+    CrewAI sürümlerine göre görev çıktısının metnini bulur
+    """
+    output = getattr(task, 'output', None)
+    if output is None:
+        return ''
+    for attr in ('raw_output', 'raw', 'result'):
+        text = getattr(output, attr, None)
+        if text:
+            return str(text)
+    return str(output)
+
+def extract_task_outputs(results, tasks):
+    """
+    Crew çıktısından görev başına metinleri çıkarır. Görev çıktıları
+    bulunamazsa Crew'un genel çıktısı tek eleman olarak döndürülür.
+    """
+    outputs = [_task_output_text(task) for task in tasks]
+    if not any(outputs):
+        return [str(results)]
+    return outputs
+
+# Tek geçişli modda yanıtın bölüm başlıkları (display_results sırasıyla)
+SECTION_HEADINGS = ('ANALİZ', 'KOÇLUK')
+_HEADING_PATTERN = re.compile(r'^[#*\s]*(ANAL[İIıi]Z|KO[ÇCçc]LUK)[*:\s]*$', re.IGNORECASE | re.MULTILINE)
+
+def split_sections(text):
+    """
+    Tek geçişli yanıtı başlıklarına göre [analiz, koçluk] metinlerine ayırır.
+    Başlıklar bulunamazsa metnin tamamı analiz bölümüne yazılır. Yanıtta
+    analiz başlığı yoksa ilk başlıktan önceki metin analiz bölümü sayılır.
+    """
+    matches = list(_HEADING_PATTERN.finditer(text))
+    if not matches:
+        return [text.strip(), '']
+    parts = [[], []]
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        index = 1 if match.group(1).upper().startswith('KO') else 0
+        parts[index].append(text[match.end():end].strip())
+    if not parts[0]:
+        parts[0].append(text[:matches[0].start()].strip())
+    # Aynı başlık birden çok kez geçtiyse parçalar paragraf olarak birleştirilir
+    return ["\n\n".join(part for part in section if part) for section in parts]
@@ -0,0 +1,237 @@
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Varsayılan sınırlar (ortam değişkenleriyle değiştirilebilir)
+DEFAULT_CONCURRENCY = int(os.getenv('PUBG_COACH_CONCURRENCY', 4))
+DEFAULT_REQUESTS_PER_MINUTE = float(os.getenv('PUBG_COACH_RPM', 60))
+DEFAULT_TIMEOUT_SECONDS = float(os.getenv('PUBG_COACH_TIMEOUT', 180))
+DEFAULT_MAX_RETRIES = int(os.getenv('PUBG_COACH_RETRIES', 3))
+
+# LLM istemcisinin istek başına zaman aşımı ve kendi tekrar deneme sayısı.
+# Asıl zaman aşımı istemcidedir: süre dolunca istek gerçekten iptal edilir.
+LLM_REQUEST_TIMEOUT = float(os.getenv('PUBG_COACH_LLM_TIMEOUT', 60))
+LLM_MAX_RETRIES = int(os.getenv('PUBG_COACH_LLM_RETRIES', 1))
+
+# Tekrar denenebilecek HTTP durum kodları (hız sınırı ve geçici sunucu hataları)
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+class TokenBucket:
+    """
+    İş parçacığı güvenli token kovası. Saniyede `rate` token dolar, en fazla
+    `capacity` token birikir. Hız sınırı yanıtı gelince pause() ile kova
+    bir süre boşaltılır, böylece tüm işçiler birlikte yavaşlar.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens=1):
+        """
+        Yeterli token birikene kadar bekler ve token'ları harcar
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        return
+                    wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """
+        Kovayı verilen süre boyunca kullanılmaz yapar
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+def _status_code(error):
+    """
+    OpenAI/HTTP istisnasından durum kodunu çıkarır, yoksa None
+    """
+    status = getattr(error, 'status_code', None) or getattr(error, 'status', None)
+    response = getattr(error, 'response', None)
+    if status is None and response is not None:
+        status = getattr(response, 'status_code', None)
+    return status if isinstance(status, int) else None
+
+def _retry_after(error):
+    """
+    Sunucunun önerdiği bekleme süresini (Retry-After başlığı) saniye olarak döndürür
+    """
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or getattr(error, 'headers', None)
+    try:
+        return float(headers.get('retry-after')) if headers else None
+    except (TypeError, ValueError):
+        return None
+
+def is_retryable(error):
+    """
+    Hatanın tekrar denemeye değer (geçici) olup olmadığını belirler
+    """
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    # openai istemcisinin zaman aşımı/bağlantı hataları durum kodu taşımaz
+    return type(error).__name__ in {'APITimeoutError', 'APIConnectionError', 'RateLimitError'}
+
+class CallTimeout(TimeoutError):
+    """
+    Toplam süre sınırı aşıldı; çağrı arka planda hâlâ çalışıyor olabilir.
+    Çalışan bir çağrı yeniden başlatılmaz, bu yüzden tekrar denenmez.
+    """
+
+def call_with_timeout(fn, args, timeout, slots=None):
+    """
+    fn(*args) çağrısını en fazla timeout saniye bekler. Süre dolarsa
+    CallTimeout yükseltilir; çağrı arka planda biter ve sonucu atılır.
+    slots (semafor) verilirse çağrı başlamadan bir yer alınır ve çağrı
+    gerçekten bittiğinde bırakılır: bırakılmış çağrılar da eşzamanlılık
+    sınırına sayılır. Asıl zaman aşımı LLM istemcisinde (LLM_REQUEST_TIMEOUT)
+    olmalı, bu süre yalnızca son güvenlik ağıdır.
+    """
+    if slots is not None:
+        slots.acquire()
+    if not timeout:
+        try:
+            return fn(*args)
+        finally:
+            if slots is not None:
+                slots.release()
+    outcome = queue.Queue(maxsize=1)
+
+    def target():
+        try:
+            outcome.put((True, fn(*args)))
+        except BaseException as e:
+            outcome.put((False, e))
+        finally:
+            if slots is not None:
+                slots.release()
+
+    threading.Thread(target=target, daemon=True, name='coach-call').start()
+    try:
+        ok, value = outcome.get(timeout=timeout)
+    except queue.Empty:
+        raise CallTimeout(f"Koç isteği {timeout:.0f} sn içinde tamamlanmadı.") from None
+    if not ok:
+        raise value
+    return value
+
+class CoachScheduler:
+    """
+    Birden çok oyuncunun koç analizini eşzamanlılık sınırı, token kovası ile
+    hız sınırlama, üstel geri çekilmeli tekrar deneme ve istek başına zaman
+    aşımıyla çalıştırır. Sonuçlar bittikleri sırayla döndürülür. Zaman aşımına
+    uğrayıp arka planda süren çağrılar bitene kadar eşzamanlılık sınırından
+    yer tutar ve tekrar denenmez.
+    """
+
+    def __init__(self, run_fn, concurrency=DEFAULT_CONCURRENCY,
+                 requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE,
+                 timeout=DEFAULT_TIMEOUT_SECONDS, max_retries=DEFAULT_MAX_RETRIES,
+                 backoff_base=1.0, backoff_max=30.0, calls_per_job=1):
+        self.run_fn = run_fn
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        # Bir iş (ör. analist + koç görevleri) kaç LLM isteği yapıyorsa o kadar token harcar
+        self.calls_per_job = calls_per_job
+        rate = requests_per_minute / 60.0 if requests_per_minute else None
+        self.bucket = TokenBucket(rate, capacity=max(calls_per_job, self.concurrency)) if rate else None
+        # Çalışan (bırakılmışlar dahil) çağrı sayısı sınırı
+        self.slots = threading.BoundedSemaphore(self.concurrency)
+        self.stats = {'completed': 0, 'failed': 0, 'retries': 0, 'timeouts': 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _backoff(self, attempt, error):
+        """
+        Deneme numarasına göre tam rastgele (full jitter) bekleme süresi;
+        sunucu Retry-After gönderdiyse o kullanılır
+        """
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def run_one(self, *args):
+        """
+        Tek bir işi hız sınırı, zaman aşımı ve tekrar denemelerle çalıştırır
+        """
+        attempt = 0
+        while True:
+            if self.bucket is not None:
+                self.bucket.acquire(self.calls_per_job)
+            try:
+                return call_with_timeout(self.run_fn, args, self.timeout, self.slots)
+            except CallTimeout:
+                # Çağrı hâlâ çalışıyor; yeniden başlatmak harcamayı ikiye katlar
+                self._count('timeouts')
+                raise
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+                delay = self._backoff(attempt, e)
+                if _status_code(e) == 429 and self.bucket is not None:
+                    # Hız sınırında tüm işçiler beklesin
+                    self.bucket.pause(delay)
+                self._count('retries')
+                attempt += 1
+                time.sleep(delay)
+
+    def run(self, jobs):
+        """
+        (anahtar, argüman demeti) çiftlerini çalıştırır ve biten her iş için
+        (anahtar, sonuç, hata) üretir. Girdi tembel okunur; aynı anda en
+        fazla 2 x concurrency iş bekletilir.
+        """
+        done = queue.Queue()
+        pending = 0
+        jobs = iter(jobs)
+        exhausted = False
+
+        def finish(key, future):
+            error = future.exception()
+            self._count('failed' if error is not None else 'completed')
+            done.put((key, None if error is not None else future.result(), error))
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='coach-batch') as pool:
+            while True:
+                while not exhausted and pending < 2 * self.concurrency:
+                    try:
+                        key, args = next(jobs)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    future = pool.submit(self.run_one, *args)
+                    future.add_done_callback(lambda f, key=key: finish(key, f))
+                    pending += 1
+                if pending == 0:
+                    return
+                yield done.get()
+                pending -= 1
@@ -0,0 +1,28 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Aynı anda arka planda çalışabilecek koç analizi sayısı
+MAX_WORKERS = int(os.getenv('PUBG_COACH_WORKERS', 4))
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_coach_executor():
+    """
+    Süreç genelinde paylaşılan arka plan iş parçacığı havuzunu döndürür.
+    Streamlit her yeniden çalıştırmada main.py'yi baştan yürüttüğü için
+    havuz burada, modül düzeyinde tutulur.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='coach')
+    return _executor
+
+def submit_coach_job(fn, *args, **kwargs):
+    """
+    Koç analizini arka planda başlatır ve Future döndürür
+    """
+    return get_coach_executor().submit(fn, *args, **kwargs)
@@ -0,0 +1,262 @@
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from tools.schema import POSSIBLE_ID_COLUMNS, apply_schema, csv_dtypes
+
+# Önbellek biçimi değişirse artırılır, eski önbellekler yeniden oluşturulur
+CACHE_VERSION = 4
+META_FILE = 'meta.json'
+
+# Önbellek oluşturulurken CSV'den bir seferde okunan satır sayısı
+CACHE_CHUNK_ROWS = int(os.getenv('PUBG_COACH_CACHE_CHUNK_ROWS', 500_000))
+
+def get_cache_dir(csv_path):
+    """
+    CSV dosyası için önbellek klasörünün yolunu döndürür
+    """
+    return os.path.abspath(csv_path) + '.cache'
+
+def dataset_fingerprint(csv_path):
+    """
+    CSV dosyasının boyut ve değiştirilme zamanından oluşan parmak izini döndürür
+    """
+    stat = os.stat(csv_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def dataset_version(csv_path):
+    """
+    Önbellek anahtarı olarak kullanılacak veri seti sürüm dizgesini döndürür
+    """
+    fingerprint = dataset_fingerprint(csv_path)
+    return f"{fingerprint['size']}-{fingerprint['mtime_ns']}"
+
+def _column_values(series):
+    """
+    Sütunu diske yazılacak tipli bir numpy dizisine çevirir. Sayısal sütunlar
+    apply_schema'nın verdiği (PUBG_SCHEMA) tipiyle yazılır; önbellekten ve
+    doğrudan CSV'den yükleme aynı tipleri verir.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = np.asarray(series.cat.categories.astype(str), dtype=str)
+        return 'category', series.cat.codes.to_numpy(), categories
+    if (pd.api.types.is_bool_dtype(series) or pd.api.types.is_float_dtype(series)
+            or pd.api.types.is_integer_dtype(series)):
+        return 'numeric', series.to_numpy(), None
+
+    # Metin sütunları kategori kodu + kategori tablosu olarak saklanır
+    categorical = pd.Categorical(series)
+    categories = np.asarray(categorical.categories.astype(str), dtype=str)
+    return 'category', categorical.codes, categories
+
+class _MixedColumnError(ValueError):
+    """
+    Bir sütun parçalar arasında hem sayısal hem metin olarak okunduğunda fırlatılır
+    """
+
+class _ColumnWriter:
+    """
+    Bir sütunun parçalarını geçici bir ham dosyaya ekler. Metin sütunlarının
+    kategorileri parçalar boyunca tek bir tabloda birleştirilir.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.kind = None
+        self.dtype = None
+        self.categories = None  # metin -> geçici kod (görülme sırasına göre)
+
+    def append(self, series):
+        kind, values, categories = _column_values(series)
+        if self.kind is None:
+            self.kind = kind
+            self.categories = {} if kind == 'category' else None
+        elif kind != self.kind:
+            raise _MixedColumnError(series.name)
+
+        if kind == 'category':
+            # Parçanın yerel kodlarını ortak tablodaki kodlara çevir; -1 (eksik) korunur
+            lookup = np.array([self.categories.setdefault(c, len(self.categories)) for c in categories]
+                              + [-1], dtype=np.int32)
+            values = lookup[values]
+        elif self.dtype is not None and values.dtype != self.dtype:
+            # Örn. bir parçada eksik değer olduğu için float okunan tamsayı sütunu
+            promoted = np.result_type(self.dtype, values.dtype)
+            if promoted != self.dtype:
+                np.fromfile(self.path, dtype=self.dtype).astype(promoted).tofile(self.path)
+            values = values.astype(promoted)
+        self.dtype = values.dtype
+        with open(self.path, 'ab') as f:
+            values.tofile(f)
+
+    def finish(self):
+        """
+        Sütunun tüm değerlerini ve (metin sütunlarında) sıralı kategori tablosunu
+        döndürür; kodlar tek seferde okunmuş gibi sıralı kategorilere göre verilir
+        """
+        values = np.fromfile(self.path, dtype=self.dtype)
+        if self.kind != 'category':
+            return values, None
+        categories = np.array(list(self.categories), dtype=str)
+        rank = np.empty(len(categories) + 1, dtype=np.int64)
+        rank[np.argsort(categories, kind='stable')] = np.arange(len(categories))
+        rank[-1] = -1
+        return rank[values].astype(_code_dtype(len(categories))), np.sort(categories, kind='stable')
+
+def _code_dtype(n_categories):
+    """
+    pandas gibi kategori sayısına yeten en küçük tamsayı kod tipini döndürür
+    """
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+def _read_chunks(csv_path, chunksize):
+    """
+    CSV'yi şemalı parçalar halinde okur; chunksize None ise tek parça olarak
+    """
+    header = pd.read_csv(csv_path, nrows=0).columns
+    reader = pd.read_csv(csv_path, dtype=csv_dtypes(header), chunksize=chunksize)
+    if chunksize is None:
+        reader = [reader]
+    for chunk in reader:
+        yield apply_schema(chunk)
+
+def _write_columns(chunks, tmp_dir):
+    """
+    Parçaları sütun sütun diske yazar. Bellekte aynı anda yalnızca bir parça
+    ve son adımda tek bir sütun tutulur. Satırlar oyuncu ID'sine göre (kararlı)
+    sıralanır; PlayerIndex sıralı veriyi kopyalamadan kullandığı için mmap
+    sayfaları tüm süreçlerde ortak kalır. (sütun sırası, sütunlar, satır
+    sayısı, sıralama sütunu) döndürür.
+    """
+    writers, n_rows = {}, 0
+    for chunk in chunks:
+        if not writers:
+            writers = {name: _ColumnWriter(os.path.join(tmp_dir, f'col_{i}.raw'))
+                       for i, name in enumerate(chunk.columns)}
+        for name, writer in writers.items():
+            writer.append(chunk[name])
+        n_rows += len(chunk)
+
+    order, sorted_by = None, None
+    id_column = next((c for c in POSSIBLE_ID_COLUMNS if c in writers), None)
+    if id_column is not None and writers[id_column].kind == 'category':
+        sorted_by = id_column
+        codes, _ = writers[id_column].finish()
+        if len(codes) > 1 and not bool(np.all(codes[:-1] <= codes[1:])):
+            order = np.argsort(codes, kind='stable')
+        del codes
+
+    columns = {}
+    for i, (name, writer) in enumerate(writers.items()):
+        values, categories = writer.finish()
+        if order is not None:
+            values = values[order]
+        entry = {'file': f'col_{i}.npy', 'kind': writer.kind, 'dtype': str(values.dtype)}
+        np.save(os.path.join(tmp_dir, entry['file']), np.ascontiguousarray(values))
+        if categories is not None:
+            entry['categories'] = f'cat_{i}.npy'
+            np.save(os.path.join(tmp_dir, entry['categories']), categories)
+        os.remove(writer.path)
+        columns[name] = entry
+    return list(writers), columns, n_rows, sorted_by
+
+def build_columnar_cache(csv_path, cache_dir=None, chunksize=CACHE_CHUNK_ROWS):
+    """
+    CSV dosyasını parça parça okuyup her sütunu şemadaki sıkıştırılmış tipiyle
+    ayrı bir .npy dosyasına yazar; tüm CSV aynı anda belleğe alınmaz.
+    Satırlar oyuncu ID'sine göre sıralanır.
+    """
+    cache_dir = cache_dir or get_cache_dir(csv_path)
+    fingerprint = dataset_fingerprint(csv_path)
+
+    # Yarım kalan yazımlar mevcut önbelleği bozmasın diye geçici klasöre yaz;
+    # aynı anda önbellek oluşturan süreçler birbirinin klasörünü ezmesin diye
+    # klasör adı süreç numarasını içerir
+    tmp_dir = f'{cache_dir}.tmp-{os.getpid()}'
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    try:
+        column_order, columns, n_rows, sorted_by = _write_columns(_read_chunks(csv_path, chunksize), tmp_dir)
+    except _MixedColumnError:
+        # Parçalar arasında tipi değişen sütun varsa CSV tek seferde okunur
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        column_order, columns, n_rows, sorted_by = _write_columns(_read_chunks(csv_path, None), tmp_dir)
+
+    meta = {
+        'version': CACHE_VERSION,
+        'source': fingerprint,
+        'n_rows': n_rows,
+        'sorted_by': sorted_by,
+        'column_order': column_order,
+        'columns': columns
+    }
+    with open(os.path.join(tmp_dir, META_FILE), 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+
+    # Başka bir süreç aynı kaynak için önbelleği bu arada yayımladıysa onu kullan
+    current = read_cache_meta(cache_dir)
+    if (current is not None and current.get('version') == CACHE_VERSION
+            and current.get('source') == fingerprint):
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return current
+
+    # Eski önbelleği eşlemiş süreçler etkilenmez; silinen dosyalar eşleme
+    # kapanana kadar işletim sistemi tarafından tutulur
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    os.replace(tmp_dir, cache_dir)
+    return meta
+
+def read_cache_meta(cache_dir):
+    """
+    Önbellek meta verisini okur, yoksa None döndürür
+    """
+    try:
+        with open(os.path.join(cache_dir, META_FILE), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def ensure_columnar_cache(csv_path, cache_dir=None):
+    """
+    Önbellek yoksa veya CSV değiştiyse (boyut/mtime) önbelleği yeniden oluşturur
+    """
+    cache_dir = cache_dir or get_cache_dir(csv_path)
+    meta = read_cache_meta(cache_dir)
+    if (meta is None or meta.get('version') != CACHE_VERSION
+            or meta.get('source') != dataset_fingerprint(csv_path)):
+        meta = build_columnar_cache(csv_path, cache_dir)
+    return meta
+
+def load_columnar(csv_path, columns=None, cache_dir=None):
+    """
+    Önbellekteki sütunları bellek eşlemeli (mmap) olarak yükler.
+    columns verilirse yalnızca önbellekte bulunan istenen sütunlar okunur.
+    Salt okunur eşlemeler sayfa önbelleğini paylaştığı için aynı makinedeki
+    tüm oturumlar ve işçi süreçler verinin tek bir fiziksel kopyasını kullanır.
+    """
+    cache_dir = cache_dir or get_cache_dir(csv_path)
+    meta = ensure_columnar_cache(csv_path, cache_dir)
+
+    names = meta['column_order']
+    if columns is not None:
+        names = [name for name in names if name in columns]
+
+    data = {}
+    for name in names:
+        entry = meta['columns'][name]
+        values = np.load(os.path.join(cache_dir, entry['file']), mmap_mode='r')
+        if entry['kind'] == 'category':
+            categories = np.load(os.path.join(cache_dir, entry['categories']))
+            values = pd.Categorical.from_codes(values, categories=categories, validate=False)
+        data[name] = values
+
+    # copy=False: sayısal sütunlar mmap üzerinde kalır, sayfalar erişildikçe okunur
+    return pd.DataFrame(data, copy=False)
@@ -1,33 +1,45 @@
 import pandas as pd
 import os
 
-def load_pubg_data(file_path='pubg_final.csv'):
+from tools.columnar_cache import load_columnar
+from tools.schema import apply_schema, csv_dtypes
+
+def load_pubg_data(file_path='pubg_final.csv', columns=None, use_cache=True):
     """
-    PUBG veri setini yükler
+    PUBG veri setini yükler. use_cache açıkken CSV bir kez sütun bazlı
+    önbelleğe dönüştürülür, sonraki yüklemeler bellek eşlemeli yapılır.
     """
-    try:
-        df = pd.read_csv(file_path)
-        return df
-    except FileNotFoundError:
-        # Alternatif konumları dene
-        alt_paths = ['./data/pubg_final.csv', '../pubg_final.csv']
-        for path in alt_paths:
-            try:
-                df = pd.read_csv(path)
-                return df
-            except FileNotFoundError:
-                continue
-        print(f"Veri dosyası bulunamadı: {file_path}")
-        return None
-    except Exception as e:
-        print(f"Veri yükleme hatası: {e}")
-        return None
+    # Alternatif konumları da dene
+    paths = [file_path, './data/pubg_final.csv', '../pubg_final.csv']
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        try:
+            if use_cache:
+                try:
+                    return load_columnar(path, columns=columns)
+                except OSError as e:
+                    # Önbellek yazılamıyorsa doğrudan CSV'den oku
+                    print(f"Önbellek kullanılamadı, CSV okunuyor: {e}")
+            header = pd.read_csv(path, nrows=0).columns
+            if columns:
+                header = [c for c in header if c in columns]
+            return apply_schema(pd.read_csv(path, usecols=header, dtype=csv_dtypes(header)))
+        except Exception as e:
+            print(f"Veri yükleme hatası: {e}")
+            return None
+    print(f"Veri dosyası bulunamadı: {file_path}")
+    return None
 
-def get_player_data(df, player_id=None):
+def get_player_data(df, player_id=None, player_index=None):
     """
     Belirli bir oyuncunun verilerini getirir veya oyuncu ID belirtilmemişse
-    tüm veri setini döndürür
+    tüm veri setini döndürür. player_index (PlayerIndex) verilirse tablo taranmaz.
     """
-    if player_id and player_id in df['player_id'].values:
+    if player_index is not None and player_id is not None:
+        player_data = player_index.lookup(player_id)
+        if player_data is not None:
+            return player_data
+    elif player_id and player_id in df['player_id'].values:
         return df[df['player_id'] == player_id]
     return df.head(10)  # Eğer belirli bir oyuncu bulunamazsa ilk 10 satırı döndür
\ No newline at end of file
@@ -0,0 +1,56 @@
+import threading
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from tools.coach_metrics import current_run, estimate_tokens, response_usage
+from tools.token_stream import current_stream
+
+# LangChain callback'leri ayrı modülde tutulur: langchain_core yalnızca LLM
+# oluşturulurken içe aktarılır, token_stream ve coach_metrics hafif kalır
+
+class StreamingTokenHandler(BaseCallbackHandler):
+    """
+    Paylaşılan LLM'e bir kez eklenen callback. Token'ları çağıran iş
+    parçacığına bağlı akışa iletir; bağlı akış yoksa hiçbir şey yapmaz.
+    """
+
+    def on_llm_new_token(self, token, **kwargs):
+        stream = current_stream()
+        if stream is not None:
+            stream.push_token(token)
+
+_prompts = threading.local()
+
+class TokenUsageHandler(BaseCallbackHandler):
+    """
+    Paylaşılan LLM'e bir kez eklenen callback. Her LLM çağrısının token
+    sayılarını çağıran iş parçacığına bağlı koç çalıştırmasına ekler.
+    Akışlı yanıtlarda sağlayıcı kullanım bilgisi vermezse istem ve yanıt
+    metinlerinden tahmin edilir.
+    """
+
+    def on_chat_model_start(self, serialized, messages, **kwargs):
+        _prompts.text = "\n".join(
+            str(getattr(message, 'content', message)) for batch in messages for message in batch
+        )
+
+    def on_llm_start(self, serialized, prompts, **kwargs):
+        _prompts.text = "\n".join(prompts)
+
+    def on_llm_end(self, response, **kwargs):
+        run = current_run()
+        if run is None:
+            return
+        usage = response_usage(response)
+        if usage is not None:
+            run.add_usage(usage[0], usage[1], estimated=False)
+            return
+        completion = "".join(
+            generation.text for generations in response.generations for generation in generations
+        )
+        run.add_usage(estimate_tokens(getattr(_prompts, 'text', '')),
+                      estimate_tokens(completion), estimated=True)
+
+# Süreç genelinde tek handler örnekleri
+stream_handler = StreamingTokenHandler()
+usage_handler = TokenUsageHandler()
@@ -0,0 +1,185 @@
+import numpy as np
+
+# Yüzdelik dilimi hesaplanan metrikler: (üst sınır, logaritmik kutular)
+# Üst sınırı aşan değerler son kutuya düşer
+PERCENTILE_METRICS = {
+    'kd_ratio': (50.0, True),
+    'kills_per_match': (50.0, True),
+    'avg_damage': (5000.0, True),
+    'headshot_ratio': (1.0, False),
+    'win_rate': (100.0, False),
+    'avg_walk_distance': (20000.0, True),
+    'longest_kill': (1500.0, True)
+}
+N_BINS = 1024
+SKETCH_VERSION = 1
+
+def metric_edges(upper, log_scale, n_bins=N_BINS):
+    """
+    Metrik için sabit kutu sınırlarını döndürür. Dağılımı uzun kuyruklu
+    metriklerde kutular küçük değerlerde sık, büyük değerlerde seyrektir.
+    """
+    if log_scale:
+        return np.expm1(np.linspace(0.0, np.log1p(upper), n_bins + 1))
+    return np.linspace(0.0, upper, n_bins + 1)
+
+class HistogramSketch:
+    """
+    Sabit kutulu histogram. Kutular sabit olduğu için iki sketch kutu
+    sayıları toplanarak birleştirilir; bir oyuncunun eski değeri çıkarılıp
+    yenisi eklenerek tablo yeniden taranmadan güncellenir.
+    """
+
+    def __init__(self, edges, counts=None):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        n_bins = len(self.edges) - 1
+        self.counts = np.zeros(n_bins, dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        self._cumulative = None
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
+
+    def _bins(self, values):
+        """
+        Değerlerin kutu numaralarını döndürür, NaN değerler atlanır
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[np.isfinite(values)]
+        bins = np.searchsorted(self.edges, values, side='right') - 1
+        return np.clip(bins, 0, len(self.counts) - 1)
+
+    def add(self, values, weight=1):
+        """
+        Değerleri histograma ekler (weight=-1 ile çıkarır)
+        """
+        self.counts += weight * np.bincount(self._bins(values), minlength=len(self.counts))
+        self._cumulative = None
+
+    def remove(self, values):
+        """
+        Daha önce eklenmiş değerleri histogramdan çıkarır
+        """
+        self.add(values, weight=-1)
+
+    def merge(self, other):
+        """
+        Aynı kutulara sahip iki sketch'in toplamını döndürür
+        """
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Kutu sınırları farklı sketch'ler birleştirilemez.")
+        return HistogramSketch(self.edges, self.counts + other.counts)
+
+    def percentile_rank(self, value):
+        """
+        Değerden küçük gözlemlerin yüzdesini döndürür. Kutu içinde doğrusal
+        yaklaşım kullanılır; arama kutu sınırlarında ikili aramadır.
+        """
+        total = self.total
+        if total == 0 or value is None or not np.isfinite(value):
+            return None
+        if self._cumulative is None:
+            self._cumulative = np.concatenate([[0], np.cumsum(self.counts)])
+        i = int(np.clip(np.searchsorted(self.edges, value, side='right') - 1, 0, len(self.counts) - 1))
+        width = self.edges[i + 1] - self.edges[i]
+        fraction = float(np.clip((value - self.edges[i]) / width, 0.0, 1.0)) if width > 0 else 0.0
+        below = self._cumulative[i] + self.counts[i] * fraction
+        return float(100.0 * below / total)
+
+    def quantile(self, q):
+        """
+        q (0-1) yüzdeliğine karşılık gelen yaklaşık değeri döndürür
+        """
+        total = self.total
+        if total == 0:
+            return None
+        if self._cumulative is None:
+            self._cumulative = np.concatenate([[0], np.cumsum(self.counts)])
+        target = q * total
+        i = int(np.clip(np.searchsorted(self._cumulative, target, side='right') - 1, 0, len(self.counts) - 1))
+        fraction = (target - self._cumulative[i]) / self.counts[i] if self.counts[i] else 0.0
+        return float(self.edges[i] + fraction * (self.edges[i + 1] - self.edges[i]))
+
+class PopulationPercentiles:
+    """
+    Tüm oyuncular için metrik başına bir histogram sketch'i
+    """
+
+    def __init__(self, sketches=None):
+        self.sketches = sketches or {
+            metric: HistogramSketch(metric_edges(upper, log_scale))
+            for metric, (upper, log_scale) in PERCENTILE_METRICS.items()
+        }
+
+    @classmethod
+    def from_stats(cls, stats):
+        """
+        Oyuncu istatistik tablosundan (calculate_all_player_stats çıktısı) sketch'leri oluşturur
+        """
+        population = cls()
+        population.add(stats)
+        return population
+
+    def add(self, stats, weight=1):
+        """
+        İstatistik tablosundaki oyuncuları sketch'lere ekler
+        """
+        for metric, sketch in self.sketches.items():
+            if metric in stats:
+                sketch.add(stats[metric].to_numpy(), weight)
+
+    def update(self, old_stats, new_stats):
+        """
+        Değişen oyuncuların eski değerlerini çıkarıp yenilerini ekler.
+        old_stats yalnızca daha önce eklenmiş oyuncuları içermelidir.
+        """
+        if old_stats is not None and len(old_stats):
+            self.add(old_stats, weight=-1)
+        self.add(new_stats)
+
+    def merge(self, other):
+        """
+        Ayrı oyuncu kümelerinden oluşturulmuş iki nüfus özetini birleştirir
+        """
+        return PopulationPercentiles({
+            metric: sketch.merge(other.sketches[metric]) for metric, sketch in self.sketches.items()
+        })
+
+    def ranks(self, player_stats):
+        """
+        Oyuncunun her metrikteki yüzdelik dilimini (0-100) döndürür
+        """
+        ranks = {}
+        for metric, sketch in self.sketches.items():
+            value = player_stats.get(metric)
+            if isinstance(value, (int, float, np.number)):
+                ranks[metric] = sketch.percentile_rank(float(value))
+        return ranks
+
+    def save(self, file):
+        """
+        Sketch'leri .npz biçiminde yazar (dosya yolu veya ikili dosya nesnesi);
+        yerine atomik taşıma çağırana bırakılır
+        """
+        arrays = {'version': np.array(SKETCH_VERSION)}
+        for metric, sketch in self.sketches.items():
+            arrays[f'{metric}__edges'] = sketch.edges
+            arrays[f'{metric}__counts'] = sketch.counts
+        np.savez(file, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Kayıtlı sketch'leri okur; dosya yoksa veya sürüm/metrikler değiştiyse None döndürür
+        """
+        try:
+            with np.load(path) as data:
+                if int(data['version']) != SKETCH_VERSION:
+                    return None
+                sketches = {
+                    metric: HistogramSketch(data[f'{metric}__edges'], data[f'{metric}__counts'])
+                    for metric in PERCENTILE_METRICS
+                }
+        except (OSError, KeyError, ValueError):
+            return None
+        return cls(sketches)
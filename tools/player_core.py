@@ -0,0 +1,220 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from tools.columnar_cache import load_columnar
+from tools.schema import POSSIBLE_ID_COLUMNS, STATS_COLUMNS, apply_schema, csv_dtypes
+from tools.suggestion_rules import get_suggestion_rules, player_values
+
+# Uygulamanın ihtiyaç duyduğu sütunlar - önbellekten yalnızca bunlar okunur
+APP_COLUMNS = POSSIBLE_ID_COLUMNS + STATS_COLUMNS
+
+# Veri dosyasının aranacağı konumlar
+DATA_PATHS = ['./data/pubg_final.csv', '../pubg_final.csv']
+
+def resolve_data_path(file_path='pubg_final.csv'):
+    """
+    Veri dosyasını verilen yolda ve alternatif konumlarda arar
+    """
+    for path in [file_path] + DATA_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+def load_pubg_data(file_path='pubg_final.csv', columns=None, use_cache=True):
+    """
+    PUBG veri setini yükler. use_cache açıkken CSV bir kez sütun bazlı
+    önbelleğe dönüştürülür, sonraki yüklemeler bellek eşlemeli yapılır.
+    """
+    path = resolve_data_path(file_path)
+    if path is None:
+        print(f"Veri dosyası bulunamadı: {file_path}")
+        return None
+    try:
+        if use_cache:
+            try:
+                return load_columnar(path, columns=columns)
+            except OSError as e:
+                # Önbellek yazılamıyorsa doğrudan CSV'den oku
+                print(f"Önbellek kullanılamadı, CSV okunuyor: {e}")
+        header = pd.read_csv(path, nrows=0).columns
+        if columns:
+            header = [c for c in header if c in columns]
+        return apply_schema(pd.read_csv(path, usecols=header, dtype=csv_dtypes(header)))
+    except Exception as e:
+        print(f"Veri yükleme hatası: {e}")
+        return None
+
+def find_id_column(df):
+    """
+    Veri setinde oyuncu ID sütunu olarak kullanılabilecek ilk sütunu döndürür
+    """
+    for col in POSSIBLE_ID_COLUMNS:
+        if col in df.columns:
+            return col
+    return None
+
+def get_player_data(df, player_id=None, id_column=None, player_index=None):
+    """
+    Belirli bir oyuncunun verilerini getirir. player_index verilirse
+    tablo taranmaz, oyuncunun satırları dilim olarak döndürülür.
+    """
+    if player_index is not None and player_id is not None:
+        player_data = player_index.lookup(player_id)
+        if player_data is not None:
+            return player_data
+    elif player_id and id_column and player_id in df[id_column].values:
+        return df[df[id_column] == player_id]
+    return df.head(10)  # Eğer belirli bir oyuncu bulunamazsa ilk 10 satırı döndür
+
+def _column_mean(player_data, column):
+    """
+    Sütunun ortalamasını Python float'u olarak döndürür, sütun yoksa 0. float32
+    sütunlar bulk_stats.aggregate_player_rows'daki gibi float64'te toplanır.
+    """
+    if column not in player_data.columns:
+        return 0
+    return float(player_data[column].astype(np.float64).mean())
+
+def _column_total(player_data, column):
+    """
+    Sütunun toplamını Python sayısı (int/float) olarak döndürür, sütun yoksa 0
+    """
+    if column not in player_data.columns:
+        return 0
+    return player_data[column].sum().item()
+
+def calculate_player_stats(player_data):
+    """
+    Oyuncunun detaylı istatistiklerini hesaplar
+    """
+    # Temel istatistikler
+    total_matches = len(player_data)
+    if total_matches == 0:
+        return {
+            'total_matches': 0,
+            'wins': 0,
+            'win_rate': 0,
+            'kills': 0,
+            'deaths': 0,
+            'kd_ratio': 0,
+            'avg_damage': 0,
+            'avg_walk_distance': 0,
+            'avg_ride_distance': 0,
+            'avg_swim_distance': 0,
+            'headshot_kills': 0,
+            'longest_kill': 0,
+            'weapons_acquired': 0
+        }
+
+    # Kazanma oranı - winPlacePerc sütunu varsa kullan
+    avg_win_place = _column_mean(player_data, 'winPlacePerc') * 100
+
+    # Kills
+    kills = _column_total(player_data, 'kills')
+
+    # Damage
+    avg_damage = _column_mean(player_data, 'damageDealt')
+
+    # Hareket istatistikleri
+    avg_walk_distance = _column_mean(player_data, 'walkDistance')
+    avg_ride_distance = _column_mean(player_data, 'rideDistance')
+    avg_swim_distance = _column_mean(player_data, 'swimDistance')
+
+    # Silah istatistikleri
+    headshot_kills = _column_total(player_data, 'headshotKills')
+    longest_kill = float(player_data['longestKill'].max()) if 'longestKill' in player_data.columns else 0
+    weapons_acquired = _column_mean(player_data, 'weaponsAcquired')
+
+    # K/D oranı
+    deaths = total_matches - (avg_win_place / 100 * total_matches)  # Basitleştirilmiş hesaplama
+    kd_ratio = kills / deaths if deaths > 0 else kills
+
+    return {
+        'total_matches': total_matches,
+        'win_rate': avg_win_place,
+        'kills': kills,
+        'kills_per_match': kills / total_matches if total_matches > 0 else 0,
+        'deaths': deaths,
+        'kd_ratio': kd_ratio,
+        'avg_damage': avg_damage,
+        'avg_walk_distance': avg_walk_distance,
+        'avg_ride_distance': avg_ride_distance,
+        'avg_swim_distance': avg_swim_distance,
+        'headshot_kills': headshot_kills,
+        'headshot_ratio': headshot_kills / kills if kills > 0 else 0,
+        'longest_kill': longest_kill,
+        'weapons_acquired': weapons_acquired
+    }
+
+def determine_playstyle(player_stats):
+    """
+    Oyuncunun istatistiklerine göre oyun tarzını belirler
+    """
+    # Agresiflik puanı hesapla
+    aggression_score = 0
+
+    # Kills ve damage yüksekse agresiflik artar
+    if player_stats['kills_per_match'] > 3:
+        aggression_score += 2
+    elif player_stats['kills_per_match'] > 1:
+        aggression_score += 1
+
+    if player_stats['avg_damage'] > 300:
+        aggression_score += 2
+    elif player_stats['avg_damage'] > 150:
+        aggression_score += 1
+
+    # Headshot oranı yüksekse agresiflik ve beceri artar
+    headshot_ratio = player_stats.get('headshot_ratio', 0)
+    if isinstance(headshot_ratio, (int, float)) and headshot_ratio > 0.3:
+        aggression_score += 1
+
+    # Hareket mesafesi fazlaysa aktif oyuncu
+    if player_stats['avg_walk_distance'] > 2500:
+        aggression_score += 1
+
+    # Playstyle belirleme
+    if aggression_score >= 4:
+        return "Çok Agresif"
+    elif aggression_score >= 2:
+        return "Agresif"
+    elif aggression_score >= 1:
+        return "Dengeli"
+    else:
+        return "Pasif"
+
+def generate_weapon_suggestions(player_stats, playstyle):
+    """
+    Oyuncunun istatistiklerine ve oyun tarzına göre silah önerileri oluşturur.
+    Kurallar agents/suggestion_rules.yaml dosyasındadır.
+    """
+    return get_suggestion_rules()['weapon'].suggestions(player_values(player_stats, playstyle))
+
+def generate_landing_suggestions(playstyle):
+    """
+    Oyuncunun oyun tarzına göre iniş bölgesi önerileri oluşturur.
+    Kurallar agents/suggestion_rules.yaml dosyasındadır.
+    """
+    return get_suggestion_rules()['landing'].suggestions({'playstyle': playstyle})
+
+def build_stats_summary(player_stats, compact=False):
+    """
+    Oyuncu istatistiklerini görev metinlerinde kullanılan kısa bir metne çevirir.
+    compact=True ise token bütçesi için daha kısa bir biçim kullanılır.
+    """
+    team = player_stats.get('team')
+    if compact:
+        summary = f"Maç {player_stats['total_matches']}, Kazanma %{player_stats['win_rate']:.1f}, K/D {player_stats['kd_ratio']:.1f}, Kill {player_stats['kills']}, Hasar {player_stats['avg_damage']:.0f}"
+        if team:
+            summary += f", Takım kill payı %{team['team_kill_share'] * 100:.0f}"
+        return summary
+    summary = f"Toplam maç: {player_stats['total_matches']}, Kazanma oranı: {player_stats['win_rate']:.2f}%, K/D: {player_stats['kd_ratio']:.2f}, Öldürme: {player_stats['kills']}, Hasar: {player_stats['avg_damage']:.2f}"
+    # Veri setindeki oyuncular için maç/takım bağlamı (tools/team_features.py)
+    if team:
+        summary += (f", Takım öldürme payı: {team['team_kill_share'] * 100:.1f}%, "
+                    f"Takım hasar payı: {team['team_damage_share'] * 100:.1f}%, "
+                    f"Maç içi hasar yüzdeliği: {team['match_damage_pct'] * 100:.0f}, "
+                    f"Ort. takım boyutu: {team['group_size']:.1f}")
+    return summary
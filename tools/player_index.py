@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+class PlayerIndex:
+    """
+    Oyuncu ID -> satır aralığı indeksi. Veri bir kez ID'ye göre sıralanır,
+    böylece her oyuncunun satırları ardışık bir dilim olur ve arama tüm
+    tabloyu taramadan yapılır.
+    """
+
+    def __init__(self, df, id_column):
+        self.id_column = id_column
+        ids = df[id_column]
+
+        # Kategorik sütunlarda mevcut kodlar kullanılır, diğerleri bir kez kodlanır
+        if isinstance(ids.dtype, pd.CategoricalDtype):
+            codes = ids.cat.codes.to_numpy()
+            self.labels = ids.cat.categories
+        else:
+            codes, self.labels = pd.factorize(ids)
+
+        # Veri zaten sıralıysa kopyalamadan kullan
+        if len(codes) < 2 or bool(np.all(codes[:-1] <= codes[1:])):
+            self.data = df
+            sorted_codes = codes
+        else:
+            order = np.argsort(codes, kind='stable')
+            self.data = df.take(order)
+            sorted_codes = codes[order]
+
+        # Her kod için [başlangıç, bitiş) satır aralığı; eksik ID'ler (-1) dışarıda kalır
+        all_codes = np.arange(len(self.labels))
+        self.starts = np.searchsorted(sorted_codes, all_codes, side='left')
+        self.stops = np.searchsorted(sorted_codes, all_codes, side='right')
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, player_id):
+        return self.get_slice(player_id) is not None
+
+    def get_slice(self, player_id):
+        """
+        Oyuncunun satır aralığını döndürür, oyuncu yoksa None
+        """
+        try:
+            code = self.labels.get_loc(player_id)
+        except (KeyError, TypeError):
+            return None
+        if not isinstance(code, (int, np.integer)):
+            return None
+        start, stop = int(self.starts[code]), int(self.stops[code])
+        if start == stop:
+            return None
+        return slice(start, stop)
+
+    def lookup(self, player_id):
+        """
+        Oyuncunun satırlarını kopyalamadan (dilim görünümü olarak) döndürür
+        """
+        rows = self.get_slice(player_id)
+        if rows is None:
+            return None
+        return self.data.iloc[rows]
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+# Arama kutusunun bir sayfada gösterdiği en fazla sonuç
+DEFAULT_PAGE_SIZE = 50
+
+# Metin ayracı; ID'lerde bulunmaması gereken karakter
+_SEPARATOR = '\n'
+
+class PlayerSearchIndex:
+    """
+    Oyuncu ID'leri üzerinde önek ve alt dizgi araması. Veri seti başına bir
+    kez oluşturulur. Önek araması sıralı dizide ikili arama ile yapılır;
+    alt dizgi araması tüm ID'leri birleştiren tek bir metinde str.find ile
+    yapılır ve yeterli sonuç bulununca durur. Arama büyük/küçük harfe duyarsızdır.
+    """
+
+    def __init__(self, labels):
+        labels = pd.Index(labels)
+        keys = np.asarray(labels.astype(str).str.lower(), dtype=str)
+        # Kategorik ID'ler zaten sıralı gelir; yalnızca gerekirse sırala
+        if len(keys) > 1 and not bool(np.all(keys[:-1] <= keys[1:])):
+            order = np.argsort(keys, kind='stable')
+            labels, keys = labels[order], keys[order]
+        self.labels = labels
+
+        # ASCII ID'ler (ör. PUBG hex ID'leri) karakter başına 1 bayt ile saklanır
+        try:
+            self.keys = keys.astype(bytes)
+            self._encoding = 'ascii'
+        except UnicodeEncodeError:
+            self.keys = keys
+            self._encoding = None
+
+        # Birleşik metin ve her ID'nin metindeki başlangıç konumu
+        lengths = np.char.str_len(self.keys).astype(np.int64) + 1
+        self.offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]]).astype(np.int64)
+        separator = _SEPARATOR.encode() if self._encoding else _SEPARATOR
+        self.text = separator.join(self.keys.tolist())
+
+    def __len__(self):
+        return len(self.labels)
+
+    def _prefix_range(self, query):
+        """
+        Sorguyla başlayan ID'lerin sıralı dizideki [başlangıç, bitiş) aralığı
+        """
+        upper = query + (b'\xff' if self._encoding else '\U0010ffff')
+        start = int(np.searchsorted(self.keys, query, side='left'))
+        stop = int(np.searchsorted(self.keys, upper, side='left'))
+        return start, stop
+
+    def _substring_positions(self, query, skip, limit):
+        """
+        Sorguyu ortasında içeren (önekle başlamayan) ID'lerin konumlarını
+        sırayla üretir; ilk skip eşleşmeyi atlar, en fazla limit tane döndürür
+        """
+        positions = []
+        last = -1
+        at = self.text.find(query)
+        while at >= 0 and len(positions) < limit:
+            row = int(np.searchsorted(self.offsets, at, side='right')) - 1
+            # Aynı ID içinde birden çok eşleşme ve önek eşleşmeleri bir kez sayılmaz
+            if row != last and at != self.offsets[row]:
+                if skip:
+                    skip -= 1
+                else:
+                    positions.append(row)
+            last = row
+            at = self.text.find(query, at + 1)
+        return positions
+
+    def search(self, query, limit=DEFAULT_PAGE_SIZE, offset=0):
+        """
+        Sorguya uyan ID'lerin offset'ten başlayan en fazla limit tanesini
+        döndürür. Önek eşleşmeleri sıralı olarak önce gelir, ardından ID'nin
+        içinde geçen eşleşmeler gelir. (sonuçlar, devamı var mı) döndürür.
+        """
+        query = str(query or '').strip().lower()
+        if self._encoding:
+            try:
+                query = query.encode(self._encoding)
+            except UnicodeEncodeError:
+                # ASCII olmayan bir sorgu ASCII ID'lerle eşleşemez
+                return [], False
+        start, stop = self._prefix_range(query)
+        prefix_count = stop - start
+
+        rows = list(range(start + offset, min(stop, start + offset + limit + 1)))
+        if query and len(rows) <= limit:
+            skip = max(0, offset - prefix_count)
+            rows += self._substring_positions(query, skip, limit + 1 - len(rows))
+
+        has_more = len(rows) > limit
+        return self.labels[rows[:limit]].tolist(), has_more
@@ -0,0 +1,58 @@
+import os
+import re
+
+from tools.coach_metrics import estimate_tokens
+
+# Görev başına istem token bütçesi (0: sınırsız, sıkıştırma yapılmaz)
+DEFAULT_TOKEN_BUDGET = int(os.getenv('PUBG_COACH_TOKEN_BUDGET', 0))
+
+# CrewAI'nin her görev istemine eklediği sabit şablon (format/araç talimatları) için pay
+PROMPT_OVERHEAD_TOKENS = 250
+
+# Sıkıştırma seviyeleri: tam istem, kısa istatistik özeti, kısa özet + sade ajanlar
+COMPACTION_LEVELS = ('full', 'compact_stats', 'compact_agents')
+
+# Sade ajanlarda geçmiş hikâyesinin en fazla kelime sayısı ve ajan döngüsü sınırı
+COMPACT_BACKSTORY_WORDS = 12
+COMPACT_MAX_ITER = 3
+
+def compact_definition(definition):
+    """
+    Ajan tanımının istemi kısaltılmış bir kopyasını döndürür: geçmiş hikâyesi
+    ilk cümlesine ve en fazla COMPACT_BACKSTORY_WORDS kelimeye indirilir, ayrıntılı
+    çıktı kapatılır ve ajanın düşünme döngüsü sınırlanır
+    """
+    compact = dict(definition)
+    first_sentence = re.split(r'(?<=[.!?])\s', str(definition.get('backstory', '')).strip())[0]
+    backstory = ' '.join(first_sentence.split()[:COMPACT_BACKSTORY_WORDS])
+    if backstory != first_sentence and ',' in backstory:
+        # Kesilen cümle yarım kalmasın diye son virgüle kadar tutulur
+        backstory = backstory.rsplit(',', 1)[0]
+    compact['backstory'] = backstory.rstrip('.,;') + '.'
+    compact['verbose'] = False
+    compact['max_iter'] = COMPACT_MAX_ITER
+    return compact
+
+def estimate_task_prompt(task):
+    """
+    Bir CrewAI görevinin LLM'e gidecek isteminin token sayısını tahmin eder
+    (ajan rolü/hedefi/geçmişi + görev metni + şablon payı)
+    """
+    agent = getattr(task, 'agent', None)
+    parts = [getattr(agent, name, '') or '' for name in ('role', 'goal', 'backstory')]
+    parts += [task.description or '', task.expected_output or '']
+    return estimate_tokens("\n".join(parts)) + PROMPT_OVERHEAD_TOKENS
+
+def fit_to_budget(build, budget=DEFAULT_TOKEN_BUDGET):
+    """
+    build(level) çağrısıyla (ajanlar, görevler) çiftini sırayla daha sıkıştırılmış seviyelerde
+    oluşturur ve en büyük görev istemi bütçeye sığan ilk seviyeyi seçer.
+    Hiçbiri sığmazsa en sıkıştırılmış seviye kullanılır.
+    (seviye, build sonucu, tahmini en büyük istem token'ı) döndürür.
+    """
+    for level in range(len(COMPACTION_LEVELS)):
+        built = build(level)
+        estimate = max(estimate_task_prompt(task) for task in built[1])
+        if not budget or estimate <= budget:
+            break
+    return level, built, estimate
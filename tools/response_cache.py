@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# Varsayılan önbellek dosyası ve sınırlar (ortam değişkenleriyle değiştirilebilir)
+DEFAULT_CACHE_PATH = os.getenv('PUBG_COACH_CACHE', 'coach_cache.sqlite')
+DEFAULT_TTL_SECONDS = float(os.getenv('PUBG_COACH_CACHE_TTL', 7 * 24 * 3600))
+DEFAULT_MAX_ENTRIES = int(os.getenv('PUBG_COACH_CACHE_MAX_ENTRIES', 5000))
+DEFAULT_MAX_BYTES = int(os.getenv('PUBG_COACH_CACHE_MAX_BYTES', 50 * 1024 * 1024))
+
+def make_cache_key(task_prompts, model, temperature):
+    """
+    Görev metinleri, model adı ve sıcaklıktan içerik adresli anahtar üretir
+    """
+    payload = json.dumps(
+        {'tasks': list(task_prompts), 'model': model, 'temperature': temperature},
+        ensure_ascii=False, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class ResponseCache:
+    """
+    Koç yanıtlarını SQLite'ta saklayan önbellek. Kayıtlar TTL sonunda
+    geçersiz olur; kayıt sayısı veya toplam boyut aşılınca en uzun süredir
+    kullanılmayan kayıtlar silinir (LRU).
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_seconds=DEFAULT_TTL_SECONDS,
+                 max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses(last_access)")
+        self._conn.commit()
+
+    def get(self, key):
+        """
+        Anahtara ait çıktı listesini döndürür, yoksa veya süresi dolduysa None
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key, outputs):
+        """
+        Çıktı listesini kaydeder ve gerekirse eski kayıtları siler
+        """
+        value = json.dumps(list(outputs), ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value.encode('utf-8')), now, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now):
+        """
+        Süresi dolan kayıtları, ardından sınırlar aşılıyorsa LRU kayıtlarını siler
+        """
+        self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        # En eski erişimden başlayarak sınırların altına inene kadar sil
+        to_delete = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_access"):
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            to_delete.append((key,))
+            count -= 1
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", to_delete)
+
+    def stats(self):
+        """
+        İsabet/ıska sayaçlarını ve önbellek boyutunu döndürür
+        """
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {'hits': self.hits, 'misses': self.misses, 'entries': count, 'bytes': total}
+
+    def clear(self):
+        """
+        Tüm kayıtları siler
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_response_cache():
+    """
+    Süreç genelindeki tek ResponseCache örneğini döndürür
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache()
+    return _cache
@@ -0,0 +1,113 @@
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Oyuncu ID sütunu olarak kullanılabilecek sütunlar
+POSSIBLE_ID_COLUMNS = ['Id', 'player_id', 'id', 'player_name', 'name', 'player']
+
+# calculate_player_stats fonksiyonunun kullandığı sütunlar
+STATS_COLUMNS = [
+    'kills', 'damageDealt', 'walkDistance', 'rideDistance', 'swimDistance',
+    'headshotKills', 'longestKill', 'weaponsAcquired', 'winPlacePerc'
+]
+
+# Uygulamanın kullandığı PUBG sütunları için sıkıştırılmış tipler
+PUBG_SCHEMA = {
+    'kills': 'int16',
+    'headshotKills': 'int16',
+    'weaponsAcquired': 'int16',
+    'damageDealt': 'float32',
+    'walkDistance': 'float32',
+    'rideDistance': 'float32',
+    'swimDistance': 'float32',
+    'longestKill': 'float32',
+    'winPlacePerc': 'float32'
+}
+
+# Kategori olarak saklanan metin sütunları (kodlar + kategori tablosu)
+CATEGORY_COLUMNS = POSSIBLE_ID_COLUMNS + ['groupId', 'matchId', 'matchType']
+
+def csv_dtypes(columns):
+    """
+    read_csv'ye doğrudan verilebilecek tipleri döndürür. Tamsayı sütunları
+    eksik değer içerebileceği için okumadan sonra apply_schema ile küçültülür.
+    """
+    dtypes = {}
+    for col in columns:
+        if col in CATEGORY_COLUMNS:
+            dtypes[col] = 'category'
+        elif col in PUBG_SCHEMA and PUBG_SCHEMA[col].startswith('float'):
+            dtypes[col] = PUBG_SCHEMA[col]
+    return dtypes
+
+def _fits(series, dtype):
+    """
+    Sütunun eksik değer içermeden ve taşmadan tamsayı tipine sığıp sığmadığını kontrol eder
+    """
+    if series.isna().any():
+        return False
+    if len(series) == 0:
+        return True
+    info = np.iinfo(dtype)
+    return info.min <= series.min() and series.max() <= info.max
+
+def apply_schema(df):
+    """
+    Şemadaki sütunları sıkıştırılmış tiplere çevirir. Oyuncu ID'leri
+    kategoriye çevrilir; kategori tablosu orijinal metinlere dönüş tablosudur.
+    """
+    for col in df.columns:
+        series = df[col]
+        if col in CATEGORY_COLUMNS:
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                df[col] = series.astype('category')
+        elif col in PUBG_SCHEMA:
+            dtype = PUBG_SCHEMA[col]
+            if series.dtype == dtype:
+                continue
+            if dtype.startswith('int'):
+                if pd.api.types.is_numeric_dtype(series) and _fits(series, dtype):
+                    df[col] = series.astype(dtype)
+            else:
+                df[col] = series.astype(dtype)
+    return df
+
+def memory_report(before, after):
+    """
+    İki tablonun sütun bazında bellek kullanımını (bayt) karşılaştırır
+    """
+    report = pd.DataFrame({
+        'before_dtype': before.dtypes.astype(str),
+        'after_dtype': after.dtypes.reindex(before.columns).astype(str),
+        'before_bytes': before.memory_usage(index=False, deep=True),
+        'after_bytes': after.memory_usage(index=False, deep=True).reindex(before.columns)
+    })
+    report.loc['TOPLAM', ['before_bytes', 'after_bytes']] = [
+        report['before_bytes'].sum(), report['after_bytes'].sum()
+    ]
+    return report
+
+def main(argv=None):
+    """
+    Komut satırı: python -m tools.schema pubg_final.csv
+    Varsayılan read_csv ile şemalı yüklemenin bellek kullanımını karşılaştırır.
+    """
+    parser = argparse.ArgumentParser(prog='python -m tools.schema',
+                                     description="Şema öncesi/sonrası bellek raporu.")
+    parser.add_argument('data', help="Veri seti yolu")
+    args = parser.parse_args(argv)
+
+    before = pd.read_csv(args.data)
+    after = apply_schema(pd.read_csv(args.data, dtype=csv_dtypes(before.columns)))
+    report = memory_report(before, after)
+    with pd.option_context('display.max_rows', None, 'display.width', 120):
+        print(report)
+    total = report.loc['TOPLAM']
+    print(f"\nToplam: {total['before_bytes'] / 1e6:.1f} MB -> {total['after_bytes'] / 1e6:.1f} MB",
+          file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
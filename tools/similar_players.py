@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+# Benzerlikte kullanılan istatistikler; log ölçeğe alınanlar uzun kuyrukludur
+SIMILARITY_FEATURES = [
+    'kills_per_match', 'kd_ratio', 'avg_damage', 'headshot_ratio', 'win_rate',
+    'avg_walk_distance', 'avg_ride_distance', 'weapons_acquired', 'longest_kill'
+]
+LOG_FEATURES = {
+    'kills_per_match', 'kd_ratio', 'avg_damage', 'avg_walk_distance',
+    'avg_ride_distance', 'weapons_acquired', 'longest_kill'
+}
+
+# Komşu tablosunda gösterilen sütunlar
+DISPLAY_COLUMNS = ['kd_ratio', 'kills_per_match', 'avg_damage', 'headshot_ratio', 'win_rate']
+
+def _raw_matrix(stats):
+    """
+    İstatistik tablosundan veya tek oyuncu sözlüğünden log dönüşümlü
+    (henüz standartlaştırılmamış) float32 özellik matrisi üretir
+    """
+    if isinstance(stats, dict):
+        stats = pd.DataFrame([{name: stats.get(name, 0) for name in SIMILARITY_FEATURES}])
+    columns = []
+    for name in SIMILARITY_FEATURES:
+        values = stats[name].to_numpy(dtype=np.float64, na_value=0) if name in stats else np.zeros(len(stats))
+        values = np.nan_to_num(values, nan=0.0, posinf=0.0, neginf=0.0)
+        if name in LOG_FEATURES:
+            values = np.log1p(np.maximum(values, 0))
+        columns.append(values)
+    return np.column_stack(columns).astype(np.float32)
+
+class SimilarPlayerIndex:
+    """
+    Oyuncu istatistik vektörleri üzerinde KD-ağacı ile k en yakın komşu
+    araması. Özellikler log ölçek + z-skoru ile normalleştirilir, böylece
+    her istatistik uzaklığa benzer ağırlıkla katılır.
+    """
+
+    def __init__(self, stats, leaf_size=40):
+        from sklearn.neighbors import KDTree
+
+        raw = _raw_matrix(stats)
+        self.mean = raw.mean(axis=0) if len(raw) else np.zeros(raw.shape[1], dtype=np.float32)
+        std = raw.std(axis=0) if len(raw) else np.ones(raw.shape[1], dtype=np.float32)
+        self.std = np.where(std > 0, std, 1).astype(np.float32)
+        self.player_ids = stats.index
+        self.stats = stats
+        self.tree = KDTree((raw - self.mean) / self.std, leaf_size=leaf_size)
+
+    def __len__(self):
+        return len(self.player_ids)
+
+    def vectors(self, stats):
+        """
+        İstatistikleri indeksle aynı şekilde normalleştirilmiş vektörlere çevirir
+        """
+        return (_raw_matrix(stats) - self.mean) / self.std
+
+    def query(self, player_stats, k=5, exclude=None):
+        """
+        Oyuncuya en yakın k oyuncunun (ID, uzaklık) listesini döndürür.
+        exclude verilirse o ID (ör. oyuncunun kendisi) sonuçlardan çıkarılır.
+        """
+        n = min(len(self), k + (1 if exclude is not None else 0))
+        if n == 0:
+            return []
+        distances, rows = self.tree.query(self.vectors(player_stats), k=n)
+        neighbours = [(self.player_ids[row], float(dist)) for row, dist in zip(rows[0], distances[0])
+                      if exclude is None or self.player_ids[row] != exclude]
+        return neighbours[:k]
+
+    def neighbours_table(self, player_stats, k=5, exclude=None):
+        """
+        En yakın oyuncuları seçili istatistikleriyle birlikte tablo olarak döndürür
+        """
+        neighbours = self.query(player_stats, k, exclude)
+        ids = [player_id for player_id, _ in neighbours]
+        table = self.stats.loc[ids, [c for c in DISPLAY_COLUMNS if c in self.stats]].copy()
+        table.insert(0, 'distance', [dist for _, dist in neighbours])
+        return table
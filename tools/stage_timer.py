@@ -0,0 +1,162 @@
+import cProfile
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from tools.coach_metrics import MetricsSink
+
+# Aşama sürelerinin yazıldığı JSONL dosyası (boş: kapalı)
+DEFAULT_TIMINGS_PATH = os.getenv('PUBG_COACH_TIMINGS', 'stage_timings.jsonl')
+
+# Doluysa her analiz isteği cProfile ile profillenir ve .prof dosyaları bu klasöre yazılır
+PROFILE_DIR = os.getenv('PUBG_COACH_PROFILE', '')
+
+# Kenar çubuğundaki süre dağılımı panelini açar
+DEBUG_PANEL = os.getenv('PUBG_COACH_DEBUG', '0') == '1'
+
+class RequestTrace:
+    """
+    Bir analiz isteğinin aşama sürelerini toplar. Aşamalar farklı iş
+    parçacıklarında (ör. arka plandaki koç işi) çalışabilir; her aralık
+    başlangıç anı, süresi ve iş parçacığı adıyla kaydedilir.
+    """
+
+    def __init__(self, name, profile_dir=PROFILE_DIR):
+        self.id = uuid.uuid4().hex[:12]
+        self.name = name
+        self.profile_dir = profile_dir
+        self.spans = []
+        self._start = time.perf_counter()
+        self._started_at = time.time()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, stage):
+        """
+        with bloğunun süresini stage adıyla kaydeder
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self.spans.append({
+                    'stage': stage,
+                    'start': round(start - self._start, 6),
+                    'seconds': round(end - start, 6),
+                    'thread': threading.current_thread().name
+                })
+
+    @contextmanager
+    def profiled(self):
+        """
+        Profil klasörü ayarlıysa bu iş parçacığındaki çalışmayı cProfile ile
+        kaydeder (<klasör>/<istek id>-<iş parçacığı>.prof)
+        """
+        if not self.profile_dir:
+            yield
+            return
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            os.makedirs(self.profile_dir, exist_ok=True)
+            thread_name = threading.current_thread().name.replace(os.sep, '_')
+            profiler.dump_stats(os.path.join(self.profile_dir, f'{self.id}-{thread_name}.prof'))
+
+    def to_record(self):
+        """
+        İsteğin toplam süresini ve aşamalarını JSON'a yazılabilir sözlük olarak döndürür
+        """
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span['start'])
+        return {
+            'id': self.id,
+            'name': self.name,
+            'ts': self._started_at,
+            'total_seconds': round(time.perf_counter() - self._start, 6),
+            'spans': spans
+        }
+
+_sink = None
+_sink_lock = threading.Lock()
+
+def get_timing_sink():
+    """
+    Süreç genelindeki aşama süresi kayıt dosyasını döndürür
+    """
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                _sink = MetricsSink(DEFAULT_TIMINGS_PATH)
+    return _sink
+
+@contextmanager
+def traced_request(trace, sink=None):
+    """
+    Bir analiz isteğini çevreler: istek profillenir (açıksa), bitişte
+    (hata olsa da) aşama süreleri kayıt dosyasına yazılır
+    """
+    try:
+        with trace.profiled(), bind_trace(trace):
+            yield trace
+    finally:
+        (sink or get_timing_sink()).write(trace.to_record())
+
+_local = threading.local()
+
+@contextmanager
+def bind_trace(trace):
+    """
+    span() çağrılarını bu iş parçacığında verilen isteğe bağlar
+    """
+    previous = getattr(_local, 'trace', None)
+    _local.trace = trace
+    try:
+        yield
+    finally:
+        _local.trace = previous
+
+@contextmanager
+def span(stage):
+    """
+    İş parçacığına bağlı istek varsa with bloğunun süresini kaydeder, yoksa hiçbir şey yapmaz
+    """
+    trace = getattr(_local, 'trace', None)
+    if trace is None:
+        yield
+        return
+    with trace.span(stage):
+        yield
+
+def in_trace(trace, fn):
+    """
+    fn'i, çalıştığı iş parçacığında (ör. arka plan havuzunda) isteğe bağlı
+    ve profillenen bir fonksiyona sarar
+    """
+    def wrapper(*args, **kwargs):
+        with trace.profiled(), bind_trace(trace):
+            return fn(*args, **kwargs)
+    return wrapper
+
+def breakdown(record):
+    """
+    Kayıttaki aşamaları (aşama, iş parçacığı, başlangıç ms, süre ms, pay %) satırları olarak döndürür
+    """
+    total = record['total_seconds'] or 1
+    return [
+        {
+            'Aşama': span['stage'],
+            'İş parçacığı': span['thread'],
+            'Başlangıç (ms)': round(span['start'] * 1000, 1),
+            'Süre (ms)': round(span['seconds'] * 1000, 1),
+            'Pay (%)': round(100 * span['seconds'] / total, 1)
+        }
+        for span in record['spans']
+    ]
@@ -0,0 +1,174 @@
+import argparse
+import resource
+import sys
+
+import numpy as np
+import pandas as pd
+
+from tools.bulk_stats import (
+    MAX_COLUMNS, MEAN_COLUMNS, SUM_COLUMNS,
+    aggregate_player_rows, derive_player_stats, merge_aggregates
+)
+from tools.schema import POSSIBLE_ID_COLUMNS, apply_schema, csv_dtypes
+
+# Varsayılan bellek bütçesi ve bütçenin parça/ara tablolara ayrılan payları
+DEFAULT_MEMORY_BUDGET_MB = 512
+CHUNK_SHARE = 0.25
+PARTIALS_SHARE = 0.25
+
+# Tahmin için okunan örnek satır sayısı
+SAMPLE_ROWS = 10_000
+
+def stream_columns(header, id_column=None):
+    """
+    Oyuncu ID sütununu ve istatistik için okunacak sütunları belirler
+    """
+    if id_column is None:
+        id_column = next((c for c in POSSIBLE_ID_COLUMNS if c in header), None)
+    if id_column is None:
+        raise ValueError("Veri setinde oyuncu ID sütunu bulunamadı.")
+    wanted = set(MEAN_COLUMNS) | set(SUM_COLUMNS) | set(MAX_COLUMNS)
+    return id_column, [id_column] + [c for c in header if c in wanted]
+
+def _downcast(chunk, id_column):
+    """
+    Parçayı bellek içi yol ile aynı şemaya çevirir, ID sütununu kategoriye çevirir
+    """
+    chunk = apply_schema(chunk)
+    if not isinstance(chunk[id_column].dtype, pd.CategoricalDtype):
+        chunk[id_column] = chunk[id_column].astype('category')
+    return chunk
+
+def estimate_chunk_rows(csv_path, usecols, id_column, memory_budget_bytes):
+    """
+    Örnek satırların bellek kullanımından bütçeye sığan parça boyutunu hesaplar
+    """
+    sample = _downcast(pd.read_csv(csv_path, usecols=usecols, nrows=SAMPLE_ROWS,
+                                    dtype=csv_dtypes(usecols)), id_column)
+    if len(sample) == 0:
+        return SAMPLE_ROWS
+    # Ayrıştırma sırasında geçici olarak ~3 kat bellek kullanıldığı varsayılır
+    bytes_per_row = 3 * sample.memory_usage(deep=True).sum() / len(sample)
+    return max(1_000, int(memory_budget_bytes * CHUNK_SHARE / bytes_per_row))
+
+def aggregate_chunks(chunks, id_column, max_partial_bytes=None):
+    """
+    Parçaların oyuncu bazlı toplu değerlerini hesaplar ve ara tabloları
+    bellek sınırını aşmadan birleştirir. (toplu tablo, satır sayısı) döndürür.
+    """
+    partials, partial_bytes, n_rows = [], 0, 0
+    for chunk in chunks:
+        n_rows += len(chunk)
+        partial = aggregate_player_rows(chunk, id_column)
+        partials.append(partial)
+        partial_bytes += partial.memory_usage(deep=True).sum()
+        if len(partials) > 1 and (max_partial_bytes is None or partial_bytes > max_partial_bytes):
+            merged = merge_aggregates(partials)
+            partials, partial_bytes = [merged], merged.memory_usage(deep=True).sum()
+    if not partials:
+        return None, 0
+    return merge_aggregates(partials), n_rows
+
+def _column_summary(chunk, columns):
+    """
+    Parça için sütun bazında sayım, toplam, en küçük ve en büyük değerleri hesaplar
+    """
+    return pd.DataFrame({
+        'count': chunk[columns].count(),
+        'sum': chunk[columns].sum(),
+        'min': chunk[columns].min(),
+        'max': chunk[columns].max()
+    })
+
+class _SummaryCollector:
+    """
+    Parçalar geçerken veri seti özetini biriktirir
+    """
+
+    def __init__(self, id_column):
+        self.id_column = id_column
+        self.head = None
+        self.columns = None
+        self.stats = None
+        self.n_rows = 0
+
+    def wrap(self, chunks):
+        for chunk in chunks:
+            if self.head is None:
+                self.head = chunk.head(3).copy()
+                self.columns = chunk.columns.tolist()
+            numeric = [c for c in chunk.columns
+                       if c != self.id_column and pd.api.types.is_numeric_dtype(chunk[c])]
+            summary = _column_summary(chunk, numeric)
+            if self.stats is None:
+                self.stats = summary
+            else:
+                self.stats = pd.DataFrame({
+                    'count': self.stats['count'] + summary['count'],
+                    'sum': self.stats['sum'] + summary['sum'],
+                    'min': np.fmin(self.stats['min'], summary['min']),
+                    'max': np.fmax(self.stats['max'], summary['max'])
+                })
+            self.n_rows += len(chunk)
+            yield chunk
+
+    def result(self, n_players):
+        stats = self.stats.copy() if self.stats is not None else pd.DataFrame()
+        if len(stats):
+            stats['mean'] = stats['sum'] / stats['count']
+        return {
+            'n_rows': self.n_rows,
+            'n_players': n_players,
+            'columns': self.columns or [],
+            'head': self.head,
+            'column_stats': stats
+        }
+
+def stream_player_aggregates(csv_path, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB, id_column=None):
+    """
+    CSV'yi bellek bütçesine göre boyutlandırılmış parçalar halinde okuyarak
+    oyuncu bazlı toplu değerleri ve veri seti özetini hesaplar
+    """
+    budget = int(memory_budget_mb * 1024 * 1024)
+    header = pd.read_csv(csv_path, nrows=0).columns.tolist()
+    id_column, usecols = stream_columns(header, id_column)
+    chunk_rows = estimate_chunk_rows(csv_path, usecols, id_column, budget)
+
+    reader = pd.read_csv(csv_path, usecols=usecols, chunksize=chunk_rows, dtype=csv_dtypes(usecols))
+    collector = _SummaryCollector(id_column)
+    chunks = collector.wrap(_downcast(chunk, id_column) for chunk in reader)
+    agg, _ = aggregate_chunks(chunks, id_column, max_partial_bytes=budget * PARTIALS_SHARE)
+    if agg is None:
+        agg = aggregate_player_rows(pd.DataFrame(columns=usecols), id_column)
+    return agg, collector.result(len(agg))
+
+def stream_player_stats(csv_path, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB, id_column=None):
+    """
+    calculate_player_stats ile eşdeğer oyuncu istatistik tablosunu ve veri
+    seti özetini, tüm veriyi belleğe almadan hesaplar
+    """
+    agg, summary = stream_player_aggregates(csv_path, memory_budget_mb, id_column)
+    return derive_player_stats(agg), summary
+
+def main(argv=None):
+    """
+    Komut satırı: python -m tools.streaming_agg pubg_final.csv --memory-mb 256 --out stats.csv
+    """
+    parser = argparse.ArgumentParser(prog='python -m tools.streaming_agg',
+                                     description="RAM'e sığmayan veri setleri için parça parça toplama.")
+    parser.add_argument('data', help="Veri seti yolu")
+    parser.add_argument('--memory-mb', type=float, default=DEFAULT_MEMORY_BUDGET_MB, help="Bellek bütçesi (MB)")
+    parser.add_argument('--out', default=None, help="Oyuncu istatistiklerinin yazılacağı CSV")
+    args = parser.parse_args(argv)
+
+    stats, summary = stream_player_stats(args.data, args.memory_mb)
+    if args.out:
+        stats.to_csv(args.out)
+    # ru_maxrss Linux'ta KB cinsindendir
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{summary['n_rows']} satır, {summary['n_players']} oyuncu işlendi; "
+          f"en yüksek bellek {peak_mb:.0f} MB (bütçe {args.memory_mb:.0f} MB)", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,243 @@
+import argparse
+import operator
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import yaml
+
+# Öneri kurallarının bulunduğu YAML dosyası (ajan tanımlarıyla aynı klasörde)
+RULES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          'agents', 'suggestion_rules.yaml')
+
+# Sayısal karşılaştırma operatörleri: (tek değer, dizi) sürümleri
+NUMERIC_OPERATORS = {
+    'gt': (operator.gt, np.greater),
+    'ge': (operator.ge, np.greater_equal),
+    'lt': (operator.lt, np.less),
+    'le': (operator.le, np.less_equal)
+}
+
+class Condition:
+    """
+    Tek bir alan koşulu (ör. headshot_ratio > 0.3). Hem tek oyuncu
+    sözlüğü hem de tüm oyuncu tablosu üzerinde değerlendirilebilir.
+    """
+
+    def __init__(self, field, name, operand):
+        if name not in NUMERIC_OPERATORS and name not in ('eq', 'in'):
+            raise ValueError(f"Bilinmeyen operatör: {field}.{name}")
+        self.field = field
+        self.operator = name
+        self.operand = tuple(operand) if name == 'in' else operand
+        self._scalar_op, self._array_op = NUMERIC_OPERATORS.get(name, (None, None))
+
+    def test(self, values):
+        """
+        Tek oyuncunun değerleri için koşulun sağlanıp sağlanmadığını döndürür
+        """
+        value = values.get(self.field)
+        if self.operator == 'in':
+            return value in self.operand
+        if self.operator == 'eq':
+            return value == self.operand
+        # Eski if zincirleriyle aynı: yalnızca int/float değerler karşılaştırılır
+        if not isinstance(value, (int, float)):
+            return False
+        return self._scalar_op(value, self.operand)
+
+    def mask(self, table):
+        """
+        Tablonun her satırı için koşulun sağlanıp sağlanmadığını bool dizisi olarak döndürür
+        """
+        if self.field not in table.columns:
+            return np.zeros(len(table), dtype=bool)
+        column = table[self.field]
+        if self.operator == 'in':
+            return column.isin(self.operand).to_numpy()
+        if self.operator == 'eq':
+            return (column == self.operand).to_numpy()
+        numbers = pd.to_numeric(column, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        return self._array_op(numbers, self.operand)
+
+class Rule:
+    """
+    Koşulların tümü sağlandığında kullanılan öneri listesi
+    """
+
+    def __init__(self, key, conditions, items):
+        self.key = key
+        self.conditions = conditions
+        self.items = items
+
+    def test(self, values):
+        for condition in self.conditions:
+            if not condition.test(values):
+                return False
+        return True
+
+    def mask(self, table):
+        mask = np.ones(len(table), dtype=bool)
+        for condition in self.conditions:
+            mask &= condition.mask(table)
+        return mask
+
+class RuleSet:
+    """
+    Derlenmiş öneri kuralları (ör. silah önerileri). Her grup için koşulu
+    sağlanan ilk kural seçilir; grup sırası sonuç sözlüğünün sırasıdır.
+    """
+
+    def __init__(self, name, groups):
+        self.name = name
+        self.groups = groups
+
+    def suggestions(self, values):
+        """
+        Tek oyuncunun değerleri (alan -> değer) için öneri sözlüğünü döndürür
+        """
+        suggestions = {}
+        for rules in self.groups.values():
+            for rule in rules:
+                if rule.test(values):
+                    suggestions[rule.key] = list(rule.items)
+                    break
+        return suggestions
+
+    def evaluate(self, table):
+        """
+        Tablonun tüm satırları için her grupta seçilen kuralın sırasını
+        döndürür (sütunlar: grup adları). Grup başına birkaç dizi işlemidir.
+        """
+        choices = {}
+        for group, rules in self.groups.items():
+            # Son kural koşulsuzdur; np.select ilk sağlanan koşulu seçer
+            masks = [rule.mask(table) for rule in rules[:-1]]
+            if not masks:
+                choices[group] = np.zeros(len(table), dtype=np.int8)
+                continue
+            choices[group] = np.select(masks, np.arange(len(masks)), default=len(masks)).astype(np.int8)
+        return pd.DataFrame(choices, index=table.index)
+
+    def keys(self, choices):
+        """
+        evaluate sonucundaki kural sıralarını sonuç anahtarlarına (ör. hot_drop) çevirir
+        """
+        return pd.DataFrame({
+            group: np.array([rule.key for rule in self.groups[group]], dtype=object)[choices[group].to_numpy()]
+            for group in choices.columns
+        }, index=choices.index)
+
+    def materialize(self, choice_row):
+        """
+        evaluate sonucundaki bir satırı ({grup: kural sırası}) öneri sözlüğüne çevirir
+        """
+        suggestions = {}
+        for group, rules in self.groups.items():
+            rule = rules[int(choice_row[group])]
+            suggestions[rule.key] = list(rule.items)
+        return suggestions
+
+def compile_rule_set(name, definition):
+    """
+    YAML'daki bir kural setini ({grup: [kural, ...]}) RuleSet'e derler
+    """
+    groups = {}
+    for group, rules in definition.items():
+        compiled = []
+        for rule in rules:
+            conditions = [Condition(field, op, operand)
+                          for field, spec in (rule.get('when') or {}).items()
+                          for op, operand in spec.items()]
+            compiled.append(Rule(rule.get('key', group), conditions, list(rule['items'])))
+        if not compiled or compiled[-1].conditions:
+            raise ValueError(f"{name}.{group}: son kural koşulsuz olmalı")
+        groups[group] = compiled
+    return RuleSet(name, groups)
+
+def load_suggestion_rules(path=RULES_PATH):
+    """
+    Kural dosyasını okur ve tüm kural setlerini derler ({'weapon': ..., 'landing': ...})
+    """
+    with open(path, encoding='utf-8') as f:
+        definitions = yaml.safe_load(f)
+    return {name: compile_rule_set(name, definition) for name, definition in definitions.items()}
+
+_rules = None
+_rules_lock = threading.Lock()
+
+def get_suggestion_rules():
+    """
+    Süreç genelinde bir kez derlenen kural setlerini döndürür
+    """
+    global _rules
+    if _rules is None:
+        with _rules_lock:
+            if _rules is None:
+                _rules = load_suggestion_rules()
+    return _rules
+
+def player_values(player_stats, playstyle):
+    """
+    Kurallarda kullanılan alanları (istatistikler ve oyun tarzı) tek oyuncu için birleştirir
+    """
+    values = dict(player_stats)
+    values['playstyle'] = playstyle
+    return values
+
+def evaluate_players(stats, playstyles):
+    """
+    Tüm oyuncu tablosu için her kural setinin seçimlerini döndürür ({set adı: DataFrame})
+    """
+    table = stats.assign(playstyle=playstyles)
+    return {name: rule_set.evaluate(table) for name, rule_set in get_suggestion_rules().items()}
+
+def main(argv=None):
+    """
+    Komut satırı: python -m tools.suggestion_rules pubg_final.csv
+    Tüm oyuncular için önerileri toplu değerlendirir, dağılımı yazdırır ve
+    örnek oyuncularda tek oyuncu yoluyla karşılaştırır.
+    """
+    from tools.bulk_stats import calculate_all_player_stats, classify_playstyles
+    from tools.player_core import APP_COLUMNS, find_id_column, load_pubg_data
+
+    parser = argparse.ArgumentParser(prog='python -m tools.suggestion_rules',
+                                     description="Öneri kurallarını tüm oyuncular için toplu değerlendirir.")
+    parser.add_argument('data', nargs='?', default='pubg_final.csv', help="Veri seti yolu")
+    parser.add_argument('--check', type=int, default=1000, help="Tek oyuncu yoluyla karşılaştırılacak oyuncu sayısı")
+    args = parser.parse_args(argv)
+
+    df = load_pubg_data(args.data, columns=APP_COLUMNS)
+    if df is None:
+        print(f"Veri seti yüklenemedi: {args.data}")
+        return 1
+    stats = calculate_all_player_stats(df, find_id_column(df))
+    playstyles = classify_playstyles(stats)
+
+    start = time.perf_counter()
+    results = evaluate_players(stats, playstyles)
+    elapsed = time.perf_counter() - start
+    print(f"{len(stats)} oyuncu, {elapsed * 1000:.1f} ms")
+
+    rules = get_suggestion_rules()
+    for name, choices in results.items():
+        for group, group_rules in rules[name].groups.items():
+            counts = np.bincount(choices[group].to_numpy(), minlength=len(group_rules))
+            print(f"  {name}.{group}: " + ", ".join(
+                f"kural {i + 1} ({rule.key}) {count}" for i, (rule, count) in enumerate(zip(group_rules, counts))))
+
+    # Toplu sonuç, tek oyuncu yoluyla aynı olmalı
+    mismatches = 0
+    sample = stats.index[:args.check]
+    for player_id, row, playstyle in zip(sample, stats.loc[sample].to_dict('records'), playstyles.loc[sample]):
+        values = player_values(row, playstyle)
+        for name, rule_set in rules.items():
+            if rule_set.materialize(results[name].loc[player_id]) != rule_set.suggestions(values):
+                mismatches += 1
+    print(f"Tek oyuncu karşılaştırması: {len(sample)} oyuncu, {mismatches} uyuşmazlık")
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
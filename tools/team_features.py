@@ -0,0 +1,217 @@
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from tools.columnar_cache import dataset_fingerprint, load_columnar
+from tools.schema import POSSIBLE_ID_COLUMNS
+
+# Özellik tablosu biçimi değişirse artırılır, eski tablolar yeniden hesaplanır
+FEATURES_VERSION = 1
+
+# Maç ve takım özellikleri için gereken sütunlar
+MATCH_COLUMNS = ['matchId', 'groupId', 'kills', 'damageDealt']
+
+# Oyuncu başına ortalaması alınan satır özellikleri
+TEAM_FEATURES = [
+    'team_kill_share',    # Takımın öldürmelerindeki pay (0-1)
+    'team_damage_share',  # Takımın hasarındaki pay (0-1)
+    'match_kill_pct',     # Maç içindeki öldürme yüzdeliği (0-1, 1: en iyi)
+    'match_damage_pct',   # Maç içindeki hasar yüzdeliği (0-1, 1: en iyi)
+    'kills_norm',         # Maç doluluğuna göre normalize öldürme
+    'match_size',         # Maçtaki oyuncu sayısı
+    'group_size'          # Takımdaki oyuncu sayısı
+]
+
+def get_features_dir(csv_path):
+    """
+    CSV dosyası için maç/takım özellik klasörünün yolunu döndürür
+    """
+    return os.path.abspath(csv_path) + '.features'
+
+def _codes(series):
+    """
+    Kategori (veya metin) sütununun tamsayı kodlarını ve kategori sayısını döndürür
+    """
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype('category')
+    return series.cat.codes.to_numpy(), len(series.cat.categories)
+
+def rank_within(keys, values):
+    """
+    Her satırın kendi anahtarı (ör. maç) içinde values'a göre büyükten küçüğe
+    sırasını döndürür (1: en büyük). Eşit değerler aynı (en küçük) sırayı alır.
+    """
+    n = len(keys)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    order = np.lexsort((-values, keys))
+    sorted_keys, sorted_values = keys[order], values[order]
+    positions = np.arange(n)
+    new_key = np.ones(n, dtype=bool)
+    new_key[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    new_value = new_key.copy()
+    new_value[1:] |= sorted_values[1:] != sorted_values[:-1]
+    key_start = np.maximum.accumulate(np.where(new_key, positions, 0))
+    value_start = np.maximum.accumulate(np.where(new_value, positions, 0))
+    ranks = np.empty(n, dtype=np.int64)
+    ranks[order] = value_start - key_start + 1
+    return ranks
+
+def _share(part, total):
+    """
+    part / total; takım toplamı sıfırsa pay 0 kabul edilir
+    """
+    return np.divide(part, total, out=np.zeros(len(part)), where=total > 0)
+
+def _percentile_from_rank(ranks, sizes):
+    """
+    Maç içi sırayı 0-1 yüzdeliğe çevirir (1: maçın en iyisi); tek kişilik maçlar 1 sayılır
+    """
+    return np.divide(sizes - ranks, sizes - 1, out=np.ones(len(ranks)), where=sizes > 1)
+
+def compute_row_features(df):
+    """
+    Her satır (oyuncu-maç) için maç ve takım özelliklerini gruplanmış dizi
+    işlemleriyle hesaplar; {özellik: dizi} döndürür. matchId veya groupId'si
+    eksik (NaN) satırlar hesaba katılmaz, bu satırların özellikleri NaN olur.
+    """
+    match_codes, n_matches = _codes(df['matchId'])
+    group_codes, n_groups = _codes(df['groupId'])
+    kills = df['kills'].to_numpy(dtype=np.float64)
+    damage = df['damageDealt'].to_numpy(dtype=np.float64)
+
+    # Eksik kimlikler -1 kodunu alır; bincount negatif kod kabul etmez
+    valid = (match_codes >= 0) & (group_codes >= 0)
+    if not valid.all():
+        match_codes, group_codes = match_codes[valid], group_codes[valid]
+        kills, damage = kills[valid], damage[valid]
+
+    match_size = np.bincount(match_codes, minlength=n_matches)[match_codes]
+    group_size = np.bincount(group_codes, minlength=n_groups)[group_codes]
+    group_kills = np.bincount(group_codes, weights=kills, minlength=n_groups)[group_codes]
+    group_damage = np.bincount(group_codes, weights=damage, minlength=n_groups)[group_codes]
+
+    features = {
+        'team_kill_share': _share(kills, group_kills),
+        'team_damage_share': _share(damage, group_damage),
+        'match_kill_pct': _percentile_from_rank(rank_within(match_codes, kills), match_size),
+        'match_damage_pct': _percentile_from_rank(rank_within(match_codes, damage), match_size),
+        # Kaggle PUBG çalışmalarındaki killsNorm: dolu olmayan maçlardaki öldürmeler büyütülür
+        'kills_norm': kills * ((100 - match_size) / 100 + 1),
+        'match_size': match_size.astype(np.float64),
+        'group_size': group_size.astype(np.float64)
+    }
+    if valid.all():
+        return features
+    expanded = {}
+    for name, values in features.items():
+        expanded[name] = np.full(len(valid), np.nan)
+        expanded[name][valid] = values
+    return expanded
+
+def aggregate_player_features(df, id_column):
+    """
+    Satır özelliklerinin oyuncu başına ortalamalarını döndürür (indeks: oyuncu ID)
+    """
+    player_codes, n_players = _codes(df[id_column])
+    categories = (df[id_column].cat.categories if isinstance(df[id_column].dtype, pd.CategoricalDtype)
+                  else df[id_column].astype('category').cat.categories)
+    # Oyuncu kimliği veya maç/takım kimliği eksik satırlar ortalamaya girmez
+    row_features = compute_row_features(df)
+    valid = (player_codes >= 0) & ~np.isnan(row_features['match_size'])
+    counts = np.bincount(player_codes[valid], minlength=n_players)
+
+    features = {}
+    for name, values in row_features.items():
+        sums = np.bincount(player_codes[valid], weights=values[valid], minlength=n_players)
+        features[name] = np.divide(sums, counts, out=np.full(n_players, np.nan), where=counts > 0)
+    table = pd.DataFrame(features, index=pd.Index(categories, name=id_column))
+    return table.astype(np.float32)[counts > 0]
+
+class TeamFeatures:
+    """
+    Oyuncu başına maç/takım özellik tablosu. Tablo veri seti sürümü başına
+    bir kez hesaplanıp diske yazılır; oyuncu sorguları tek satır okumadır.
+    """
+
+    def __init__(self, table):
+        self.table = table
+
+    def __len__(self):
+        return len(self.table)
+
+    def get(self, player_id):
+        """
+        Oyuncunun özelliklerini sözlük olarak döndürür, oyuncu yoksa None
+        """
+        try:
+            row = self.table.loc[player_id]
+        except (KeyError, TypeError):
+            return None
+        if isinstance(row, pd.DataFrame):
+            return None
+        return {name: round(float(row[name]), 4) for name in self.table.columns}
+
+    @classmethod
+    def build(cls, csv_path):
+        """
+        Sütun önbelleğinden tabloyu hesaplar; gerekli sütunlar yoksa None
+        """
+        df = load_columnar(csv_path, columns=POSSIBLE_ID_COLUMNS + MATCH_COLUMNS)
+        id_column = next((c for c in POSSIBLE_ID_COLUMNS if c in df.columns), None)
+        if id_column is None or any(c not in df.columns for c in MATCH_COLUMNS):
+            return None
+        return cls(aggregate_player_features(df, id_column))
+
+    @classmethod
+    def load(cls, csv_path, features_dir=None):
+        """
+        Kayıtlı tabloyu döndürür; yoksa veya CSV değiştiyse yeniden hesaplayıp kaydeder
+        """
+        features_dir = features_dir or get_features_dir(csv_path)
+        meta_path = os.path.join(features_dir, 'meta.json')
+        table_path = os.path.join(features_dir, 'team_features.pkl')
+        source = dataset_fingerprint(csv_path)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('version') == FEATURES_VERSION and meta.get('source') == source:
+                return cls(pd.read_pickle(table_path))
+        except (OSError, ValueError):
+            pass
+
+        features = cls.build(csv_path)
+        if features is None:
+            return None
+        os.makedirs(features_dir, exist_ok=True)
+        tmp_path = table_path + '.tmp'
+        features.table.to_pickle(tmp_path)
+        os.replace(tmp_path, table_path)
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': FEATURES_VERSION, 'source': source, 'n_players': len(features)}, f)
+        return features
+
+def main(argv=None):
+    """
+    Komut satırı: python -m tools.team_features pubg_final.csv
+    """
+    parser = argparse.ArgumentParser(prog='python -m tools.team_features',
+                                     description="Oyuncu başına maç/takım özelliklerini hesaplar ve kaydeder.")
+    parser.add_argument('csv_path', nargs='?', default='pubg_final.csv')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    features = TeamFeatures.load(args.csv_path)
+    if features is None:
+        print("Veri setinde matchId/groupId sütunları bulunamadı.")
+        return 1
+    print(f"{len(features)} oyuncu, {time.perf_counter() - start:.2f} sn")
+    print(features.table.describe().T.round(3).to_string())
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
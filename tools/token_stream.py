@@ -0,0 +1,84 @@
+import queue
+import threading
+from contextlib import contextmanager
+
+# CrewAI ajanlarının nihai yanıtı başlattığı işaret
+FINAL_ANSWER_MARKER = "Final Answer:"
+
+class TokenStream:
+    """
+    Arka plandaki Crew çalışmasından arayüze akan token kuyruğu. Görevler
+    sırayla çalıştığı için her görev bittiğinde bir sonraki bölüme geçilir.
+    """
+
+    def __init__(self, sections=('analysis', 'coaching')):
+        self.sections = list(sections)
+        self._section = 0
+        self._queue = queue.Queue()
+        self.closed = threading.Event()
+
+    def push_token(self, token):
+        """
+        Aktif bölüme bir token ekler
+        """
+        if self._section < len(self.sections):
+            self._queue.put((self.sections[self._section], token))
+
+    def next_section(self, *_):
+        """
+        Aktif bölümü bitirir (CrewAI görev callback'i olarak da kullanılır)
+        """
+        self._section += 1
+
+    def close(self):
+        """
+        Akışın bittiğini bildirir
+        """
+        self.closed.set()
+        self._queue.put(None)
+
+    def drain(self, timeout=0.05):
+        """
+        Bekleyen (bölüm, token) çiftlerini döndürür; hiç yoksa en fazla
+        timeout saniye bekler
+        """
+        events = []
+        try:
+            event = self._queue.get(timeout=timeout)
+            while True:
+                if event is not None:
+                    events.append(event)
+                event = self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        return events
+
+def visible_text(buffer):
+    """
+    Ajanın düşünce adımlarını gizleyip yalnızca nihai yanıtı döndürür.
+    Nihai yanıt henüz başlamadıysa boş metin döner.
+    """
+    index = buffer.rfind(FINAL_ANSWER_MARKER)
+    if index < 0:
+        return ""
+    return buffer[index + len(FINAL_ANSWER_MARKER):].lstrip()
+
+_local = threading.local()
+
+@contextmanager
+def bind_token_stream(stream):
+    """
+    Bu iş parçacığında üretilen LLM token'larını verilen akışa yönlendirir
+    """
+    previous = getattr(_local, 'stream', None)
+    _local.stream = stream
+    try:
+        yield stream
+    finally:
+        _local.stream = previous
+
+def current_stream():
+    """
+    Bu iş parçacığına bağlı akışı döndürür, yoksa None
+    """
+    return getattr(_local, 'stream', None)
@@ -0,0 +1,173 @@
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Modelin kullandığı maç bazlı özellikler ve hedef sütun
+FEATURES = [
+    'kills', 'damageDealt', 'walkDistance', 'rideDistance', 'swimDistance',
+    'headshotKills', 'longestKill', 'weaponsAcquired'
+]
+TARGET = 'winPlacePerc'
+
+DEFAULT_MODEL_PATH = os.getenv('PUBG_WIN_MODEL', os.path.join('models', 'win_model.joblib'))
+MODEL_VERSION = 1
+
+# Tahminde tek seferde işlenen satır sayısı ve paralel işleme eşiği
+BATCH_SIZE = 100_000
+PARALLEL_MIN_ROWS = 2 * BATCH_SIZE
+
+def _feature_matrix(data, features):
+    """
+    DataFrame veya sözlükten float32 özellik matrisi üretir, eksik sütunlar 0 olur
+    """
+    if isinstance(data, dict):
+        # Tek satırda DataFrame oluşturma maliyetinden kaçın
+        return np.array([[data.get(name) or 0 for name in features]], dtype=np.float32)
+    columns = [
+        data[name].to_numpy(dtype=np.float32, na_value=0) if name in data.columns
+        else np.zeros(len(data), dtype=np.float32)
+        for name in features
+    ]
+    return np.column_stack(columns) if columns else np.empty((len(data), 0), dtype=np.float32)
+
+def train_win_model(df, model_path=DEFAULT_MODEL_PATH, n_estimators=50, max_depth=16,
+                    min_samples_leaf=20, sample_rows=None, test_size=0.1, random_state=42):
+    """
+    Maç satırlarından winPlacePerc tahmin eden Random Forest modelini eğitir,
+    model dosyasını yazar ve doğrulama metriklerini döndürür
+    """
+    import joblib
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.metrics import mean_absolute_error
+    from sklearn.model_selection import train_test_split
+
+    df = df[df[TARGET].notna()]
+    if sample_rows and len(df) > sample_rows:
+        df = df.sample(sample_rows, random_state=random_state)
+    features = [name for name in FEATURES if name in df.columns]
+
+    X = _feature_matrix(df, features)
+    y = df[TARGET].to_numpy(dtype=np.float32)
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=random_state
+    )
+
+    model = RandomForestRegressor(
+        n_estimators=n_estimators,
+        max_depth=max_depth,
+        min_samples_leaf=min_samples_leaf,
+        n_jobs=-1,
+        random_state=random_state
+    )
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    train_seconds = time.perf_counter() - start
+
+    # Tahminde paralelliği batch düzeyinde kendimiz yönetiyoruz
+    model.n_jobs = 1
+    metrics = {
+        'mae': float(mean_absolute_error(y_test, model.predict(X_test))),
+        'train_rows': int(len(X_train)),
+        'train_seconds': train_seconds
+    }
+
+    os.makedirs(os.path.dirname(model_path) or '.', exist_ok=True)
+    joblib.dump({'version': MODEL_VERSION, 'model': model, 'features': features,
+                 'metrics': metrics}, model_path)
+    return metrics
+
+_models = {}
+_models_lock = threading.Lock()
+
+def load_win_model(model_path=DEFAULT_MODEL_PATH):
+    """
+    Model dosyasını süreç başına bir kez yükler; dosya yoksa None döndürür
+    """
+    if model_path not in _models:
+        with _models_lock:
+            if model_path not in _models:
+                if not os.path.exists(model_path):
+                    return None
+                import joblib
+                artifact = joblib.load(model_path)
+                artifact['model'].n_jobs = 1
+                _models[model_path] = artifact
+    return _models[model_path]
+
+def predict_win_probability(data, artifact=None, batch_size=BATCH_SIZE, workers=None):
+    """
+    Maç satırları (DataFrame) veya tek bir satır (sözlük) için 0-1 arası
+    kazanma olasılığı tahmini döndürür. Büyük girdiler sabit boyutlu
+    batch'lere bölünüp iş parçacıklarında tahmin edilir.
+    """
+    artifact = artifact or load_win_model()
+    if artifact is None:
+        return None
+    model = artifact['model']
+    X = _feature_matrix(data, artifact['features'])
+
+    if len(X) < PARALLEL_MIN_ROWS:
+        predictions = np.concatenate(
+            [model.predict(X[i:i + batch_size]) for i in range(0, len(X), batch_size)]
+        ) if len(X) else np.empty(0)
+    else:
+        # Ağaç tahmini GIL'i bıraktığı için batch'ler iş parçacıklarında paralel çalışır
+        batches = [X[i:i + batch_size] for i in range(0, len(X), batch_size)]
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            predictions = np.concatenate(list(pool.map(model.predict, batches)))
+    return np.clip(predictions, 0, 1)
+
+def predict_player_win_rate(player_data, artifact=None):
+    """
+    Oyuncunun maçları için ortalama tahmini kazanma oranını (yüzde) döndürür
+    """
+    predictions = predict_win_probability(player_data, artifact)
+    if predictions is None or len(predictions) == 0:
+        return None
+    return float(predictions.mean() * 100)
+
+def stats_to_features(player_stats):
+    """
+    Manuel girilen maç başı istatistikleri modelin tek satırlık girdisine çevirir
+    """
+    return {
+        'kills': player_stats.get('kills_per_match', 0),
+        'damageDealt': player_stats.get('avg_damage', 0),
+        'walkDistance': player_stats.get('avg_walk_distance', 0),
+        'rideDistance': player_stats.get('avg_ride_distance', 0),
+        'swimDistance': player_stats.get('avg_swim_distance', 0),
+        'headshotKills': player_stats.get('kills_per_match', 0) * player_stats.get('headshot_ratio', 0),
+        'longestKill': player_stats.get('longest_kill', 0),
+        'weaponsAcquired': player_stats.get('weapons_acquired', 0)
+    }
+
+def main(argv=None):
+    """
+    Komut satırından model eğitimi: python -m tools.win_model --data pubg_final.csv
+    """
+    from tools.data_loader import load_pubg_data
+
+    parser = argparse.ArgumentParser(prog='python -m tools.win_model',
+                                     description="Random Forest kazanma modeli eğitir.")
+    parser.add_argument('--data', default='pubg_final.csv', help="Veri seti yolu")
+    parser.add_argument('--out', default=DEFAULT_MODEL_PATH, help="Model dosyası")
+    parser.add_argument('--trees', type=int, default=50, help="Ağaç sayısı")
+    parser.add_argument('--max-depth', type=int, default=16, help="En büyük ağaç derinliği")
+    parser.add_argument('--sample-rows', type=int, default=None, help="Eğitimde kullanılacak en fazla satır")
+    args = parser.parse_args(argv)
+
+    df = load_pubg_data(args.data, columns=FEATURES + [TARGET])
+    if df is None:
+        return 1
+    metrics = train_win_model(df, args.out, n_estimators=args.trees, max_depth=args.max_depth,
+                              sample_rows=args.sample_rows)
+    print(f"Model kaydedildi: {args.out} (MAE {metrics['mae']:.4f}, "
+          f"{metrics['train_rows']} satır, {metrics['train_seconds']:.1f} sn)")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())